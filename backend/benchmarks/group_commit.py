@@ -0,0 +1,110 @@
+"""그룹 커밋 on/off 비교 벤치마크
+
+가족 10명이 같은 순간에 응답하는 상황(POST /meal-calls/{id}/respond 10건 동시)을
+여러 번 반복하고, 초당 커밋(=WAL fsync) 수와 응답 지연 p50/p99를 출력한다.
+ACTIVE 호출 읽기 모델은 응답과 같은 writer 작업에서 갱신되므로 커밋 수에 이미 포함된다.
+
+    cd backend
+    python -m benchmarks.group_commit --bursts 100 --windows 0 2 5 --dir ./data
+"""
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from httpx import ASGITransport, AsyncClient
+
+import src.config as config
+import src.shared.infrastructure.database as database
+from src.main import app
+
+MEMBERS = 10
+
+
+async def _setup_family(client: AsyncClient) -> tuple[str, list[str]]:
+    res = await client.post("/api/v1/families", json={
+        "family_name": "벤치마크 가족", "owner_nickname": "member0", "owner_pin": "1234",
+    })
+    owner_token = res.json()["access_token"]
+    family_id = res.json()["member"]["family_id"]
+    expires_at = (datetime.now(timezone.utc) + timedelta(hours=1)).isoformat()
+    res = await client.post(
+        f"/api/v1/families/{family_id}/invite-links",
+        json={"expires_at": expires_at, "max_uses": MEMBERS},
+        headers={"Authorization": f"Bearer {owner_token}"},
+    )
+    invite = res.json()["token"]
+    tokens = [owner_token]
+    for i in range(1, MEMBERS):
+        res = await client.post(f"/api/v1/invite/{invite}/join", json={
+            "nickname": f"member{i}", "pin": "1234",
+        })
+        tokens.append(res.json()["access_token"])
+    return family_id, tokens
+
+
+async def _timed(client: AsyncClient, url: str, token: str, latencies: list[float]) -> None:
+    start = time.perf_counter()
+    res = await client.post(url, json={"response_type": "COMING_NOW"},
+                            headers={"Authorization": f"Bearer {token}"})
+    latencies.append(time.perf_counter() - start)
+    res.raise_for_status()
+
+
+async def run(window_ms: float, bursts: int, db_dir: str | None = None) -> dict:
+    # fsync 비용은 파일시스템에 따라 크게 다르므로 실제 DB 디스크에서 돌려볼 것 (--dir)
+    with tempfile.TemporaryDirectory(dir=db_dir) as tmp:
+        db_path = str(Path(tmp) / "bench.db")
+        config.DB_PATH = database.DB_PATH = db_path
+        database.DB_GROUP_COMMIT_WINDOW_MS = window_ms
+        await database.init_db()
+        await database.open_db()
+        try:
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+                _, tokens = await _setup_family(client)
+                res = await client.post("/api/v1/meal-calls", json={},
+                                        headers={"Authorization": f"Bearer {tokens[0]}"})
+                url = f"/api/v1/meal-calls/{res.json()['id']}/respond"
+
+                latencies: list[float] = []
+                commits_before = database.db_stats()["writer"]["commits"]
+                start = time.perf_counter()
+                for _ in range(bursts):
+                    await asyncio.gather(*(_timed(client, url, t, latencies) for t in tokens))
+                elapsed = time.perf_counter() - start
+                commits = database.db_stats()["writer"]["commits"] - commits_before
+        finally:
+            await database.close_db()
+
+    latencies.sort()
+    return {
+        "window_ms": window_ms,
+        "requests": len(latencies),
+        "commits": commits,
+        "commits_per_s": commits / elapsed,
+        "req_per_s": len(latencies) / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--bursts", type=int, default=100)
+    parser.add_argument("--windows", type=float, nargs="+", default=[0, 2, 5])
+    parser.add_argument("--dir", default=None, help="DB를 만들 디렉터리 (기본: 시스템 임시 디렉터리)")
+    args = parser.parse_args()
+
+    print(f"{'window':>8} {'reqs':>6} {'commits':>8} {'commit/s':>9} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8}")
+    for window in args.windows:
+        r = await run(window, args.bursts, args.dir)
+        print(f"{r['window_ms']:>6.1f}ms {r['requests']:>6} {r['commits']:>8} "
+              f"{r['commits_per_s']:>9.1f} {r['req_per_s']:>8.1f} "
+              f"{r['p50_ms']:>8.2f} {r['p99_ms']:>8.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,115 @@
+"""MealCall 애그리거트 로딩 벤치마크
+
+지난 밥먹자 1,000건(메뉴 3개, 응답 10개씩)을 가진 가족에서 리포지토리 조회별
+SQL 실행 횟수와 지연을 측정한다.
+
+    cd backend
+    python -m benchmarks.meal_call_loading --calls 1000
+"""
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import src.config as config
+import src.shared.infrastructure.database as database
+from src.meal_call.infrastructure.sqlite_meal_call_repo import SqliteMealCallRepository
+
+MEMBERS = 10
+MENUS = 20
+
+
+async def _populate(calls: int) -> tuple[str, str]:
+    family_id = str(uuid.uuid4())
+    member_ids = [str(uuid.uuid4()) for _ in range(MEMBERS)]
+    menu_ids = [str(uuid.uuid4()) for _ in range(MENUS)]
+    now = datetime.now(timezone.utc)
+    call_ids = [str(uuid.uuid4()) for _ in range(calls)]
+
+    async def _insert(db):
+        await db.execute("INSERT INTO families (id, name, created_at) VALUES (?, ?, ?)",
+                         (family_id, "벤치마크 가족", now.isoformat()))
+        await db.executemany(
+            "INSERT INTO members (id, family_id, nickname, hashed_pin, role, created_at) "
+            "VALUES (?, ?, ?, 'x', 'MEMBER', ?)",
+            [(mid, family_id, f"member{i}", now.isoformat()) for i, mid in enumerate(member_ids)],
+        )
+        await db.executemany(
+            "INSERT INTO menu_items (id, family_id, name, emoji_icon, category, created_at) "
+            "VALUES (?, ?, ?, '🍽️', 'ETC', ?)",
+            [(mid, family_id, f"menu{i}", now.isoformat()) for i, mid in enumerate(menu_ids)],
+        )
+        for n, call_id in enumerate(call_ids):
+            created = (now - timedelta(hours=calls - n)).isoformat()
+            status = "ACTIVE" if n == calls - 1 else "COMPLETED"
+            await db.execute(
+                "INSERT INTO meal_calls (id, family_id, caller_id, message, status, created_at, completed_at) "
+                "VALUES (?, ?, ?, NULL, ?, ?, NULL)",
+                (call_id, family_id, member_ids[n % MEMBERS], status, created),
+            )
+            await db.executemany(
+                "INSERT INTO meal_call_menus (meal_call_id, menu_item_id) VALUES (?, ?)",
+                [(call_id, menu_ids[(n + k) % MENUS]) for k in range(3)],
+            )
+            await db.executemany(
+                "INSERT INTO meal_responses (id, meal_call_id, member_id, response_type, custom_message, responded_at) "
+                "VALUES (?, ?, ?, 'COMING_NOW', NULL, ?)",
+                [(str(uuid.uuid4()), call_id, mid, created) for mid in member_ids],
+            )
+
+    await database.write(_insert)
+    return family_id, call_ids[-1]
+
+
+async def _measure(name: str, fn, queries: list[str], repeat: int) -> None:
+    await fn()  # 워밍업
+    timings = []
+    queries.clear()
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await fn()
+        timings.append(time.perf_counter() - start)
+    count = sum(1 for q in queries if q.lstrip().upper().startswith("SELECT")) // repeat
+    print(f"{name:<32} {count:>8} {statistics.median(timings) * 1000:>10.2f}")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    queries: list[str] = []
+    connect = database._connect
+
+    async def traced_connect():
+        db = await connect()
+        await db.set_trace_callback(queries.append)
+        return db
+
+    with tempfile.TemporaryDirectory() as tmp:
+        config.DB_PATH = database.DB_PATH = str(Path(tmp) / "bench.db")
+        database._connect = traced_connect
+        await database.init_db()
+        await database.open_db()
+        try:
+            family_id, active_id = await _populate(args.calls)
+            repo = SqliteMealCallRepository()
+            print(f"{'query':<32} {'SELECTs':>8} {'p50 ms':>10}")
+            await _measure("find_by_id", lambda: repo.find_by_id(active_id), queries, args.repeat)
+            await _measure("find_active_by_family", lambda: repo.find_active_by_family(family_id),
+                           queries, args.repeat)
+            await _measure("find_by_family(limit=20)", lambda: repo.find_by_family(family_id, 20),
+                           queries, args.repeat)
+            await _measure(f"find_by_family(limit={args.calls})",
+                           lambda: repo.find_by_family(family_id, args.calls), queries, args.repeat)
+        finally:
+            await database.close_db()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
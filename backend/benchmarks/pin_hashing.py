@@ -0,0 +1,102 @@
+"""PIN 해싱 이벤트 루프 정지 벤치마크
+
+가족 구성원 N명이 동시에 로그인(POST /auth/login)하는 동안 1ms 간격으로 깨어나는
+하트비트 태스크의 최대 지연을 잰다. inline은 bcrypt를 이벤트 루프에서 직접
+부르는 이전 방식, pool은 AsyncPinHasher(스레드 풀) 방식이다.
+
+    cd backend
+    python -m benchmarks.pin_hashing --logins 8 --workers 2
+"""
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from httpx import ASGITransport, AsyncClient
+
+import src.config as config
+import src.identity.api.router as identity_router
+import src.shared.infrastructure.database as database
+from src.identity.infrastructure.pin_hasher import AsyncPinHasher, PinHasher
+from src.main import app
+
+
+class _InlinePinHasher:
+    """이벤트 루프에서 bcrypt를 바로 실행 (비교용)"""
+
+    def __init__(self, hasher: PinHasher):
+        self._hasher = hasher
+
+    async def hash(self, pin: str) -> str:
+        return self._hasher.hash(pin)
+
+    async def verify(self, pin: str, hashed: str) -> bool:
+        return self._hasher.verify(pin, hashed)
+
+    def needs_rehash(self, hashed: str) -> bool:
+        return self._hasher.needs_rehash(hashed)
+
+
+async def _heartbeat(stop: asyncio.Event, lags: list[float], interval: float = 0.001) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - start - interval)
+
+
+async def run(mode: str, logins: int, workers: int) -> dict:
+    pool = AsyncPinHasher(PinHasher(), workers=workers, max_queue=logins)
+    identity_router.pin_hasher = pool if mode == "pool" else _InlinePinHasher(PinHasher())
+    with tempfile.TemporaryDirectory() as tmp:
+        config.DB_PATH = database.DB_PATH = str(Path(tmp) / "bench.db")
+        await database.init_db()
+        await database.open_db()
+        try:
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+                res = await client.post("/api/v1/families", json={
+                    "family_name": "벤치마크 가족", "owner_nickname": "아빠", "owner_pin": "1234",
+                })
+                family_id = res.json()["member"]["family_id"]
+                body = {"family_id": family_id, "nickname": "아빠", "pin": "1234"}
+
+                stop, lags = asyncio.Event(), []
+                beat = asyncio.create_task(_heartbeat(stop, lags))
+                start = time.perf_counter()
+                responses = await asyncio.gather(
+                    *(client.post("/api/v1/auth/login", json=body) for _ in range(logins))
+                )
+                elapsed = time.perf_counter() - start
+                stop.set()
+                await beat
+        finally:
+            await database.close_db()
+            pool.shutdown()
+
+    assert all(r.status_code == 200 for r in responses), [r.status_code for r in responses]
+    return {
+        "mode": mode,
+        "logins": logins,
+        "elapsed_ms": elapsed * 1000,
+        "beats": len(lags),
+        "lag_p50_ms": statistics.median(lags) * 1000 if lags else 0.0,
+        "lag_max_ms": max(lags, default=elapsed) * 1000,
+    }
+
+
+async def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--logins", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=2)
+    args = parser.parse_args(argv)
+
+    print(f"{'mode':>7} {'logins':>7} {'total ms':>9} {'beats':>6} {'lag p50':>8} {'lag max':>8}")
+    for mode in ("inline", "pool"):
+        r = await run(mode, args.logins, args.workers)
+        print(f"{r['mode']:>7} {r['logins']:>7} {r['elapsed_ms']:>9.1f} {r['beats']:>6} "
+              f"{r['lag_p50_ms']:>8.2f} {r['lag_max_ms']:>8.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
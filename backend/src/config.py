@@ -8,12 +8,48 @@ BASE_DIR = Path(__file__).parent.parent
 
 # DB
 DB_PATH = os.getenv("DB_PATH", str(BASE_DIR / "data" / "family_app.db"))
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "4"))
+DB_POOL_ACQUIRE_TIMEOUT = float(os.getenv("DB_POOL_ACQUIRE_TIMEOUT", "5"))
+DB_POOL_HEALTH_CHECK_INTERVAL = float(os.getenv("DB_POOL_HEALTH_CHECK_INTERVAL", "30"))
+DB_BUSY_TIMEOUT_MS = int(os.getenv("DB_BUSY_TIMEOUT_MS", "5000"))
+# 그룹 커밋: 0이면 끔, 양수면 해당 시간(ms) 동안 도착한 쓰기를 한 트랜잭션으로 묶음
+DB_GROUP_COMMIT_WINDOW_MS = float(os.getenv("DB_GROUP_COMMIT_WINDOW_MS", "0"))
+DB_GROUP_COMMIT_MAX_BATCH = int(os.getenv("DB_GROUP_COMMIT_MAX_BATCH", "64"))
+
+# Cache (프로세스 내 조회 캐시)
+MEAL_CALL_CACHE_SIZE = int(os.getenv("MEAL_CALL_CACHE_SIZE", "1024"))
+MEAL_CALL_CACHE_TTL_SECONDS = float(os.getenv("MEAL_CALL_CACHE_TTL_SECONDS", "60"))
+FAMILY_DIRECTORY_CACHE_SIZE = int(os.getenv("FAMILY_DIRECTORY_CACHE_SIZE", "1024"))
+FAMILY_DIRECTORY_CACHE_TTL_SECONDS = float(os.getenv("FAMILY_DIRECTORY_CACHE_TTL_SECONDS", "300"))
+MENU_CATALOG_CACHE_SIZE = int(os.getenv("MENU_CATALOG_CACHE_SIZE", "1024"))
+MENU_CATALOG_CACHE_TTL_SECONDS = float(os.getenv("MENU_CATALOG_CACHE_TTL_SECONDS", "3600"))
+
+# Server-Sent Events (GET /families/{id}/events)
+SSE_HEARTBEAT_SECONDS = float(os.getenv("SSE_HEARTBEAT_SECONDS", "15"))
+SSE_REPLAY_BUFFER_SIZE = int(os.getenv("SSE_REPLAY_BUFFER_SIZE", "100"))
+SSE_CLIENT_QUEUE_SIZE = int(os.getenv("SSE_CLIENT_QUEUE_SIZE", "64"))
+
+# PIN 해싱 (bcrypt는 이벤트 루프 밖 스레드 풀에서)
+PIN_HASH_WORKERS = int(os.getenv("PIN_HASH_WORKERS", "2"))
+PIN_HASH_MAX_QUEUE = int(os.getenv("PIN_HASH_MAX_QUEUE", "16"))
+PIN_HASH_SCHEME = os.getenv("PIN_HASH_SCHEME", "bcrypt")  # bcrypt | scrypt | argon2 (argon2-cffi 설치 시)
+# 시작 시 해시 한 번이 이 시간(ms) 안에 끝나는 cost로 보정 (방식별 최솟값까지 내려갈 수 있음).
+# 0(기본)이면 보정하지 않는다. PIN_HASH_COST를 지정하면 그 값으로 고정된다
+PIN_HASH_TARGET_MS = float(os.getenv("PIN_HASH_TARGET_MS", "0"))
+PIN_HASH_COST = int(os.getenv("PIN_HASH_COST")) if os.getenv("PIN_HASH_COST") else None
 
 # JWT
+# 검증된 access token 캐시 - 항목은 토큰 만료와 아래 시간 중 먼저 오는 때에 만료
+AUTH_TOKEN_CACHE_SIZE = int(os.getenv("AUTH_TOKEN_CACHE_SIZE", "4096"))
+AUTH_TOKEN_CACHE_TTL_SECONDS = float(os.getenv("AUTH_TOKEN_CACHE_TTL_SECONDS", "600"))
 JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", "dev-secret-change-in-production-32b!")
 JWT_ALGORITHM = "HS256"
 JWT_ACCESS_TOKEN_EXPIRE_HOURS = int(os.getenv("JWT_ACCESS_TOKEN_EXPIRE_HOURS", "24"))
 JWT_REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("JWT_REFRESH_TOKEN_EXPIRE_DAYS", "90"))
+# 만료된 폐기 토큰(jti)을 메모리/DB에서 지우는 주기
+TOKEN_REVOCATION_COMPACT_INTERVAL_SECONDS = float(
+    os.getenv("TOKEN_REVOCATION_COMPACT_INTERVAL_SECONDS", "3600")
+)
 
 # App
 APP_ENV = os.getenv("APP_ENV", "development")
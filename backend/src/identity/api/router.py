@@ -1,23 +1,27 @@
 from datetime import datetime, timezone, timedelta
 from fastapi import APIRouter, Depends
+from fastapi.security import HTTPAuthorizationCredentials
 
 from src.identity.api.schemas import (
     CreateFamilyRequest, JoinFamilyRequest, CreateInviteLinkRequest,
-    LoginRequest, RefreshTokenRequest,
+    LoginRequest, RefreshTokenRequest, LogoutRequest,
     FamilyResponse, MemberResponse, InviteLinkResponse, AuthResponse,
 )
 from src.identity.application.commands import (
     CreateFamilyCommand, JoinFamilyCommand,
-    CreateInviteLinkCommand, LoginCommand, RefreshTokenCommand,
+    CreateInviteLinkCommand, LoginCommand, RefreshTokenCommand, LogoutCommand,
 )
 from src.identity.application.command_handlers import (
     CreateFamilyHandler, JoinFamilyHandler, CreateInviteLinkHandler,
     LoginHandler, GetFamilyHandler, ValidateInviteLinkHandler, RefreshTokenHandler,
+    LogoutHandler,
 )
 from src.identity.infrastructure.sqlite_family_repo import SqliteFamilyRepository
-from src.identity.infrastructure.pin_hasher import PinHasher
+from src.identity.infrastructure.pin_hasher import AsyncPinHasher, pin_hasher
 from src.identity.infrastructure.jwt_service import JwtService
-from src.shared.api.dependencies import get_current_user, CurrentUser
+from src.shared.api.dependencies import (
+    get_current_user, CurrentUser, security, verified_tokens,
+)
 
 router = APIRouter(tags=["identity"])
 
@@ -26,8 +30,8 @@ router = APIRouter(tags=["identity"])
 def _repo() -> SqliteFamilyRepository:
     return SqliteFamilyRepository()
 
-def _pin() -> PinHasher:
-    return PinHasher()
+def _pin() -> AsyncPinHasher:
+    return pin_hasher
 
 def _jwt() -> JwtService:
     return JwtService()
@@ -139,6 +143,23 @@ async def refresh_token(body: RefreshTokenRequest):
     return _auth_response(result)
 
 
+@router.post("/auth/logout", status_code=204)
+async def logout(
+    body: LogoutRequest | None = None,
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    current_user: CurrentUser = Depends(get_current_user),
+):
+    """이 access token과 (보냈다면) refresh token을 만료 시점까지 폐기"""
+    handler = LogoutHandler(_jwt())
+    await handler.handle(LogoutCommand(
+        member_id=current_user.member_id,
+        access_token_id=current_user.token_id,
+        access_expires_at=current_user.token_expires_at,
+        refresh_token=body.refresh_token if body else None,
+    ))
+    verified_tokens.invalidate(credentials.credentials)
+
+
 # --- 헬퍼 ---
 
 def _member_response(m) -> MemberResponse:
@@ -51,6 +51,10 @@ class RefreshTokenRequest(BaseModel):
     refresh_token: str
 
 
+class LogoutRequest(BaseModel):
+    refresh_token: str | None = None
+
+
 # --- Response ---
 
 class MemberResponse(BaseModel):
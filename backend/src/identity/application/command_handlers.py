@@ -1,16 +1,21 @@
 from src.identity.application.commands import (
     CreateFamilyCommand, JoinFamilyCommand,
-    CreateInviteLinkCommand, LoginCommand, RefreshTokenCommand,
+    CreateInviteLinkCommand, LoginCommand, RefreshTokenCommand, LogoutCommand,
 )
 from src.identity.application.dto import (
     FamilyDto, MemberDto, InviteLinkDto, AuthTokenDto,
 )
 from src.identity.domain.family import Family
 from src.identity.domain.repository import FamilyRepository
-from src.identity.infrastructure.pin_hasher import PinHasher
+from src.identity.infrastructure.pin_hasher import AsyncPinHasher
 from src.identity.infrastructure.jwt_service import JwtService
-from src.shared.api.error_handlers import NotFoundError, ConflictError, DomainError
-from src.shared.infrastructure.event_bus import event_bus
+from src.shared.api.error_handlers import (
+    NotFoundError, ConflictError, ConcurrencyError, DomainError, OverloadedError,
+)
+from src.shared.infrastructure.unit_of_work import UnitOfWork
+
+# 낙관적 잠금 충돌 시 다시 읽고 재시도하는 최대 횟수
+_MAX_ATTEMPTS = 3
 
 
 def _member_dto(m) -> MemberDto:
@@ -27,19 +32,19 @@ def _family_dto(f: Family) -> FamilyDto:
 
 
 class CreateFamilyHandler:
-    def __init__(self, repo: FamilyRepository, pin_hasher: PinHasher, jwt_service: JwtService):
+    def __init__(self, repo: FamilyRepository, pin_hasher: AsyncPinHasher, jwt_service: JwtService):
         self._repo = repo
         self._pin_hasher = pin_hasher
         self._jwt = jwt_service
 
     async def handle(self, cmd: CreateFamilyCommand) -> AuthTokenDto:
-        hashed_pin = self._pin_hasher.hash(cmd.owner_pin)
+        hashed_pin = await self._pin_hasher.hash(cmd.owner_pin)
         family = Family.create(cmd.family_name, cmd.owner_nickname, hashed_pin)
-        await self._repo.save(family)
+        async with UnitOfWork() as uow:
+            await self._repo.save(family)
+            uow.collect(family)
 
         owner = family.members[0]
-        events = family.collect_events()
-        await event_bus.publish_all(events)
 
         tokens = self._jwt.create_tokens(owner)
         return AuthTokenDto(
@@ -50,33 +55,45 @@ class CreateFamilyHandler:
 
 
 class JoinFamilyHandler:
-    def __init__(self, repo: FamilyRepository, pin_hasher: PinHasher, jwt_service: JwtService):
+    def __init__(self, repo: FamilyRepository, pin_hasher: AsyncPinHasher, jwt_service: JwtService):
         self._repo = repo
         self._pin_hasher = pin_hasher
         self._jwt = jwt_service
 
     async def handle(self, cmd: JoinFamilyCommand) -> AuthTokenDto:
-        result = await self._repo.find_invite_link_by_token(cmd.token)
-        if not result:
-            raise NotFoundError("초대 링크", cmd.token)
-
-        family, link = result
-        if not link.is_valid():
-            raise DomainError("초대 링크가 만료되었거나 사용 횟수를 초과했습니다", "INVITE_EXPIRED")
-
-        if any(m.nickname == cmd.nickname for m in family.members):
-            raise ConflictError(f"닉네임 '{cmd.nickname}'은(는) 이미 사용 중입니다")
-
-        hashed_pin = self._pin_hasher.hash(cmd.pin)
-        member = family.add_member(cmd.nickname, hashed_pin)
-        link.use()
-
-        await self._repo.save_member(family.id, member.id, member.nickname,
-                                     member.hashed_pin, member.role.value)
-        await self._repo.save_invite_link(link)
-
-        events = family.collect_events()
-        await event_bus.publish_all(events)
+        hashed_pin = None
+        for attempt in range(1, _MAX_ATTEMPTS + 1):
+            result = await self._repo.find_invite_link_by_token(cmd.token)
+            if not result:
+                raise NotFoundError("초대 링크", cmd.token)
+
+            family, link = result
+            if not link.is_valid():
+                raise DomainError("초대 링크가 만료되었거나 사용 횟수를 초과했습니다", "INVITE_EXPIRED")
+
+            if any(m.nickname == cmd.nickname for m in family.members):
+                raise ConflictError(f"닉네임 '{cmd.nickname}'은(는) 이미 사용 중입니다")
+
+            # 해싱은 비싸므로 재시도 때는 재사용
+            if hashed_pin is None:
+                hashed_pin = await self._pin_hasher.hash(cmd.pin)
+            member = family.add_member(cmd.nickname, hashed_pin)
+            link.use()
+
+            # 가족 version 확인 + 멤버 추가 + 초대 링크 사용 횟수를 한 트랜잭션으로 커밋.
+            # 동시에 같은 링크로 가입하면 한쪽만 통과하고 나머지는 다시 읽어 검증한다.
+            try:
+                async with UnitOfWork() as uow:
+                    await self._repo.bump_version(family)
+                    await self._repo.save_member(family.id, member.id, member.nickname,
+                                                 member.hashed_pin, member.role.value)
+                    await self._repo.save_invite_link(link)
+                    uow.collect(family)
+            except ConcurrencyError:
+                if attempt == _MAX_ATTEMPTS:
+                    raise
+                continue
+            break
 
         tokens = self._jwt.create_tokens(member)
         return AuthTokenDto(
@@ -100,10 +117,9 @@ class CreateInviteLinkHandler:
             expires_at=cmd.expires_at,
             max_uses=cmd.max_uses,
         )
-        await self._repo.save_invite_link(link)
-
-        events = family.collect_events()
-        await event_bus.publish_all(events)
+        async with UnitOfWork() as uow:
+            await self._repo.save_invite_link(link)
+            uow.collect(family)
 
         return InviteLinkDto(
             id=link.id, family_id=link.family_id, token=link.token,
@@ -113,19 +129,20 @@ class CreateInviteLinkHandler:
 
 
 class LoginHandler:
-    def __init__(self, repo: FamilyRepository, pin_hasher: PinHasher, jwt_service: JwtService):
+    def __init__(self, repo: FamilyRepository, pin_hasher: AsyncPinHasher, jwt_service: JwtService):
         self._repo = repo
         self._pin_hasher = pin_hasher
         self._jwt = jwt_service
 
     async def handle(self, cmd: LoginCommand) -> AuthTokenDto:
-        family = await self._repo.find_by_id(cmd.family_id)
-        if not family:
+        member = await self._repo.find_member_by_nickname(cmd.family_id, cmd.nickname)
+        # 실패했을 때만 가족이 있는지 따로 확인한다 (없는 가족은 404)
+        if not member and not await self._repo.find_by_id(cmd.family_id):
             raise NotFoundError("가족", cmd.family_id)
-
-        member = family.get_member_by_nickname(cmd.nickname)
-        if not member or not self._pin_hasher.verify(cmd.pin, member.hashed_pin):
+        if not member or not await self._pin_hasher.verify(cmd.pin, member.hashed_pin):
             raise DomainError("닉네임 또는 PIN이 올바르지 않습니다", "INVALID_CREDENTIALS")
+        if self._pin_hasher.needs_rehash(member.hashed_pin):
+            await self._rehash(member, cmd.pin)
 
         tokens = self._jwt.create_tokens(member)
         return AuthTokenDto(
@@ -134,6 +151,15 @@ class LoginHandler:
             member=_member_dto(member),
         )
 
+    async def _rehash(self, member, pin: str) -> None:
+        """해시 방식/cost가 현재 설정과 다르면 로그인한 김에 다시 저장 (실패해도 로그인은 성공)"""
+        try:
+            new_hash = await self._pin_hasher.hash(pin)
+        except OverloadedError:
+            return  # 혼잡할 때는 다음 로그인으로 미룬다
+        if await self._repo.update_member_pin_hash(member.id, member.hashed_pin, new_hash):
+            member.hashed_pin = new_hash
+
 
 class GetFamilyHandler:
     def __init__(self, repo: FamilyRepository):
@@ -173,12 +199,8 @@ class RefreshTokenHandler:
 
     async def handle(self, cmd: RefreshTokenCommand) -> AuthTokenDto:
         payload = self._jwt.verify_refresh_token(cmd.refresh_token)
-        family = await self._repo.find_by_id(payload["family_id"])
-        if not family:
-            raise DomainError("유효하지 않은 토큰입니다", "INVALID_TOKEN")
-
-        member = family.get_member(payload["sub"])
-        if not member:
+        member = await self._repo.find_member(payload["sub"])
+        if not member or member.family_id != payload["family_id"]:
             raise DomainError("유효하지 않은 토큰입니다", "INVALID_TOKEN")
 
         tokens = self._jwt.create_tokens(member)
@@ -187,3 +209,25 @@ class RefreshTokenHandler:
             refresh_token=tokens["refresh_token"],
             member=_member_dto(member),
         )
+
+
+class LogoutHandler:
+    """요청에 쓴 access token과 (함께 보낸) refresh token을 폐기"""
+
+    def __init__(self, jwt_service: JwtService):
+        self._jwt = jwt_service
+
+    async def handle(self, cmd: LogoutCommand) -> None:
+        if cmd.access_expires_at is not None:
+            await self._jwt.revoke(cmd.access_token_id, cmd.access_expires_at)
+        if not cmd.refresh_token:
+            return
+        try:
+            payload = self._jwt.verify_refresh_token(cmd.refresh_token)
+        except DomainError as e:
+            if e.code in ("TOKEN_EXPIRED", "TOKEN_REVOKED"):
+                return  # 이미 쓸 수 없는 토큰 - 폐기할 것이 없다
+            raise
+        if payload["sub"] != cmd.member_id:
+            raise DomainError("유효하지 않은 토큰입니다", "INVALID_TOKEN")
+        await self._jwt.revoke(payload.get("jti"), payload["exp"])
@@ -34,3 +34,11 @@ class LoginCommand:
 @dataclass
 class RefreshTokenCommand:
     refresh_token: str
+
+
+@dataclass
+class LogoutCommand:
+    member_id: str
+    access_token_id: str | None     # 요청에 쓴 access token의 jti
+    access_expires_at: int | None
+    refresh_token: str | None = None
@@ -0,0 +1,12 @@
+from src.identity.domain.events import FamilyCreated, MemberJoined
+from src.identity.infrastructure.family_directory import FamilyDirectory
+
+
+class FamilyDirectoryInvalidator:
+    """구성원이 바뀌는 이벤트로 가족 디렉터리 캐시 항목을 제거"""
+
+    def __init__(self, directory: FamilyDirectory):
+        self._directory = directory
+
+    async def on_family_changed(self, event: FamilyCreated | MemberJoined) -> None:
+        self._directory.invalidate(event.family_id)
@@ -16,7 +16,8 @@ class Family(AggregateRoot):
     name: str
     created_at: datetime
     members: list[Member] = field(default_factory=list)
-    invite_links: list[InviteLink] = field(default_factory=list)
+    invite_links: list[InviteLink] = field(default_factory=list)  # 조회 시에는 채우지 않는다 (새로 만든 링크만)
+    version: int = 0  # 낙관적 잠금 - 구성원 가입(초대 링크 사용 포함) 시 1씩 증가. 링크 생성은 올리지 않는다
 
     def __post_init__(self):
         super().__init__()
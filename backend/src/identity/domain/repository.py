@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from src.identity.domain.family import Family
 from src.identity.domain.invite_link import InviteLink
+from src.identity.domain.member import Member
 
 
 class FamilyRepository(ABC):
@@ -8,7 +9,14 @@ class FamilyRepository(ABC):
     async def save(self, family: Family) -> None: ...
 
     @abstractmethod
-    async def find_by_id(self, family_id: str) -> Family | None: ...
+    async def find_by_id(self, family_id: str) -> Family | None:
+        """가족 + 구성원 (초대 링크는 계속 쌓이므로 읽지 않는다)"""
+
+    @abstractmethod
+    async def find_member(self, member_id: str) -> Member | None: ...
+
+    @abstractmethod
+    async def find_member_by_nickname(self, family_id: str, nickname: str) -> Member | None: ...
 
     @abstractmethod
     async def find_invite_link_by_token(self, token: str) -> tuple[Family, InviteLink] | None: ...
@@ -19,3 +27,10 @@ class FamilyRepository(ABC):
     @abstractmethod
     async def save_member(self, family_id: str, member_id: str, nickname: str,
                           hashed_pin: str, role: str) -> None: ...
+
+    @abstractmethod
+    async def bump_version(self, family: Family) -> None: ...
+
+    @abstractmethod
+    async def update_member_pin_hash(self, member_id: str, old_hash: str, new_hash: str) -> bool:
+        """저장된 해시가 old_hash일 때만 교체, 교체했으면 True (동시 로그인 중 하나만)"""
@@ -0,0 +1,64 @@
+from dataclasses import dataclass
+from functools import cached_property
+
+from src.config import FAMILY_DIRECTORY_CACHE_SIZE, FAMILY_DIRECTORY_CACHE_TTL_SECONDS
+from src.shared.infrastructure.cache import LruTtlCache
+from src.shared.infrastructure.database import read_connection
+
+
+@dataclass(frozen=True)
+class DirectoryMember:
+    id: str
+    nickname: str
+    role: str
+
+
+@dataclass(frozen=True)
+class FamilyDirectoryEntry:
+    family_id: str
+    members: tuple[DirectoryMember, ...]
+
+    @cached_property
+    def nicknames(self) -> dict[str, str]:
+        return {m.id: m.nickname for m in self.members}
+
+    @cached_property
+    def member_ids(self) -> list[str]:
+        return [m.id for m in self.members]
+
+
+class FamilyDirectory:
+    """가족 → 구성원(id, 닉네임, 역할) 조회용 프로세스 캐시
+
+    처음 조회할 때 members 쿼리 한 번으로 채우고, MemberJoined/FamilyCreated
+    이벤트로 무효화한다 (FamilyDirectoryInvalidator). 닉네임과 역할은 바뀌지
+    않으므로 가입 이벤트만으로 충분하다.
+    """
+
+    def __init__(self, cache: LruTtlCache[str, FamilyDirectoryEntry | None]):
+        self._cache = cache
+
+    async def get(self, family_id: str) -> FamilyDirectoryEntry | None:
+        return await self._cache.get_or_load(family_id, lambda: self._load(family_id))
+
+    def invalidate(self, family_id: str) -> None:
+        self._cache.invalidate(family_id)
+
+    async def _load(self, family_id: str) -> FamilyDirectoryEntry | None:
+        async with read_connection() as db:
+            rows = await db.execute_fetchall(
+                "SELECT id, nickname, role FROM members WHERE family_id = ?", (family_id,)
+            )
+        if not rows:
+            return None  # 구성원이 없는 가족은 없다 (오너가 항상 있음)
+        return FamilyDirectoryEntry(
+            family_id=family_id,
+            members=tuple(DirectoryMember(r["id"], r["nickname"], r["role"]) for r in rows),
+        )
+
+
+family_directory = FamilyDirectory(LruTtlCache(
+    "family_directory",
+    max_size=FAMILY_DIRECTORY_CACHE_SIZE,
+    ttl=FAMILY_DIRECTORY_CACHE_TTL_SECONDS,
+))
@@ -1,3 +1,4 @@
+import uuid
 from datetime import datetime, timezone, timedelta
 import jwt
 from src.config import (
@@ -5,9 +6,13 @@ from src.config import (
     JWT_ACCESS_TOKEN_EXPIRE_HOURS, JWT_REFRESH_TOKEN_EXPIRE_DAYS,
 )
 from src.shared.api.error_handlers import DomainError
+from src.shared.infrastructure.token_revocation import TokenRevocationList, revoked_tokens
 
 
 class JwtService:
+    def __init__(self, revocations: TokenRevocationList = revoked_tokens):
+        self._revocations = revocations
+
     def create_tokens(self, member) -> dict[str, str]:
         now = datetime.now(timezone.utc)
         access_payload = {
@@ -16,6 +21,7 @@ class JwtService:
             "nickname": member.nickname,
             "role": member.role.value if hasattr(member.role, "value") else member.role,
             "type": "access",
+            "jti": uuid.uuid4().hex,
             "iat": now,
             "exp": now + timedelta(hours=JWT_ACCESS_TOKEN_EXPIRE_HOURS),
         }
@@ -23,6 +29,7 @@ class JwtService:
             "sub": member.id,
             "family_id": member.family_id,
             "type": "refresh",
+            "jti": uuid.uuid4().hex,
             "iat": now,
             "exp": now + timedelta(days=JWT_REFRESH_TOKEN_EXPIRE_DAYS),
         }
@@ -36,8 +43,14 @@ class JwtService:
             payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
             if payload.get("type") != "refresh":
                 raise DomainError("유효하지 않은 토큰 타입입니다", "INVALID_TOKEN")
-            return payload
         except jwt.ExpiredSignatureError:
             raise DomainError("리프레시 토큰이 만료되었습니다", "TOKEN_EXPIRED")
         except jwt.InvalidTokenError:
             raise DomainError("유효하지 않은 토큰입니다", "INVALID_TOKEN")
+        if self._revocations.is_revoked(payload.get("jti")):
+            raise DomainError("폐기된 토큰입니다", "TOKEN_REVOKED")
+        return payload
+
+    async def revoke(self, jti: str | None, expires_at: int) -> None:
+        """토큰의 exp까지 jti를 폐기 (로그아웃)"""
+        await self._revocations.revoke(jti, expires_at)
@@ -1,9 +1,364 @@
+import asyncio
+import base64
+import hashlib
+import hmac
+import logging
+import os
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, TypeVar
+
 import bcrypt
 
+from src.config import (
+    PIN_HASH_WORKERS, PIN_HASH_MAX_QUEUE, PIN_HASH_SCHEME, PIN_HASH_COST,
+)
+from src.shared.api.error_handlers import OverloadedError
+
+try:  # argon2-cffi는 선택 의존성
+    import argon2
+except ImportError:  # pragma: no cover - 설치 여부에 따라
+    argon2 = None
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def _timed_ms(fn: Callable[[], object], samples: int = 3) -> float:
+    """fn 실행 시간 (ms, 여러 번 중 최솟값 - 잡음 제거)"""
+    best = float("inf")
+    for _ in range(samples):
+        start = time.perf_counter()
+        fn()
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return best
+
+
+class PinScheme(ABC):
+    """PIN 해시 방식 - 저장된 해시의 접두사로 어떤 방식인지 구분한다
+
+    cost는 방식별 작업량 (bcrypt rounds, scrypt log2 N, argon2 time_cost)이고
+    한 단계 올릴 때 드는 시간이 bcrypt/scrypt는 2배, argon2는 선형으로 늘어난다.
+    """
+
+    name: str
+    min_cost: int
+    max_cost: int
+    _probe_cost: int          # 보정 시 실제로 재는 cost (빠르게 끝나는 값)
+    _doubling = True          # cost 1 증가 → 시간 2배 (False면 cost에 비례)
+
+    def __init__(self, cost: int):
+        self.cost = cost
+        self._probe_ms: float | None = None
+
+    @abstractmethod
+    def identifies(self, hashed: str) -> bool: ...
+
+    @abstractmethod
+    def hash(self, pin: str) -> str: ...
+
+    @abstractmethod
+    def verify(self, pin: str, hashed: str) -> bool: ...
+
+    @abstractmethod
+    def cost_of(self, hashed: str) -> int | None:
+        """저장된 해시의 cost (읽을 수 없으면 None)"""
+
+    @abstractmethod
+    def _probe(self) -> None:
+        """_probe_cost로 해시 한 번 (보정용)"""
+
+    def _estimate_ms(self, cost: int) -> float:
+        if self._probe_ms is None:
+            self._probe_ms = _timed_ms(self._probe)
+        if self._doubling:
+            return self._probe_ms * 2 ** (cost - self._probe_cost)
+        return self._probe_ms * cost / self._probe_cost
+
+    def calibrate(self, target_ms: float) -> int:
+        """target_ms 안에 끝나는 가장 높은 cost로 맞추고 반환 (min_cost 아래로는 내리지 않는다)"""
+        chosen = self.min_cost
+        for cost in range(self.min_cost + 1, self.max_cost + 1):
+            if self._estimate_ms(cost) > target_ms:
+                break
+            chosen = cost
+        self.cost = chosen
+        return chosen
+
+
+class BcryptScheme(PinScheme):
+    name = "bcrypt"
+    min_cost, max_cost = 10, 16
+    _probe_cost = 6
+
+    def identifies(self, hashed: str) -> bool:
+        return hashed.startswith(("$2a$", "$2b$", "$2y$"))
 
-class PinHasher:
     def hash(self, pin: str) -> str:
-        return bcrypt.hashpw(pin.encode(), bcrypt.gensalt()).decode()
+        return bcrypt.hashpw(pin.encode(), bcrypt.gensalt(rounds=self.cost)).decode()
 
     def verify(self, pin: str, hashed: str) -> bool:
         return bcrypt.checkpw(pin.encode(), hashed.encode())
+
+    def cost_of(self, hashed: str) -> int | None:
+        rounds = hashed[4:6]
+        return int(rounds) if rounds.isdigit() else None
+
+    def _probe(self) -> None:
+        bcrypt.hashpw(b"0000", bcrypt.gensalt(rounds=self._probe_cost))
+
+
+class ScryptScheme(PinScheme):
+    """$scrypt$ln=14,r=8,p=1$<salt>$<hash> (base64, 패딩 없음)"""
+
+    name = "scrypt"
+    min_cost, max_cost = 14, 20
+    _PREFIX = "$scrypt$"
+    _probe_cost = 10
+    _R, _P = 8, 1
+
+    def identifies(self, hashed: str) -> bool:
+        return hashed.startswith(self._PREFIX)
+
+    def hash(self, pin: str) -> str:
+        salt = os.urandom(16)
+        digest = self._derive(pin, salt, self.cost, self._R, self._P)
+        return f"{self._PREFIX}ln={self.cost},r={self._R},p={self._P}${_b64(salt)}${_b64(digest)}"
+
+    def verify(self, pin: str, hashed: str) -> bool:
+        try:
+            _, _, params, salt, digest = hashed.split("$")
+            p = dict(kv.split("=") for kv in params.split(","))
+            expected = _unb64(digest)
+            actual = self._derive(pin, _unb64(salt), int(p["ln"]), int(p["r"]), int(p["p"]))
+        except (ValueError, KeyError):
+            return False
+        return hmac.compare_digest(actual, expected)
+
+    def cost_of(self, hashed: str) -> int | None:
+        try:
+            params = hashed.split("$")[2]
+            return int(dict(kv.split("=") for kv in params.split(","))["ln"])
+        except (IndexError, ValueError, KeyError):
+            return None
+
+    def _probe(self) -> None:
+        self._derive("0000", b"0" * 16, self._probe_cost, self._R, self._P)
+
+    @staticmethod
+    def _derive(pin: str, salt: bytes, ln: int, r: int, p: int) -> bytes:
+        n = 1 << ln
+        return hashlib.scrypt(pin.encode(), salt=salt, n=n, r=r, p=p,
+                              maxmem=256 * r * n, dklen=32)
+
+
+class Argon2Scheme(PinScheme):
+    """argon2id (argon2-cffi가 설치된 경우에만)"""
+
+    name = "argon2"
+    min_cost, max_cost = 1, 10
+    _probe_cost = 1
+    _doubling = False
+
+    @property
+    def cost(self) -> int:
+        return self._cost
+
+    @cost.setter
+    def cost(self, value: int) -> None:
+        self._cost = value
+        self._hasher = argon2.PasswordHasher(time_cost=value)
+
+    def identifies(self, hashed: str) -> bool:
+        return hashed.startswith("$argon2")
+
+    def hash(self, pin: str) -> str:
+        return self._hasher.hash(pin)
+
+    def verify(self, pin: str, hashed: str) -> bool:
+        try:
+            return self._hasher.verify(hashed, pin)
+        except (argon2.exceptions.VerificationError, argon2.exceptions.InvalidHashError):
+            return False
+
+    def cost_of(self, hashed: str) -> int | None:
+        try:
+            return argon2.extract_parameters(hashed).time_cost
+        except argon2.exceptions.InvalidHashError:
+            return None
+
+    def _probe(self) -> None:
+        argon2.PasswordHasher(time_cost=self._probe_cost).hash("0000")
+
+
+def _b64(data: bytes) -> str:
+    return base64.b64encode(data).decode().rstrip("=")
+
+
+def _unb64(text: str) -> bytes:
+    return base64.b64decode(text + "=" * (-len(text) % 4))
+
+
+# 방식 이름 → (클래스, 기본 cost)
+_SCHEMES: dict[str, tuple[type[PinScheme], int]] = {
+    "bcrypt": (BcryptScheme, 12),
+    "scrypt": (ScryptScheme, 15),
+}
+if argon2 is not None:
+    _SCHEMES["argon2"] = (Argon2Scheme, 3)
+
+
+# 보정한 cost는 재시작마다 측정 잡음으로 ±1 흔들릴 수 있다 - 이 범위 안의 차이로는 다시 해시하지 않는다
+CALIBRATION_TOLERANCE = 1
+
+
+class PinHasher:
+    """새 해시는 기본 방식으로 만들고, 검증은 저장된 해시의 접두사로 방식을 골라 한다
+
+    기본 방식이나 cost가 바뀌어도 기존 해시는 그대로 검증되고, 로그인에 성공하면
+    needs_rehash로 현재 설정에 맞게 다시 저장할 수 있다 (PIN 재설정 없이) -
+    느린 장비에서 cost를 내리면 기존 해시도 내려간다.
+    """
+
+    def __init__(self, scheme: str = "bcrypt", cost: int | None = None):
+        if scheme not in _SCHEMES:
+            raise ValueError(f"지원하지 않는 PIN 해시 방식: {scheme} (가능: {', '.join(_SCHEMES)})")
+        self._schemes = {name: cls(default) for name, (cls, default) in _SCHEMES.items()}
+        self._default = self._schemes[scheme]
+        self._pinned = cost is not None       # cost를 직접 지정했으면 보정하지 않는다
+        self._tolerance = 0
+        if cost is not None:
+            self._default.cost = cost
+
+    @property
+    def scheme(self) -> PinScheme:
+        return self._default
+
+    def hash(self, pin: str) -> str:
+        return self._default.hash(pin)
+
+    def verify(self, pin: str, hashed: str) -> bool:
+        scheme = self._scheme_of(hashed)
+        return scheme is not None and scheme.verify(pin, hashed)
+
+    def needs_rehash(self, hashed: str) -> bool:
+        """기본 방식이 아니거나 cost가 현재 설정과 다르면 True (올리든 내리든)
+
+        보정한 cost면 허용 범위(±CALIBRATION_TOLERANCE) 밖으로 벗어났을 때만.
+        """
+        if not self._default.identifies(hashed):
+            return True
+        cost = self._default.cost_of(hashed)
+        return cost is None or abs(cost - self._default.cost) > self._tolerance
+
+    def calibrate(self, target_ms: float) -> int:
+        """cost를 지정하지 않았을 때만 target_ms에 맞춘다 (방식별 min_cost까지 내려갈 수 있다)"""
+        if self._pinned:
+            return self._default.cost
+        self._tolerance = CALIBRATION_TOLERANCE
+        return self._default.calibrate(target_ms)
+
+    def _scheme_of(self, hashed: str) -> PinScheme | None:
+        for scheme in self._schemes.values():
+            if scheme.identifies(hashed):
+                return scheme
+        return None
+
+
+@dataclass
+class PinHashStats:
+    scheme: str
+    cost: int
+    workers: int
+    max_queue: int
+    running: int
+    queued: int
+    completed: int
+    rejected: int
+
+
+class AsyncPinHasher:
+    """PinHasher를 제한된 스레드 풀에서 실행 (bcrypt는 GIL을 놓는다)
+
+    bcrypt 한 번이 수백 ms라 이벤트 루프에서 직접 부르면 그동안 다른 요청이
+    모두 멈춘다. 동시 실행은 workers개로 제한하고, 그 뒤로 max_queue개까지만
+    기다리게 한다. 그 이상은 대기열에 넣지 않고 OverloadedError(503)로 거절한다 -
+    로그인 폭주가 다른 요청의 지연으로 번지지 않도록.
+    """
+
+    def __init__(self, hasher: PinHasher, workers: int = 2, max_queue: int = 16):
+        if workers < 1:
+            raise ValueError("PIN 해싱 워커는 1개 이상이어야 합니다")
+        self._hasher = hasher
+        self._workers = workers
+        self._max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pin-hash")
+        self._in_flight = 0
+        self._completed = 0
+        self._rejected = 0
+
+    async def hash(self, pin: str) -> str:
+        return await self._run(self._hasher.hash, pin)
+
+    async def verify(self, pin: str, hashed: str) -> bool:
+        return await self._run(self._hasher.verify, pin, hashed)
+
+    def needs_rehash(self, hashed: str) -> bool:
+        return self._hasher.needs_rehash(hashed)
+
+    async def calibrate(self, target_ms: float) -> int:
+        """시작 시 한 번 - 기본 방식의 cost를 target_ms에 맞춘다 (스레드 풀에서 측정)"""
+        loop = asyncio.get_running_loop()
+        cost = await loop.run_in_executor(self._executor, self._hasher.calibrate, target_ms)
+        logger.info(f"PIN 해시 cost 보정: {self._hasher.scheme.name} cost={cost} (목표 {target_ms}ms)"
+                    f" - 재시작해도 유지하려면 PIN_HASH_COST={cost}로 고정")
+        return cost
+
+    def stats(self) -> PinHashStats:
+        return PinHashStats(
+            scheme=self._hasher.scheme.name,
+            cost=self._hasher.scheme.cost,
+            workers=self._workers,
+            max_queue=self._max_queue,
+            running=min(self._in_flight, self._workers),
+            queued=max(self._in_flight - self._workers, 0),
+            completed=self._completed,
+            rejected=self._rejected,
+        )
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _run(self, fn: Callable[..., T], *args) -> T:
+        if self._in_flight >= self._workers + self._max_queue:
+            self._rejected += 1
+            raise OverloadedError(code="PIN_HASH_BUSY")
+        self._in_flight += 1
+        loop = asyncio.get_running_loop()
+        job = self._executor.submit(fn, *args)
+        # 슬롯은 작업이 실제로 끝날 때 반납한다 - 기다리던 요청이 취소돼도 스레드에서
+        # 실행 중이거나 대기 중인 작업은 계속 한도에 포함된다
+        job.add_done_callback(lambda done: self._call_soon(loop, self._finished, done))
+        return await asyncio.wrap_future(job)
+
+    def _finished(self, job: Future) -> None:
+        self._in_flight -= 1
+        if not job.cancelled() and job.exception() is None:
+            self._completed += 1
+
+    @staticmethod
+    def _call_soon(loop: asyncio.AbstractEventLoop, callback: Callable[..., None], *args) -> None:
+        try:
+            loop.call_soon_threadsafe(callback, *args)
+        except RuntimeError:
+            pass  # 종료 중 - 루프가 이미 닫혔다
+
+
+pin_hasher = AsyncPinHasher(
+    PinHasher(PIN_HASH_SCHEME, PIN_HASH_COST),
+    workers=PIN_HASH_WORKERS,
+    max_queue=PIN_HASH_MAX_QUEUE,
+)
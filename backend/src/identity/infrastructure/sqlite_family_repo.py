@@ -5,7 +5,9 @@ from src.identity.domain.family import Family
 from src.identity.domain.member import Member, MemberRole
 from src.identity.domain.invite_link import InviteLink
 from src.identity.domain.repository import FamilyRepository
-from src.shared.infrastructure.database import get_db
+from src.shared.api.error_handlers import ConcurrencyError
+from src.shared.infrastructure.database import read_connection, write, write_returning
+from src.shared.infrastructure.unit_of_work import after_commit
 
 
 def _parse_dt(s: str) -> datetime:
@@ -15,12 +17,29 @@ def _parse_dt(s: str) -> datetime:
     return dt
 
 
+def _member_from_row(m) -> Member:
+    return Member(
+        id=m["id"], family_id=m["family_id"], nickname=m["nickname"],
+        hashed_pin=m["hashed_pin"], role=MemberRole(m["role"]),
+        created_at=_parse_dt(m["created_at"]),
+    )
+
+
+def _invite_link_from_row(lk) -> InviteLink:
+    return InviteLink(
+        id=lk["id"], family_id=lk["family_id"], token=lk["token"],
+        expires_at=_parse_dt(lk["expires_at"]),
+        max_uses=lk["max_uses"], used_count=lk["used_count"],
+        created_by=lk["created_by"],
+    )
+
+
 class SqliteFamilyRepository(FamilyRepository):
     async def save(self, family: Family) -> None:
-        async with get_db() as db:
+        async def _save(db) -> None:
             await db.execute(
-                "INSERT OR REPLACE INTO families (id, name, created_at) VALUES (?, ?, ?)",
-                (family.id, family.name, family.created_at.isoformat()),
+                "INSERT OR REPLACE INTO families (id, name, created_at, version) VALUES (?, ?, ?, ?)",
+                (family.id, family.name, family.created_at.isoformat(), family.version),
             )
             for member in family.members:
                 await db.execute(
@@ -41,11 +60,40 @@ class SqliteFamilyRepository(FamilyRepository):
                      link.expires_at.isoformat(), link.max_uses,
                      link.used_count, link.created_by),
                 )
-            await db.commit()
+
+        await write(_save)
+
+    async def bump_version(self, family: Family) -> None:
+        """읽은 시점의 version과 같을 때만 1 올린다 - 아니면 ConcurrencyError
+
+        UnitOfWork 안에서 다른 쓰기와 함께 호출하면 충돌 시 전체가 롤백된다.
+        """
+        expected_version = family.version
+
+        async def _bump(db) -> None:
+            cursor = await db.execute(
+                "UPDATE families SET version = version + 1 WHERE id = ? AND version = ?",
+                (family.id, expected_version),
+            )
+            if cursor.rowcount == 0:
+                raise ConcurrencyError("가족", family.id)
+
+        await write(_bump)
+        after_commit(lambda: setattr(family, "version", expected_version + 1))
+
+    async def update_member_pin_hash(self, member_id: str, old_hash: str, new_hash: str) -> bool:
+        async def _update(db) -> bool:
+            cursor = await db.execute(
+                "UPDATE members SET hashed_pin = ? WHERE id = ? AND hashed_pin = ?",
+                (new_hash, member_id, old_hash),
+            )
+            return cursor.rowcount > 0
+
+        return await write_returning(_update)
 
     async def save_member(self, family_id: str, member_id: str, nickname: str,
                           hashed_pin: str, role: str) -> None:
-        async with get_db() as db:
+        async def _save(db) -> None:
             await db.execute(
                 """INSERT OR REPLACE INTO members
                    (id, family_id, nickname, hashed_pin, role, created_at)
@@ -53,10 +101,11 @@ class SqliteFamilyRepository(FamilyRepository):
                 (member_id, family_id, nickname, hashed_pin, role,
                  datetime.now(timezone.utc).isoformat()),
             )
-            await db.commit()
+
+        await write(_save)
 
     async def save_invite_link(self, link: InviteLink) -> None:
-        async with get_db() as db:
+        async def _save(db) -> None:
             await db.execute(
                 """INSERT OR REPLACE INTO invite_links
                    (id, family_id, token, expires_at, max_uses, used_count, created_by)
@@ -65,63 +114,51 @@ class SqliteFamilyRepository(FamilyRepository):
                  link.expires_at.isoformat(), link.max_uses,
                  link.used_count, link.created_by),
             )
-            await db.commit()
 
-    async def find_by_id(self, family_id: str) -> Family | None:
-        async with get_db() as db:
-            row = await db.execute_fetchall(
-                "SELECT * FROM families WHERE id = ?", (family_id,)
-            )
-            if not row:
-                return None
-            f = row[0]
+        await write(_save)
 
-            members_rows = await db.execute_fetchall(
-                "SELECT * FROM members WHERE family_id = ?", (family_id,)
-            )
-            links_rows = await db.execute_fetchall(
-                "SELECT * FROM invite_links WHERE family_id = ?", (family_id,)
+    async def find_by_id(self, family_id: str) -> Family | None:
+        async with read_connection() as db:
+            rows = await db.execute_fetchall(
+                """SELECT f.name AS family_name, f.created_at AS family_created_at,
+                          f.version AS family_version, m.*
+                   FROM families f LEFT JOIN members m ON m.family_id = f.id
+                   WHERE f.id = ?""",
+                (family_id,),
             )
+        if not rows:
+            return None
 
-        members = [
-            Member(
-                id=m["id"], family_id=m["family_id"], nickname=m["nickname"],
-                hashed_pin=m["hashed_pin"], role=MemberRole(m["role"]),
-                created_at=_parse_dt(m["created_at"]),
-            )
-            for m in members_rows
-        ]
-        links = [
-            InviteLink(
-                id=lk["id"], family_id=lk["family_id"], token=lk["token"],
-                expires_at=_parse_dt(lk["expires_at"]),
-                max_uses=lk["max_uses"], used_count=lk["used_count"],
-                created_by=lk["created_by"],
-            )
-            for lk in links_rows
-        ]
+        f = rows[0]
         family = Family(
-            id=f["id"], name=f["name"],
-            created_at=_parse_dt(f["created_at"]),
-            members=members, invite_links=links,
+            id=family_id, name=f["family_name"],
+            created_at=_parse_dt(f["family_created_at"]),
+            members=[_member_from_row(r) for r in rows if r["id"] is not None],
+            version=f["family_version"],
         )
         family._domain_events.clear()
         return family
 
+    async def find_member(self, member_id: str) -> Member | None:
+        async with read_connection() as db:
+            rows = await db.execute_fetchall("SELECT * FROM members WHERE id = ?", (member_id,))
+        return _member_from_row(rows[0]) if rows else None
+
+    async def find_member_by_nickname(self, family_id: str, nickname: str) -> Member | None:
+        async with read_connection() as db:
+            rows = await db.execute_fetchall(
+                "SELECT * FROM members WHERE family_id = ? AND nickname = ?", (family_id, nickname)
+            )
+        return _member_from_row(rows[0]) if rows else None
+
     async def find_invite_link_by_token(self, token: str) -> tuple[Family, InviteLink] | None:
-        async with get_db() as db:
+        async with read_connection() as db:
             rows = await db.execute_fetchall(
                 "SELECT * FROM invite_links WHERE token = ?", (token,)
             )
             if not rows:
                 return None
-            lk = rows[0]
-            link = InviteLink(
-                id=lk["id"], family_id=lk["family_id"], token=lk["token"],
-                expires_at=_parse_dt(lk["expires_at"]),
-                max_uses=lk["max_uses"], used_count=lk["used_count"],
-                created_by=lk["created_by"],
-            )
+            link = _invite_link_from_row(rows[0])
 
         family = await self.find_by_id(link.family_id)
         if not family:
@@ -1,9 +1,16 @@
+import asyncio
+from dataclasses import asdict
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
-from src.shared.infrastructure.database import init_db
+from src.config import PIN_HASH_TARGET_MS, PIN_HASH_COST, TOKEN_REVOCATION_COMPACT_INTERVAL_SECONDS
+from src.identity.infrastructure.pin_hasher import pin_hasher
+from src.shared.infrastructure.cache import cache_stats
+from src.shared.infrastructure.database import init_db, open_db, close_db, db_stats
 from src.shared.infrastructure.event_bus import event_bus
+from src.shared.infrastructure.token_revocation import revoked_tokens
 from src.shared.api.error_handlers import register_error_handlers
 
 
@@ -20,11 +27,62 @@ def _setup_event_handlers() -> None:
     event_bus.subscribe("ReminderRequested", handler.on_reminder_requested)
 
 
+def _setup_cache_invalidation() -> None:
+    from src.identity.application.event_handlers import FamilyDirectoryInvalidator
+    from src.identity.infrastructure.family_directory import family_directory
+    from src.meal_call.application.event_handlers import (
+        MealCallCacheInvalidator, MenuCacheInvalidator,
+    )
+    from src.meal_call.application.query_cache import (
+        active_meal_call_cache, meal_call_cache, meal_call_changes,
+        menu_list_cache, menu_search_cache, menu_changes,
+    )
+    from src.meal_call.infrastructure.menu_catalog import menu_catalog_cache
+
+    invalidator = MealCallCacheInvalidator(active_meal_call_cache, meal_call_cache, meal_call_changes)
+    for event_type in ("MealCallCreated", "MealResponseReceived",
+                       "MealCallCompleted", "MealCallCancelled"):
+        event_bus.subscribe(event_type, invalidator.on_meal_call_changed)
+    directory_invalidator = FamilyDirectoryInvalidator(family_directory)
+    event_bus.subscribe("FamilyCreated", directory_invalidator.on_family_changed)
+    event_bus.subscribe("MemberJoined", directory_invalidator.on_family_changed)
+    menu_invalidator = MenuCacheInvalidator(
+        menu_catalog_cache, menu_list_cache, menu_search_cache, menu_changes,
+    )
+    event_bus.subscribe("MenuItemCreated", menu_invalidator.on_menu_item_created)
+
+
+def _setup_event_stream() -> None:
+    from src.notification.application.event_handlers import FamilyEventStreamHandler
+    from src.notification.infrastructure.event_stream import family_event_broker
+
+    handler = FamilyEventStreamHandler(family_event_broker)
+    for event_type in ("MealCallCreated", "MealResponseReceived", "ReminderRequested",
+                       "MealCallCompleted", "MealCallCancelled"):
+        event_bus.subscribe(event_type, handler.on_event)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await init_db()
+    await open_db()
+    _setup_cache_invalidation()
+    _setup_event_stream()
     _setup_event_handlers()
+    # 읽기 모델은 호출 쓰기와 함께 갱신된다 - 시작 시에는 전체를 한 번 다시 만든다
+    from src.meal_call.api.router import active_meal_call_projector
+    await active_meal_call_projector.rebuild()
+    await revoked_tokens.load()
+    if PIN_HASH_TARGET_MS > 0 and PIN_HASH_COST is None:
+        await pin_hasher.calibrate(PIN_HASH_TARGET_MS)
+    compaction = asyncio.create_task(
+        revoked_tokens.run_compaction(TOKEN_REVOCATION_COMPACT_INTERVAL_SECONDS),
+        name="token-revocation-compaction",
+    )
     yield
+    compaction.cancel()
+    await close_db()
+    pin_hasher.shutdown()
 
 
 app = FastAPI(
@@ -54,4 +112,13 @@ app.include_router(notification_router, prefix="/api/v1")
 
 @app.get("/health")
 async def health():
-    return {"status": "ok", "app": "밥먹자"}
+    from src.meal_call.application.query_cache import meal_call_changes
+    from src.notification.infrastructure.event_stream import family_event_broker
+    return {
+        "status": "ok", "app": "밥먹자",
+        "db": db_stats(), "cache": cache_stats(),
+        "long_poll": {"waiting": meal_call_changes.waiting()},
+        "sse": asdict(family_event_broker.stats()),
+        "pin_hash": asdict(pin_hasher.stats()),
+        "token_revocation": asdict(revoked_tokens.stats()),
+    }
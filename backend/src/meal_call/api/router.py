@@ -1,8 +1,10 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request, Response
+from pydantic import TypeAdapter
 
 from src.meal_call.api.schemas import (
     CreateMenuItemRequest, CreateMealCallRequest, RespondMealCallRequest,
-    MenuItemResponse, MealCallResponse, ReminderResponse,
+    MenuItemResponse, MealCallResponse, MealCallResponsesResponse, MealResponseResponse,
+    ReminderResponse, SearchHitResponse,
 )
 from src.meal_call.application.commands import (
     CreateMealCallCommand, RespondMealCallCommand,
@@ -12,24 +14,49 @@ from src.meal_call.application.command_handlers import (
     CreateMealCallHandler, RespondMealCallHandler,
     RemindMealCallHandler, CompleteMealCallHandler,
     GetActiveMealCallHandler, GetMealCallHandler,
-    CreateMenuItemHandler, ListMenuItemsHandler,
+    CreateMenuItemHandler, ListMenuItemsHandler, SearchMenusHandler, SearchHandler,
+)
+from src.meal_call.application.dto import MealCallDto, MealResponseDto, MenuItemDto
+from src.meal_call.application.projections import ActiveMealCallProjector
+from src.meal_call.application.query_cache import (
+    active_meal_call_cache, meal_call_cache, meal_call_changes,
+    menu_list_cache, menu_search_cache, menu_changes,
 )
 from src.meal_call.infrastructure.sqlite_meal_call_repo import (
-    SqliteMealCallRepository, SqliteMenuItemRepository,
+    SqliteMealCallRepository, SqliteMenuItemRepository, SqliteActiveMealCallViewRepository,
+    SqliteSearchRepository,
 )
-from src.identity.infrastructure.sqlite_family_repo import SqliteFamilyRepository
+from src.meal_call.infrastructure.family_member_directory import CachedFamilyMemberDirectory
+from src.meal_call.infrastructure.menu_catalog import CachedMenuItemRepository, menu_catalog_cache
 from src.shared.api.dependencies import get_current_user, CurrentUser
+from src.shared.infrastructure.change_tracker import BOOT_ID
+from src.shared.api.http_cache import make_etag, is_not_modified, not_modified_response, set_etag
 
 router = APIRouter(tags=["meal-call"])
 
+# 롱폴링 최대 대기 시간 (초) - 프록시 idle timeout보다 짧게
+LONG_POLL_MAX_TIMEOUT = 60
+# 검색 결과 최대 개수
+SEARCH_MAX_LIMIT = 50
+
+
+def _meal_repo(): return SqliteMealCallRepository(active_meal_call_projector)
+def _menu_repo(): return CachedMenuItemRepository(SqliteMenuItemRepository(), menu_catalog_cache)
+def _directory(): return CachedFamilyMemberDirectory()
+def _active_view_repo(): return SqliteActiveMealCallViewRepository()
+def _search_repo(): return SqliteSearchRepository()
 
-def _meal_repo(): return SqliteMealCallRepository()
-def _menu_repo(): return SqliteMenuItemRepository()
-def _family_repo(): return SqliteFamilyRepository()
+
+def _to_response_item(r) -> MealResponseResponse:
+    return MealResponseResponse(
+        id=r.id, member_id=r.member_id, member_nickname=r.member_nickname,
+        response_type=r.response_type, custom_message=r.custom_message,
+        responded_at=r.responded_at,
+    )
 
 
 def _to_response(dto) -> MealCallResponse:
-    from src.meal_call.api.schemas import MealResponseResponse, MenuItemResponse as MIR
+    from src.meal_call.api.schemas import MenuItemResponse as MIR
     return MealCallResponse(
         id=dto.id, family_id=dto.family_id,
         caller_id=dto.caller_id, caller_nickname=dto.caller_nickname,
@@ -38,23 +65,52 @@ def _to_response(dto) -> MealCallResponse:
         menus=[MIR(id=m.id, family_id=m.family_id, name=m.name,
                    emoji_icon=m.emoji_icon, category=m.category)
                for m in dto.menus],
-        responses=[MealResponseResponse(
-            id=r.id, member_id=r.member_id, member_nickname=r.member_nickname,
-            response_type=r.response_type, custom_message=r.custom_message,
-            responded_at=r.responded_at,
-        ) for r in dto.responses],
+        responses=[_to_response_item(r) for r in dto.responses],
         pending_member_ids=dto.pending_member_ids,
     )
 
 
 # --- 메뉴 ---
 
+_menu_list_adapter = TypeAdapter(list[MenuItemResponse])
+
+
+def render_menus(items: list[MenuItemDto]) -> bytes:
+    """GET /menus 응답 본문 - response_model 직렬화와 같은 JSON"""
+    return _menu_list_adapter.dump_json([
+        MenuItemResponse(id=i.id, family_id=i.family_id, name=i.name,
+                         emoji_icon=i.emoji_icon, category=i.category)
+        for i in items
+    ])
+
+
 @router.get("/menus", response_model=list[MenuItemResponse])
-async def list_menus(current_user: CurrentUser = Depends(get_current_user)):
-    handler = ListMenuItemsHandler(_menu_repo())
-    items = await handler.handle(current_user.family_id)
+async def list_menus(
+    request: Request,
+    current_user: CurrentUser = Depends(get_current_user),
+):
+    # ETag는 조회 전에 계산 - 그 사이 변경되면 다음 요청에서 새 본문을 받는다
+    etag = make_etag(menu_changes.version(current_user.family_id), current_user.family_id)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    handler = ListMenuItemsHandler(_menu_repo(), menu_list_cache, render_menus)
+    # 미리 직렬화된 본문을 그대로 반환 (검증/직렬화 생략)
+    response = Response(content=await handler.handle(current_user.family_id),
+                        media_type="application/json")
+    set_etag(response, etag)
+    return response
+
+
+@router.get("/menus/search", response_model=list[MenuItemResponse])
+async def search_menus(
+    q: str = Query(..., min_length=1, max_length=50, description="메뉴 이름, 초성(ㄱㅊ), 입력 중인 글자(김ㅊ)"),
+    limit: int = Query(20, ge=1, le=SEARCH_MAX_LIMIT),
+    current_user: CurrentUser = Depends(get_current_user),
+):
+    handler = SearchMenusHandler(_menu_repo(), menu_search_cache)
+    items = await handler.handle(current_user.family_id, q, limit)
     return [MenuItemResponse(id=i.id, family_id=i.family_id, name=i.name,
-                              emoji_icon=i.emoji_icon, category=i.category)
+                             emoji_icon=i.emoji_icon, category=i.category)
             for i in items]
 
 
@@ -74,60 +130,150 @@ async def create_menu(
                             emoji_icon=item.emoji_icon, category=item.category)
 
 
+# --- 검색 ---
+
+@router.get("/search", response_model=list[SearchHitResponse])
+async def search(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(20, ge=1, le=SEARCH_MAX_LIMIT),
+    current_user: CurrentUser = Depends(get_current_user),
+):
+    """메뉴 이름, 호출 메시지, 응답 메시지 전문 검색 (최신순)"""
+    handler = SearchHandler(_search_repo())
+    hits = await handler.handle(current_user.family_id, q, limit)
+    return [SearchHitResponse(kind=h.kind, id=h.id, meal_call_id=h.meal_call_id,
+                              text=h.text, occurred_at=h.occurred_at)
+            for h in hits]
+
+
 # --- 밥먹자 ---
 
 @router.post("/meal-calls", response_model=MealCallResponse, status_code=201)
 async def create_meal_call(
     body: CreateMealCallRequest,
+    response: Response,
     current_user: CurrentUser = Depends(get_current_user),
 ):
-    # 가족 구성원 목록 조회
-    family = await _family_repo().find_by_id(current_user.family_id)
-    all_member_ids = [m.id for m in family.members] if family else []
-
-    handler = CreateMealCallHandler(_meal_repo(), _menu_repo())
-    dto = await handler.handle(CreateMealCallCommand(
+    handler = CreateMealCallHandler(_meal_repo(), _menu_repo(), _directory())
+    dto, created = await handler.handle(CreateMealCallCommand(
         family_id=current_user.family_id,
         caller_id=current_user.member_id,
         caller_nickname=current_user.nickname,
-        all_member_ids=all_member_ids,
         menu_item_ids=body.menu_item_ids,
         message=body.message,
     ))
+    if not created:
+        response.status_code = 200  # 이미 활성 중인 밥먹자
     return _to_response(dto)
 
 
+def render_meal_call(dto: MealCallDto) -> bytes:
+    """읽기 모델에 저장할 응답 본문 - response_model 직렬화와 같은 JSON"""
+    return _to_response(dto).model_dump_json().encode()
+
+
+def render_meal_response(dto: MealResponseDto) -> bytes:
+    """읽기 모델 본문의 responses 항목 하나 - render_meal_call과 같은 JSON"""
+    return _to_response_item(dto).model_dump_json().encode()
+
+
+# 호출을 바꾸는 쓰기마다 같은 writer 작업에서 읽기 모델을 갱신한다 (시작 시 재생성도)
+active_meal_call_projector = ActiveMealCallProjector(
+    _active_view_repo(), _directory(), render_meal_call, render_meal_response,
+)
+
+
+def _meal_call_etag(family_id: str, *parts: str) -> str:
+    return make_etag(meal_call_changes.version(family_id), family_id, *parts)
+
+
+def _version_token(version: int) -> str:
+    # 재시작 후 카운터가 다시 0부터 시작해도 이전 버전과 겹치지 않도록 BOOT_ID 포함
+    return f"{BOOT_ID}.{version}"
+
+
+def _active_response(payload: bytes | None, family_id: str, version: int) -> Response:
+    # 미리 직렬화된 본문을 그대로 반환 (검증/직렬화 생략)
+    response = Response(content=payload or b"null", media_type="application/json")
+    response.headers["X-Meal-Call-Version"] = _version_token(version)
+    set_etag(response, make_etag(version, family_id))
+    return response
+
+
 @router.get("/meal-calls/active", response_model=MealCallResponse | None)
-async def get_active_meal_call(current_user: CurrentUser = Depends(get_current_user)):
-    handler = GetActiveMealCallHandler(_meal_repo())
-    dto = await handler.handle(current_user.family_id)
-    return _to_response(dto) if dto else None
+async def get_active_meal_call(
+    request: Request,
+    current_user: CurrentUser = Depends(get_current_user),
+):
+    family_id = current_user.family_id
+    version = meal_call_changes.version(family_id)
+    etag = make_etag(version, family_id)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    handler = GetActiveMealCallHandler(_active_view_repo(), active_meal_call_cache)
+    return _active_response(await handler.handle(family_id), family_id, version)
+
+
+@router.get(
+    "/meal-calls/active/wait",
+    response_model=MealCallResponse | None,
+    responses={204: {"description": "timeout 동안 변경 없음"}},
+)
+async def wait_active_meal_call(
+    since: str = Query("", description="마지막으로 받은 X-Meal-Call-Version (처음이면 생략)"),
+    timeout: float = Query(30, ge=0, le=LONG_POLL_MAX_TIMEOUT),
+    current_user: CurrentUser = Depends(get_current_user),
+):
+    """롱폴링 - since 이후 ACTIVE 호출이 바뀌면 즉시, 아니면 timeout 뒤 204
+
+    since가 현재 버전과 다르면(재시작 포함) 기다리지 않고 바로 현재 상태를 준다.
+    기다리는 동안에는 DB 연결을 잡지 않는다.
+    """
+    family_id = current_user.family_id
+    version = meal_call_changes.version(family_id)
+    if since == _version_token(version):
+        version = await meal_call_changes.wait_for_change(family_id, version, timeout)
+        if since == _version_token(version):
+            return Response(status_code=204, headers={"X-Meal-Call-Version": since})
+
+    handler = GetActiveMealCallHandler(_active_view_repo(), active_meal_call_cache)
+    return _active_response(await handler.handle(family_id), family_id, version)
 
 
 @router.get("/meal-calls/{meal_call_id}", response_model=MealCallResponse)
 async def get_meal_call(
     meal_call_id: str,
+    request: Request,
+    response: Response,
     current_user: CurrentUser = Depends(get_current_user),
 ):
-    handler = GetMealCallHandler(_meal_repo())
-    dto = await handler.handle(meal_call_id)
+    etag = _meal_call_etag(current_user.family_id, meal_call_id)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    handler = GetMealCallHandler(_meal_repo(), _directory(), meal_call_cache)
+    dto = await handler.handle(meal_call_id, current_user.family_id)
+    set_etag(response, etag)
     return _to_response(dto)
 
 
-@router.post("/meal-calls/{meal_call_id}/respond", response_model=MealCallResponse)
+@router.post("/meal-calls/{meal_call_id}/respond", response_model=MealCallResponsesResponse)
 async def respond_meal_call(
     meal_call_id: str,
     body: RespondMealCallRequest,
     current_user: CurrentUser = Depends(get_current_user),
 ):
-    handler = RespondMealCallHandler(_meal_repo())
+    handler = RespondMealCallHandler(_meal_repo(), _directory())
     dto = await handler.handle(RespondMealCallCommand(
         meal_call_id=meal_call_id,
+        family_id=current_user.family_id,
         member_id=current_user.member_id,
         response_type=body.response_type,
         custom_message=body.custom_message,
     ))
-    return _to_response(dto)
+    return MealCallResponsesResponse(
+        meal_call_id=dto.meal_call_id,
+        responses=[_to_response_item(r) for r in dto.responses],
+    )
 
 
 @router.post("/meal-calls/{meal_call_id}/remind", response_model=ReminderResponse)
@@ -151,7 +297,7 @@ async def complete_meal_call(
     meal_call_id: str,
     current_user: CurrentUser = Depends(get_current_user),
 ):
-    handler = CompleteMealCallHandler(_meal_repo())
+    handler = CompleteMealCallHandler(_meal_repo(), _directory())
     dto = await handler.handle(CompleteMealCallCommand(
         meal_call_id=meal_call_id,
         requester_id=current_user.member_id,
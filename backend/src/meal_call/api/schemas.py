@@ -53,6 +53,19 @@ class MealCallResponse(BaseModel):
     pending_member_ids: list[str]
 
 
+class MealCallResponsesResponse(BaseModel):
+    meal_call_id: str
+    responses: list[MealResponseResponse]
+
+
 class ReminderResponse(BaseModel):
     pending_member_ids: list[str]
     message: str
+
+
+class SearchHitResponse(BaseModel):
+    kind: str            # MENU | MEAL_CALL | RESPONSE
+    id: str
+    meal_call_id: str | None
+    text: str
+    occurred_at: datetime
@@ -1,14 +1,28 @@
+from typing import Callable
+
 from src.meal_call.application.commands import (
     CreateMealCallCommand, RespondMealCallCommand,
     RemindMealCallCommand, CompleteMealCallCommand, CreateMenuItemCommand,
 )
-from src.meal_call.application.dto import MealCallDto, MenuItemDto, MealResponseDto
+from src.meal_call.application.dto import (
+    MealCallDto, MealCallResponsesDto, MenuItemDto, MealResponseDto, SearchHitDto,
+)
 from src.meal_call.domain.meal_call import MealCall
 from src.meal_call.domain.menu_item import MenuItem, MenuCategory
-from src.meal_call.domain.meal_response import ResponseType
-from src.meal_call.domain.repository import MealCallRepository, MenuItemRepository
-from src.shared.api.error_handlers import NotFoundError, DomainError
+from src.meal_call.domain.meal_response import MealResponse, ResponseType
+from src.meal_call.domain.events import MealResponseReceived, MenuItemCreated
+from src.meal_call.domain.menu_search import MenuSearchIndex
+from src.meal_call.domain.repository import (
+    MealCallRepository, MenuItemRepository, ActiveMealCallViewRepository,
+    FamilyMemberDirectory, SearchRepository,
+)
+from src.shared.api.error_handlers import NotFoundError, DomainError, ConcurrencyError
+from src.shared.infrastructure.cache import LruTtlCache
 from src.shared.infrastructure.event_bus import event_bus
+from src.shared.infrastructure.unit_of_work import UnitOfWork
+
+# 낙관적 잠금 충돌 시 다시 읽고 재시도하는 최대 횟수
+_MAX_ATTEMPTS = 3
 
 
 def _menu_dto(m: MenuItem) -> MenuItemDto:
@@ -45,50 +59,80 @@ def _meal_call_dto(mc: MealCall, nickname_map: dict[str, str]) -> MealCallDto:
 
 
 class CreateMealCallHandler:
-    def __init__(self, repo: MealCallRepository, menu_repo: MenuItemRepository):
+    def __init__(
+        self,
+        repo: MealCallRepository,
+        menu_repo: MenuItemRepository,
+        directory: FamilyMemberDirectory,
+    ):
         self._repo = repo
         self._menu_repo = menu_repo
+        self._directory = directory
 
-    async def handle(self, cmd: CreateMealCallCommand) -> MealCallDto:
-        menus = []
-        for menu_id in cmd.menu_item_ids:
-            item = await self._menu_repo.find_by_id(menu_id)
-            if item:
-                menus.append(item)
-
+    async def handle(self, cmd: CreateMealCallCommand) -> tuple[MealCallDto, bool]:
+        """(호출, 새로 만들었는지) - 이미 ACTIVE 호출이 있으면 그 호출을 돌려준다"""
+        # 선택한 메뉴 수와 상관없이 한 번에 (다른 가족의 메뉴는 무시)
+        menus = await self._menu_repo.find_by_ids(cmd.family_id, cmd.menu_item_ids)
+        nicknames = await self._directory.get_members(cmd.family_id)
         meal_call = MealCall.create(
             family_id=cmd.family_id,
             caller_id=cmd.caller_id,
             caller_nickname=cmd.caller_nickname,
-            all_member_ids=cmd.all_member_ids,
+            all_member_ids=list(nicknames),
             menus=menus,
             message=cmd.message,
         )
-        await self._repo.save(meal_call)
-        events = meal_call.collect_events()
-        await event_bus.publish_all(events)
-        return _meal_call_dto(meal_call, {cmd.caller_id: cmd.caller_nickname})
+        for _ in range(_MAX_ATTEMPTS):
+            existing_id = await self._repo.add_if_no_active(meal_call)
+            if existing_id is None:
+                await event_bus.publish_all(meal_call.collect_events())
+                return _meal_call_dto(meal_call, nicknames), True
+
+            # 동시에 누른 다른 사람이 이겼다 - 푸시 중복 없이 기존 호출 반환
+            existing = await self._repo.find_by_id(existing_id)
+            if existing is not None and existing.is_active():
+                return _meal_call_dto(existing, nicknames), False
+            # 이긴 호출이 그 사이 완료/취소됐다 - 자리가 비었으니 다시 시도
+        raise ConcurrencyError("밥먹자 호출", meal_call.id)
 
 
 class RespondMealCallHandler:
-    def __init__(self, repo: MealCallRepository):
+    def __init__(self, repo: MealCallRepository, directory: FamilyMemberDirectory):
         self._repo = repo
+        self._directory = directory
 
-    async def handle(self, cmd: RespondMealCallCommand) -> MealCallDto:
-        meal_call = await self._repo.find_by_id(cmd.meal_call_id)
-        if not meal_call:
-            raise NotFoundError("밥먹자 호출", cmd.meal_call_id)
-
+    async def handle(self, cmd: RespondMealCallCommand) -> MealCallResponsesDto:
+        """기록 후 호출의 응답 목록 - 호출 전체는 읽지 않는다"""
         try:
             response_type = ResponseType(cmd.response_type)
         except ValueError:
             raise DomainError(f"유효하지 않은 응답 타입: {cmd.response_type}", "INVALID_RESPONSE_TYPE")
 
-        meal_call.respond(cmd.member_id, response_type, cmd.custom_message)
-        await self._repo.save(meal_call)
-        events = meal_call.collect_events()
-        await event_bus.publish_all(events)
-        return _meal_call_dto(meal_call, {})
+        # 빠른 경로: ACTIVE 확인 + upsert를 한 문장으로, 애그리거트를 읽지 않는다
+        response = MealResponse.create(
+            meal_call_id=cmd.meal_call_id,
+            member_id=cmd.member_id,
+            response_type=response_type,
+            custom_message=cmd.custom_message,
+        )
+        result = await self._repo.save_response_if_active(cmd.family_id, response)
+        if result is None:
+            raise NotFoundError("밥먹자 호출", cmd.meal_call_id)
+        written, responses = result
+        if not written:
+            raise DomainError("이미 종료된 밥먹자 호출입니다", "MEAL_CALL_CLOSED")
+
+        await event_bus.publish(MealResponseReceived(
+            meal_call_id=cmd.meal_call_id,
+            family_id=cmd.family_id,
+            member_id=cmd.member_id,
+            response_type=response_type.value,
+        ))
+        nicknames = await self._directory.get_members(cmd.family_id)
+        return MealCallResponsesDto(
+            meal_call_id=cmd.meal_call_id,
+            responses=[_response_dto(r, nicknames) for r in responses],
+        )
 
 
 class RemindMealCallHandler:
@@ -107,39 +151,67 @@ class RemindMealCallHandler:
 
 
 class CompleteMealCallHandler:
-    def __init__(self, repo: MealCallRepository):
+    def __init__(self, repo: MealCallRepository, directory: FamilyMemberDirectory):
         self._repo = repo
+        self._directory = directory
 
     async def handle(self, cmd: CompleteMealCallCommand) -> MealCallDto:
-        meal_call = await self._repo.find_by_id(cmd.meal_call_id)
-        if not meal_call:
-            raise NotFoundError("밥먹자 호출", cmd.meal_call_id)
-
-        meal_call.complete()
-        await self._repo.save(meal_call)
-        return _meal_call_dto(meal_call, {})
+        for attempt in range(1, _MAX_ATTEMPTS + 1):
+            meal_call = await self._repo.find_by_id(cmd.meal_call_id)
+            if not meal_call:
+                raise NotFoundError("밥먹자 호출", cmd.meal_call_id)
+            if not meal_call.is_active():
+                # 이미 종료됨 (먼저 완료한 요청이 이긴 경우 포함) - 그대로 반환
+                break
+
+            meal_call.complete()
+            try:
+                async with UnitOfWork() as uow:
+                    await self._repo.save(meal_call)
+                    uow.collect(meal_call)
+            except ConcurrencyError:
+                if attempt == _MAX_ATTEMPTS:
+                    raise
+                continue
+            break
+        return _meal_call_dto(meal_call, await self._directory.get_members(meal_call.family_id))
 
 
 class GetActiveMealCallHandler:
-    def __init__(self, repo: MealCallRepository):
-        self._repo = repo
-
-    async def handle(self, family_id: str) -> MealCallDto | None:
-        mc = await self._repo.find_active_by_family(family_id)
-        if not mc:
-            return None
-        return _meal_call_dto(mc, {})
+    def __init__(self, view: ActiveMealCallViewRepository, cache: LruTtlCache[str, bytes | None]):
+        self._view = view
+        self._cache = cache
+
+    async def handle(self, family_id: str) -> bytes | None:
+        """읽기 모델에 저장된 응답 본문 (ACTIVE 호출이 없으면 None), 캐시 우선"""
+        return await self._cache.get_or_load(
+            family_id, lambda: self._view.find_payload(family_id),
+        )
 
 
 class GetMealCallHandler:
-    def __init__(self, repo: MealCallRepository):
+    def __init__(
+        self,
+        repo: MealCallRepository,
+        directory: FamilyMemberDirectory,
+        cache: LruTtlCache[str, MealCallDto],
+    ):
         self._repo = repo
+        self._directory = directory
+        self._cache = cache
+
+    async def handle(self, meal_call_id: str, family_id: str) -> MealCallDto:
+        dto = await self._cache.get_or_load(meal_call_id, lambda: self._load(meal_call_id))
+        # 다른 가족의 호출은 없는 것으로 취급 (가족별 ETag의 전제)
+        if dto is None or dto.family_id != family_id:
+            raise NotFoundError("밥먹자 호출", meal_call_id)
+        return dto
 
-    async def handle(self, meal_call_id: str) -> MealCallDto:
+    async def _load(self, meal_call_id: str) -> MealCallDto | None:
         mc = await self._repo.find_by_id(meal_call_id)
         if not mc:
-            raise NotFoundError("밥먹자 호출", meal_call_id)
-        return _meal_call_dto(mc, {})
+            return None
+        return _meal_call_dto(mc, await self._directory.get_members(mc.family_id))
 
 
 class CreateMenuItemHandler:
@@ -159,13 +231,52 @@ class CreateMenuItemHandler:
             category=category,
         )
         await self._repo.save(item)
+        await event_bus.publish(MenuItemCreated(
+            menu_item_id=item.id, family_id=item.family_id, name=item.name,
+        ))
         return _menu_dto(item)
 
 
 class ListMenuItemsHandler:
-    def __init__(self, repo: MenuItemRepository):
+    def __init__(
+        self,
+        repo: MenuItemRepository,
+        cache: LruTtlCache[str, bytes],
+        render: Callable[[list[MenuItemDto]], bytes],
+    ):
         self._repo = repo
+        self._cache = cache
+        self._render = render
+
+    async def handle(self, family_id: str) -> bytes:
+        """이름순 메뉴 목록의 응답 본문 - 한 번 직렬화한 뒤 메뉴가 추가될 때까지 재사용"""
+        return await self._cache.get_or_load(family_id, lambda: self._load(family_id))
 
-    async def handle(self, family_id: str) -> list[MenuItemDto]:
+    async def _load(self, family_id: str) -> bytes:
         items = await self._repo.find_by_family(family_id)
-        return [_menu_dto(i) for i in items]
+        return self._render([_menu_dto(i) for i in items])
+
+
+class SearchMenusHandler:
+    def __init__(self, repo: MenuItemRepository, cache: LruTtlCache[str, MenuSearchIndex]):
+        self._repo = repo
+        self._cache = cache
+
+    async def handle(self, family_id: str, query: str, limit: int) -> list[MenuItemDto]:
+        """입력 중 메뉴 검색 (초성/자모) - 캐시된 인덱스에서, DB 조회 없이"""
+        index = await self._cache.get_or_load(family_id, lambda: self._build(family_id))
+        return [_menu_dto(i) for i in index.search(query, limit)]
+
+    async def _build(self, family_id: str) -> MenuSearchIndex:
+        return MenuSearchIndex(tuple(await self._repo.find_by_family(family_id)))
+
+
+class SearchHandler:
+    def __init__(self, repo: SearchRepository):
+        self._repo = repo
+
+    async def handle(self, family_id: str, query: str, limit: int) -> list[SearchHitDto]:
+        hits = await self._repo.search(family_id, query, limit)
+        return [SearchHitDto(kind=h.kind.value, id=h.id, meal_call_id=h.meal_call_id,
+                             text=h.text, occurred_at=h.occurred_at)
+                for h in hits]
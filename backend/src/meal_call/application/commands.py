@@ -6,7 +6,6 @@ class CreateMealCallCommand:
     family_id: str
     caller_id: str
     caller_nickname: str
-    all_member_ids: list[str]
     menu_item_ids: list[str] = field(default_factory=list)
     message: str | None = None
 
@@ -14,6 +13,7 @@ class CreateMealCallCommand:
 @dataclass
 class RespondMealCallCommand:
     meal_call_id: str
+    family_id: str
     member_id: str
     response_type: str
     custom_message: str | None = None
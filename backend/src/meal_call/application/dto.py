@@ -34,3 +34,18 @@ class MealCallDto:
     menus: list[MenuItemDto] = field(default_factory=list)
     responses: list[MealResponseDto] = field(default_factory=list)
     pending_member_ids: list[str] = field(default_factory=list)
+
+
+@dataclass
+class MealCallResponsesDto:
+    meal_call_id: str
+    responses: list[MealResponseDto] = field(default_factory=list)
+
+
+@dataclass
+class SearchHitDto:
+    kind: str
+    id: str
+    meal_call_id: str | None
+    text: str
+    occurred_at: datetime
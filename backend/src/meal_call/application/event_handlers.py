@@ -0,0 +1,58 @@
+from src.meal_call.application.dto import MealCallDto
+from src.meal_call.domain.events import (
+    MealCallCreated, MealResponseReceived, MealCallCompleted, MealCallCancelled,
+    MenuItemCreated,
+)
+from src.meal_call.domain.menu_item import MenuItem
+from src.meal_call.domain.menu_search import MenuSearchIndex
+from src.shared.infrastructure.cache import LruTtlCache
+from src.shared.infrastructure.change_tracker import ChangeTracker
+
+
+class MealCallCacheInvalidator:
+    """호출 상태가 바뀌는 이벤트마다 조회 캐시에서 해당 가족/호출 항목을 제거하고
+    가족의 변경 카운터(ETag)를 올린다
+
+    읽기 모델은 이벤트를 발행한 커밋에서 이미 갱신됐으므로 비운 항목은 다음 조회 때
+    새 본문으로 다시 캐시된다. 카운터는 마지막에 올려서 새 ETag가 항상 새 본문과 함께 나가도록 한다.
+    """
+
+    def __init__(
+        self,
+        active_cache: LruTtlCache[str, bytes | None],
+        call_cache: LruTtlCache[str, MealCallDto],
+        changes: ChangeTracker,
+    ):
+        self._active_cache = active_cache
+        self._call_cache = call_cache
+        self._changes = changes
+
+    async def on_meal_call_changed(
+        self,
+        event: MealCallCreated | MealResponseReceived | MealCallCompleted | MealCallCancelled,
+    ) -> None:
+        self._active_cache.invalidate(event.family_id)
+        self._call_cache.invalidate(event.meal_call_id)
+        self._changes.bump(event.family_id)
+
+
+class MenuCacheInvalidator:
+    """메뉴가 추가되면 가족의 메뉴 목록/응답 본문/검색 인덱스 캐시를 비우고 변경 카운터(ETag)를 올린다"""
+
+    def __init__(
+        self,
+        catalog_cache: LruTtlCache[str, tuple[MenuItem, ...]],
+        list_cache: LruTtlCache[str, bytes],
+        search_cache: LruTtlCache[str, MenuSearchIndex],
+        changes: ChangeTracker,
+    ):
+        self._catalog_cache = catalog_cache
+        self._list_cache = list_cache
+        self._search_cache = search_cache
+        self._changes = changes
+
+    async def on_menu_item_created(self, event: MenuItemCreated) -> None:
+        # 검색 인덱스는 다음 검색 때 캐시된 목록에서 그 가족 것만 다시 만든다
+        for cache in (self._catalog_cache, self._list_cache, self._search_cache):
+            cache.invalidate(event.family_id)
+        self._changes.bump(event.family_id)
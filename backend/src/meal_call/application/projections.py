@@ -0,0 +1,46 @@
+import logging
+from typing import Callable
+
+from src.meal_call.application.command_handlers import _meal_call_dto, _response_dto
+from src.meal_call.application.dto import MealCallDto, MealResponseDto
+from src.meal_call.domain.meal_call import MealCall
+from src.meal_call.domain.meal_response import MealResponse
+from src.meal_call.domain.repository import (
+    ActiveMealCallRenderer, ActiveMealCallViewRepository, FamilyMemberDirectory,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ActiveMealCallProjector(ActiveMealCallRenderer):
+    """ACTIVE 호출 읽기 모델의 본문을 만든다
+
+    호출 리포지토리가 쓰기 전에 본문을 받아 호출을 바꾸는 writer 작업에서 함께
+    저장한다 - 읽기 모델 갱신에 별도 커밋이 없다. render/render_response는 DTO를
+    API 응답 본문(JSON bytes)으로 직렬화한다 - 조회 시에는 저장된 본문을 그대로 돌려준다.
+    """
+
+    def __init__(
+        self,
+        view: ActiveMealCallViewRepository,
+        directory: FamilyMemberDirectory,
+        render: Callable[[MealCallDto], bytes],
+        render_response: Callable[[MealResponseDto], bytes],
+    ):
+        self._view = view
+        self._directory = directory
+        self._render = render
+        self._render_response = render_response
+
+    async def render_call(self, meal_call: MealCall) -> bytes:
+        nicknames = await self._directory.get_members(meal_call.family_id)
+        return self._render(_meal_call_dto(meal_call, nicknames))
+
+    async def render_response(self, family_id: str, response: MealResponse) -> bytes:
+        nicknames = await self._directory.get_members(family_id)
+        return self._render_response(_response_dto(response, nicknames))
+
+    async def rebuild(self) -> None:
+        """시작 시 전체 재생성 - 이전 버전에서 만든 호출이나 직접 고친 행을 반영"""
+        count = await self._view.rebuild(self.render_call)
+        logger.info(f"ACTIVE 호출 읽기 모델 재생성: {count}건")
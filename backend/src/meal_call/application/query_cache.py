@@ -0,0 +1,30 @@
+from src.config import (
+    MEAL_CALL_CACHE_SIZE, MEAL_CALL_CACHE_TTL_SECONDS,
+    MENU_CATALOG_CACHE_SIZE, MENU_CATALOG_CACHE_TTL_SECONDS,
+)
+from src.meal_call.application.dto import MealCallDto
+from src.meal_call.domain.menu_search import MenuSearchIndex
+from src.shared.infrastructure.cache import LruTtlCache
+from src.shared.infrastructure.change_tracker import ChangeTracker
+
+# 폴링 조회용 캐시 - 호출 이벤트(MealCallCacheInvalidator)로 무효화, TTL은 안전장치
+# family_id → ACTIVE 호출 응답 본문 (ACTIVE 호출이 없으면 None)
+active_meal_call_cache: LruTtlCache[str, bytes | None] = LruTtlCache(
+    "active_meal_call", max_size=MEAL_CALL_CACHE_SIZE, ttl=MEAL_CALL_CACHE_TTL_SECONDS,
+)
+# meal_call_id → MealCallDto
+meal_call_cache: LruTtlCache[str, MealCallDto] = LruTtlCache(
+    "meal_call", max_size=MEAL_CALL_CACHE_SIZE, ttl=MEAL_CALL_CACHE_TTL_SECONDS,
+)
+# family_id → GET /menus 응답 본문 - 메뉴 이벤트(MenuCacheInvalidator)로 무효화
+menu_list_cache: LruTtlCache[str, bytes] = LruTtlCache(
+    "menu_list", max_size=MENU_CATALOG_CACHE_SIZE, ttl=MENU_CATALOG_CACHE_TTL_SECONDS,
+)
+# family_id → 메뉴 입력 중 검색 인덱스 (초성/자모)
+menu_search_cache: LruTtlCache[str, MenuSearchIndex] = LruTtlCache(
+    "menu_search", max_size=MENU_CATALOG_CACHE_SIZE, ttl=MENU_CATALOG_CACHE_TTL_SECONDS,
+)
+
+# family_id → 변경 카운터 (ETag) - 캐시 무효화 뒤에 올린다
+meal_call_changes = ChangeTracker()
+menu_changes = ChangeTracker()
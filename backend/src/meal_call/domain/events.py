@@ -32,3 +32,22 @@ class ReminderRequested(DomainEvent):
 
     def __post_init__(self):
         object.__setattr__(self, 'pending_member_ids', self.pending_member_ids or [])
+
+
+@dataclass(frozen=True)
+class MealCallCompleted(DomainEvent):
+    meal_call_id: str = ""
+    family_id: str = ""
+
+
+@dataclass(frozen=True)
+class MealCallCancelled(DomainEvent):
+    meal_call_id: str = ""
+    family_id: str = ""
+
+
+@dataclass(frozen=True)
+class MenuItemCreated(DomainEvent):
+    menu_item_id: str = ""
+    family_id: str = ""
+    name: str = ""
@@ -8,6 +8,7 @@ from src.meal_call.domain.meal_response import MealResponse, ResponseType
 from src.meal_call.domain.menu_item import MenuItem
 from src.meal_call.domain.events import (
     MealCallCreated, MealResponseReceived, ReminderRequested,
+    MealCallCompleted, MealCallCancelled,
 )
 
 
@@ -29,9 +30,15 @@ class MealCall(AggregateRoot):
     menus: list[MenuItem] = field(default_factory=list)
     responses: list[MealResponse] = field(default_factory=list)
     all_member_ids: list[str] = field(default_factory=list)  # 생성 시점 가족 구성원
+    version: int = 0  # 낙관적 잠금 - 저장할 때마다 1씩 증가
 
     def __post_init__(self):
         super().__init__()
+        # 변경 추적 - 리포지토리가 바뀐 행만 저장할 수 있도록
+        self._is_new = False
+        self._status_changed = False
+        self._menus_changed = False
+        self._changed_responses: dict[str, MealResponse] = {}
 
     @classmethod
     def create(
@@ -55,6 +62,8 @@ class MealCall(AggregateRoot):
             responses=[],
             all_member_ids=all_member_ids,
         )
+        meal_call._is_new = True
+        meal_call._menus_changed = True
         meal_call._add_event(
             MealCallCreated(
                 meal_call_id=meal_call.id,
@@ -85,6 +94,7 @@ class MealCall(AggregateRoot):
             custom_message=custom_message,
         )
         self.responses.append(response)
+        self._changed_responses[member_id] = response
         self._add_event(
             MealResponseReceived(
                 meal_call_id=self.id,
@@ -112,10 +122,36 @@ class MealCall(AggregateRoot):
     def complete(self) -> None:
         self.status = MealCallStatus.COMPLETED
         self.completed_at = datetime.now(timezone.utc)
+        self._status_changed = True
+        self._add_event(MealCallCompleted(meal_call_id=self.id, family_id=self.family_id))
 
     def cancel(self) -> None:
         self.status = MealCallStatus.CANCELLED
         self.completed_at = datetime.now(timezone.utc)
+        self._status_changed = True
+        self._add_event(MealCallCancelled(meal_call_id=self.id, family_id=self.family_id))
+
+    @property
+    def is_new(self) -> bool:
+        return self._is_new
+
+    @property
+    def status_changed(self) -> bool:
+        return self._status_changed
+
+    @property
+    def menus_changed(self) -> bool:
+        return self._menus_changed
+
+    def changed_responses(self) -> list[MealResponse]:
+        """마지막 저장 이후 추가되거나 교체된 응답 (구성원당 최신 1개)"""
+        return list(self._changed_responses.values())
+
+    def clear_changes(self) -> None:
+        self._is_new = False
+        self._status_changed = False
+        self._menus_changed = False
+        self._changed_responses.clear()
 
     def get_pending_member_ids(self) -> list[str]:
         responded_ids = {r.member_id for r in self.responses}
@@ -0,0 +1,88 @@
+from dataclasses import dataclass
+
+from src.meal_call.domain.menu_item import MenuItem
+
+_HANGUL_BASE, _HANGUL_LAST = 0xAC00, 0xD7A3
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+_JONGSEONG = ("", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ",
+              "ㄿ", "ㅀ", "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ")
+# 겹자모는 키보드 입력 순서대로 풀어 둔다 - "달"까지 친 상태에서 "닭"이 걸리도록
+_COMPOUND = {
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ",
+    "ㄽ": "ㄹㅅ", "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ",
+    "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+}
+_CONSONANTS = frozenset(_CHOSEONG)
+
+
+def decompose(text: str) -> str:
+    """공백을 빼고 한글 음절을 자모로 풀어 쓴다 (그 외 문자는 소문자로)"""
+    out: list[str] = []
+    for ch in text:
+        if ch.isspace():
+            continue
+        code = ord(ch)
+        if _HANGUL_BASE <= code <= _HANGUL_LAST:
+            index = code - _HANGUL_BASE
+            jamo = _CHOSEONG[index // 588] + _JUNGSEONG[index % 588 // 28] + _JONGSEONG[index % 28]
+            out.extend(_COMPOUND.get(j, j) for j in jamo)
+        else:
+            out.append(_COMPOUND.get(ch, ch.lower()))
+    return "".join(out)
+
+
+def choseong(text: str) -> str:
+    """공백을 빼고 한글 음절을 초성으로 (그 외 문자는 소문자로)"""
+    out: list[str] = []
+    for ch in text:
+        if ch.isspace():
+            continue
+        code = ord(ch)
+        if _HANGUL_BASE <= code <= _HANGUL_LAST:
+            out.append(_CHOSEONG[(code - _HANGUL_BASE) // 588])
+        else:
+            out.append(ch.lower())
+    return "".join(out)
+
+
+@dataclass(frozen=True)
+class _Entry:
+    item: MenuItem
+    jamo: str
+    choseong: str
+
+
+class MenuSearchIndex:
+    """한 가족의 메뉴 입력 중 검색 (초성 / 자모 부분 일치)
+
+    메뉴 이름마다 자모 분해와 초성 문자열을 미리 만들어 두고, 검색은 그
+    문자열에서 부분 문자열을 찾는다. 검색어가 자음만으로 되어 있으면 초성
+    ("ㄱㅊ" → 김치찌개), 아니면 자모("김ㅊ" → 김치찌개)로 비교한다.
+    가족당 메뉴는 수백 개 수준이라 선형 탐색으로 1ms 안에 끝난다.
+    """
+
+    def __init__(self, items: tuple[MenuItem, ...]):
+        # items는 이름순 - 같은 순위면 이름순으로 나온다
+        self._entries = tuple(_Entry(i, decompose(i.name), choseong(i.name)) for i in items)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def search(self, query: str, limit: int = 20) -> list[MenuItem]:
+        query = "".join(query.split())
+        if not query:
+            return []
+        if all(ch in _CONSONANTS for ch in query):
+            needle, key = query, "choseong"
+        else:
+            needle, key = decompose(query), "jamo"
+
+        matches: list[tuple[int, int, MenuItem]] = []
+        for order, entry in enumerate(self._entries):
+            position = getattr(entry, key).find(needle)
+            if position >= 0:
+                matches.append((position, order, entry.item))
+        # 앞에서부터 일치하는 메뉴 우선
+        matches.sort(key=lambda m: (m[0], m[1]))
+        return [item for _, _, item in matches[:limit]]
@@ -1,12 +1,31 @@
 from abc import ABC, abstractmethod
+from typing import Awaitable, Callable
 from src.meal_call.domain.meal_call import MealCall
+from src.meal_call.domain.meal_response import MealResponse
 from src.meal_call.domain.menu_item import MenuItem
+from src.meal_call.domain.search import SearchHit
 
 
 class MealCallRepository(ABC):
     @abstractmethod
     async def save(self, meal_call: MealCall) -> None: ...
 
+    @abstractmethod
+    async def add_if_no_active(self, meal_call: MealCall) -> str | None:
+        """가족에 ACTIVE 호출이 없을 때만 새 호출을 저장
+
+        저장했으면 None, 이미 ACTIVE 호출이 있으면 그 호출의 id를 반환한다.
+        """
+
+    @abstractmethod
+    async def save_response_if_active(
+        self, family_id: str, response: MealResponse,
+    ) -> tuple[bool, list[MealResponse]] | None:
+        """호출이 해당 가족의 ACTIVE 상태일 때만 응답을 upsert
+
+        호출이 없거나 다른 가족의 호출이면 None, 아니면 (기록했는지, 기록 후 호출의 응답 목록).
+        """
+
     @abstractmethod
     async def find_by_id(self, meal_call_id: str) -> MealCall | None: ...
 
@@ -26,3 +45,51 @@ class MenuItemRepository(ABC):
 
     @abstractmethod
     async def find_by_id(self, menu_item_id: str) -> MenuItem | None: ...
+
+    @abstractmethod
+    async def find_by_ids(self, family_id: str, menu_item_ids: list[str]) -> list[MenuItem]:
+        """요청 순서대로 (중복 제거), 다른 가족의 메뉴나 없는 id는 빠진다"""
+
+
+class ActiveMealCallRenderer(ABC):
+    """ACTIVE 호출 읽기 모델에 저장할 응답 본문(JSON bytes)을 만든다
+
+    호출 리포지토리가 쓰기 전에(writer 밖에서) 호출해, 호출을 바꾸는 쓰기와 같은
+    writer 작업에서 읽기 모델도 갱신한다.
+    """
+
+    @abstractmethod
+    async def render_call(self, meal_call: MealCall) -> bytes:
+        """호출 전체 - GET /meal-calls/active 응답 본문"""
+
+    @abstractmethod
+    async def render_response(self, family_id: str, response: MealResponse) -> bytes:
+        """호출 본문의 responses 항목 하나"""
+
+
+class ActiveMealCallViewRepository(ABC):
+    """가족별 ACTIVE 호출 읽기 모델 (미리 직렬화한 응답 본문)
+
+    평소 갱신은 호출 리포지토리가 호출을 바꾸는 쓰기와 함께 한다 (ActiveMealCallRenderer).
+    """
+
+    @abstractmethod
+    async def rebuild(self, render: Callable[[MealCall], Awaitable[bytes]]) -> int:
+        """모든 ACTIVE 호출로 읽기 모델을 다시 만들고 개수를 반환"""
+
+    @abstractmethod
+    async def find_payload(self, family_id: str) -> bytes | None: ...
+
+
+class FamilyMemberDirectory(ABC):
+    """가족 구성원 조회 (identity 컨텍스트) - 닉네임 표시와 호출 대상 결정에 사용"""
+
+    @abstractmethod
+    async def get_members(self, family_id: str) -> dict[str, str]:
+        """member_id → 닉네임 (가족이 없으면 빈 dict)"""
+
+
+class SearchRepository(ABC):
+    @abstractmethod
+    async def search(self, family_id: str, query: str, limit: int = 20) -> list[SearchHit]:
+        """메뉴 이름, 호출 메시지, 응답 메시지에서 query를 포함하는 항목 (최신순)"""
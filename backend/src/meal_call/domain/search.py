@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+
+
+class SearchHitKind(str, Enum):
+    MENU = "MENU"
+    MEAL_CALL = "MEAL_CALL"      # 호출 메시지
+    RESPONSE = "RESPONSE"        # 응답 메시지
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    kind: SearchHitKind
+    id: str
+    meal_call_id: str | None     # 메뉴 검색 결과는 None
+    text: str
+    occurred_at: datetime
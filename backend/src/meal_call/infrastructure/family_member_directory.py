@@ -0,0 +1,10 @@
+from src.identity.infrastructure.family_directory import family_directory
+from src.meal_call.domain.repository import FamilyMemberDirectory
+
+
+class CachedFamilyMemberDirectory(FamilyMemberDirectory):
+    """identity의 가족 디렉터리 캐시를 그대로 사용 - 캐시 적중 시 쿼리 없음"""
+
+    async def get_members(self, family_id: str) -> dict[str, str]:
+        entry = await family_directory.get(family_id)
+        return entry.nicknames if entry else {}
@@ -0,0 +1,42 @@
+from src.config import MENU_CATALOG_CACHE_SIZE, MENU_CATALOG_CACHE_TTL_SECONDS
+from src.meal_call.domain.menu_item import MenuItem
+from src.meal_call.domain.repository import MenuItemRepository
+from src.shared.infrastructure.cache import LruTtlCache
+
+# family_id → 이름순 메뉴 목록 - MenuItemCreated 이벤트(MenuCacheInvalidator)로 무효화
+menu_catalog_cache: LruTtlCache[str, tuple[MenuItem, ...]] = LruTtlCache(
+    "menu_catalog", max_size=MENU_CATALOG_CACHE_SIZE, ttl=MENU_CATALOG_CACHE_TTL_SECONDS,
+)
+
+
+class CachedMenuItemRepository(MenuItemRepository):
+    """가족별 메뉴 목록을 프로세스에 캐시하는 리포지토리 데코레이터
+
+    메뉴는 한 달에 몇 번 바뀌지 않으므로 목록 전체를 캐시한다. 캐시에 목록이
+    있으면 find_by_ids도 쿼리 없이 처리하고, 없으면 쿼리 한 번으로 고른다.
+    """
+
+    def __init__(self, inner: MenuItemRepository, cache: LruTtlCache[str, tuple[MenuItem, ...]]):
+        self._inner = inner
+        self._cache = cache
+
+    async def save(self, menu_item: MenuItem) -> None:
+        await self._inner.save(menu_item)
+
+    async def find_by_family(self, family_id: str) -> list[MenuItem]:
+        return list(await self._catalog(family_id))
+
+    async def find_by_id(self, menu_item_id: str) -> MenuItem | None:
+        return await self._inner.find_by_id(menu_item_id)
+
+    async def find_by_ids(self, family_id: str, menu_item_ids: list[str]) -> list[MenuItem]:
+        catalog = self._cache.get(family_id)
+        if catalog is None:
+            return await self._inner.find_by_ids(family_id, menu_item_ids)
+        by_id = {m.id: m for m in catalog}
+        return [by_id[i] for i in dict.fromkeys(menu_item_ids) if i in by_id]
+
+    async def _catalog(self, family_id: str) -> tuple[MenuItem, ...]:
+        async def _load() -> tuple[MenuItem, ...]:
+            return tuple(await self._inner.find_by_family(family_id))
+        return await self._cache.get_or_load(family_id, _load)
@@ -1,10 +1,20 @@
+import heapq
+import json
+from collections import defaultdict
 from datetime import datetime, timezone
+from typing import Awaitable, Callable
 
 from src.meal_call.domain.meal_call import MealCall, MealCallStatus
 from src.meal_call.domain.meal_response import MealResponse, ResponseType
 from src.meal_call.domain.menu_item import MenuItem, MenuCategory
-from src.meal_call.domain.repository import MealCallRepository, MenuItemRepository
-from src.shared.infrastructure.database import get_db
+from src.meal_call.domain.repository import (
+    MealCallRepository, MenuItemRepository, ActiveMealCallRenderer, ActiveMealCallViewRepository,
+    SearchRepository,
+)
+from src.meal_call.domain.search import SearchHit, SearchHitKind
+from src.shared.api.error_handlers import ConcurrencyError
+from src.shared.infrastructure.database import read_connection, write, write_returning
+from src.shared.infrastructure.unit_of_work import after_commit
 
 
 def _parse_dt(s: str) -> datetime:
@@ -18,147 +28,485 @@ def _parse_dt_opt(s: str | None) -> datetime | None:
     return _parse_dt(s) if s else None
 
 
+def _menu_item(r) -> MenuItem:
+    return MenuItem(
+        id=r["id"], family_id=r["family_id"], name=r["name"],
+        emoji_icon=r["emoji_icon"], category=MenuCategory(r["category"]),
+        created_at=_parse_dt(r["created_at"]),
+    )
+
+
+def _meal_response(r) -> MealResponse:
+    return MealResponse(
+        id=r["id"], meal_call_id=r["meal_call_id"],
+        member_id=r["member_id"],
+        response_type=ResponseType(r["response_type"]),
+        custom_message=r["custom_message"],
+        responded_at=_parse_dt(r["responded_at"]),
+    )
+
+
+async def _upsert_view(db, meal_call_id: str, payload: bytes) -> None:
+    # 호출이 ACTIVE일 때만 - 같은 트랜잭션에서 이미 완료/취소됐으면 쓰지 않는다
+    await db.execute(
+        """INSERT INTO active_meal_call_views (family_id, meal_call_id, payload, updated_at)
+           SELECT family_id, id, ?, ? FROM meal_calls WHERE id = ? AND status = 'ACTIVE'
+           ON CONFLICT(family_id) DO UPDATE SET
+             meal_call_id = excluded.meal_call_id,
+             payload = excluded.payload,
+             updated_at = excluded.updated_at""",
+        (payload, datetime.now(timezone.utc).isoformat(), meal_call_id),
+    )
+
+
+async def _delete_view(db, family_id: str, meal_call_id: str) -> None:
+    # 다른 호출이 이미 자리를 차지했다면 건드리지 않는다
+    await db.execute(
+        "DELETE FROM active_meal_call_views WHERE family_id = ? AND meal_call_id = ?",
+        (family_id, meal_call_id),
+    )
+
+
+async def _patch_view_response(db, family_id: str, meal_call_id: str, member_id: str, entry: bytes) -> None:
+    """저장된 본문에서 구성원의 응답 항목만 바꾼다 - 호출을 다시 읽거나 렌더링하지 않는다"""
+    rows = await db.execute_fetchall(
+        "SELECT payload FROM active_meal_call_views WHERE family_id = ? AND meal_call_id = ?",
+        (family_id, meal_call_id),
+    )
+    if not rows:
+        return
+    view = json.loads(rows[0]["payload"])
+    item = json.loads(entry)
+    responses = view["responses"]
+    for i, r in enumerate(responses):
+        if r["member_id"] == member_id:
+            responses[i] = item
+            break
+    else:
+        responses.append(item)
+    view["pending_member_ids"] = [m for m in view["pending_member_ids"] if m != member_id]
+    # render(pydantic)와 같은 형태 - 공백 없이, 한글은 그대로
+    payload = json.dumps(view, ensure_ascii=False, separators=(",", ":")).encode()
+    await db.execute(
+        "UPDATE active_meal_call_views SET payload = ?, updated_at = ? WHERE family_id = ?",
+        (payload, datetime.now(timezone.utc).isoformat(), family_id),
+    )
+
+
 class SqliteMealCallRepository(MealCallRepository):
+    """renderer가 있으면 호출을 바꾸는 writer 작업에서 ACTIVE 호출 읽기 모델도 함께 갱신한다
+
+    본문 렌더링은 쓰기 전에 끝내고, writer 작업에는 조건부 upsert/delete나
+    응답 항목 교체만 들어간다 - 읽기 모델 때문에 커밋이 늘지 않는다.
+    """
+
+    def __init__(self, renderer: ActiveMealCallRenderer | None = None):
+        self._renderer = renderer
+
     async def save(self, mc: MealCall) -> None:
-        async with get_db() as db:
-            await db.execute(
-                """INSERT OR REPLACE INTO meal_calls
-                   (id, family_id, caller_id, message, status, created_at, completed_at)
-                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
-                (mc.id, mc.family_id, mc.caller_id, mc.message,
-                 mc.status.value if hasattr(mc.status, 'value') else mc.status,
-                 mc.created_at.isoformat(),
-                 mc.completed_at.isoformat() if mc.completed_at else None),
-            )
-            # menus
-            await db.execute("DELETE FROM meal_call_menus WHERE meal_call_id = ?", (mc.id,))
-            for menu in mc.menus:
+        """마지막 저장 이후 바뀐 행만 기록 (응답 한 건이면 upsert 한 번)
+
+        호출 행(상태, 메뉴)을 바꿀 때는 읽은 시점의 version과 같을 때만 갱신하고
+        version을 올린다. 그 사이 다른 요청이 먼저 저장했다면 ConcurrencyError -
+        아무것도 쓰지 않는다. 응답은 구성원별 upsert라 version과 무관하다.
+        """
+        is_new = mc.is_new
+        update_call = not is_new and (mc.status_changed or mc.menus_changed)
+        recipient_rows = [(mc.id, mid) for mid in mc.all_member_ids] if is_new else None
+        menu_rows = [(mc.id, m.id) for m in mc.menus] if mc.menus_changed else None
+        response_rows = [
+            (r.id, r.meal_call_id, r.member_id,
+             r.response_type.value if hasattr(r.response_type, 'value') else r.response_type,
+             r.custom_message, r.responded_at.isoformat())
+            for r in mc.changed_responses()
+        ]
+        if not is_new and not update_call and not response_rows:
+            return
+        update_view = await self._view_update(mc, is_new)
+        status = mc.status.value if hasattr(mc.status, 'value') else mc.status
+        completed_at = mc.completed_at.isoformat() if mc.completed_at else None
+        expected_version = mc.version
+
+        async def _save(db) -> None:
+            if is_new:
                 await db.execute(
+                    """INSERT INTO meal_calls
+                       (id, family_id, caller_id, message, status, created_at, completed_at, version)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                    (mc.id, mc.family_id, mc.caller_id, mc.message, status,
+                     mc.created_at.isoformat(), completed_at, expected_version),
+                )
+                await db.executemany(
+                    "INSERT OR IGNORE INTO meal_call_recipients (meal_call_id, member_id) VALUES (?, ?)",
+                    recipient_rows,
+                )
+            elif update_call:
+                cursor = await db.execute(
+                    """UPDATE meal_calls SET status = ?, completed_at = ?, version = version + 1
+                       WHERE id = ? AND version = ?""",
+                    (status, completed_at, mc.id, expected_version),
+                )
+                if cursor.rowcount == 0:
+                    raise ConcurrencyError("밥먹자 호출", mc.id)
+            if menu_rows is not None:
+                if not is_new:
+                    await db.execute("DELETE FROM meal_call_menus WHERE meal_call_id = ?", (mc.id,))
+                await db.executemany(
                     "INSERT OR IGNORE INTO meal_call_menus (meal_call_id, menu_item_id) VALUES (?, ?)",
-                    (mc.id, menu.id),
+                    menu_rows,
                 )
-            # responses (upsert)
-            for r in mc.responses:
-                await db.execute(
-                    """INSERT OR REPLACE INTO meal_responses
+            if response_rows:
+                await db.executemany(
+                    """INSERT INTO meal_responses
                        (id, meal_call_id, member_id, response_type, custom_message, responded_at)
-                       VALUES (?, ?, ?, ?, ?, ?)""",
-                    (r.id, r.meal_call_id, r.member_id,
-                     r.response_type.value if hasattr(r.response_type, 'value') else r.response_type,
-                     r.custom_message, r.responded_at.isoformat()),
+                       VALUES (?, ?, ?, ?, ?, ?)
+                       ON CONFLICT(meal_call_id, member_id) DO UPDATE SET
+                         id = excluded.id,
+                         response_type = excluded.response_type,
+                         custom_message = excluded.custom_message,
+                         responded_at = excluded.responded_at""",
+                    response_rows,
+                )
+            if update_view is not None:
+                await update_view(db)
+
+        def _applied() -> None:
+            if update_call:
+                mc.version = expected_version + 1
+            mc.clear_changes()
+
+        await write(_save)
+        after_commit(_applied)
+
+    async def add_if_no_active(self, mc: MealCall) -> str | None:
+        """uq_meal_calls_active_family 부분 유니크 인덱스로 원자적으로 판정
+
+        동시에 두 요청이 들어와도 하나만 INSERT되고, 진 쪽은 이긴 호출의 id를 받는다.
+        """
+        call_row = (
+            mc.id, mc.family_id, mc.caller_id, mc.message,
+            mc.status.value if hasattr(mc.status, 'value') else mc.status,
+            mc.created_at.isoformat(),
+            mc.completed_at.isoformat() if mc.completed_at else None,
+        )
+        menu_rows = [(mc.id, m.id) for m in mc.menus]
+        recipient_rows = [(mc.id, mid) for mid in mc.all_member_ids]
+        payload = await self._renderer.render_call(mc) if self._renderer else None
+
+        async def _insert(db) -> str | None:
+            cursor = await db.execute(
+                """INSERT INTO meal_calls
+                   (id, family_id, caller_id, message, status, created_at, completed_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)
+                   ON CONFLICT (family_id) WHERE status = 'ACTIVE' DO NOTHING""",
+                call_row,
+            )
+            if cursor.rowcount == 0:
+                rows = await db.execute_fetchall(
+                    "SELECT id FROM meal_calls WHERE family_id = ? AND status = 'ACTIVE'",
+                    (mc.family_id,),
                 )
-            await db.commit()
-
-    async def _load(self, row, db) -> MealCall:
-        menus_rows = await db.execute_fetchall(
-            """SELECT mi.* FROM menu_items mi
-               JOIN meal_call_menus mcm ON mi.id = mcm.menu_item_id
-               WHERE mcm.meal_call_id = ?""",
-            (row["id"],),
+                return rows[0]["id"]
+            await db.executemany(
+                "INSERT OR IGNORE INTO meal_call_menus (meal_call_id, menu_item_id) VALUES (?, ?)",
+                menu_rows,
+            )
+            await db.executemany(
+                "INSERT OR IGNORE INTO meal_call_recipients (meal_call_id, member_id) VALUES (?, ?)",
+                recipient_rows,
+            )
+            if payload is not None:
+                await _upsert_view(db, mc.id, payload)
+            return None
+
+        existing_id = await write_returning(_insert)
+        if existing_id is None:
+            mc.clear_changes()
+        return existing_id
+
+    async def save_response_if_active(
+        self, family_id: str, response: MealResponse,
+    ) -> tuple[bool, list[MealResponse]] | None:
+        """상태 확인과 upsert를 조건부 INSERT 한 문장으로 처리 (애그리거트 로딩 없음)
+
+        같은 writer 작업에서 호출 상태와 응답 목록을 한 번 더 읽는다 - 기록되지 않았을 때
+        호출이 없는지(None) 종료됐는지(False)를 구분하고, 기록됐으면 갱신된 응답 목록을 돌려준다.
+        결과를 돌려받아야 하므로 UnitOfWork 안에서는 호출할 수 없다.
+        응답은 구성원별 행이라 서로 덮어쓰지 않으므로 호출의 version은 올리지 않는다
+        (여러 명이 동시에 응답해도 충돌 재시도가 없다).
+        """
+        params = (
+            response.id, response.member_id,
+            response.response_type.value if hasattr(response.response_type, 'value') else response.response_type,
+            response.custom_message, response.responded_at.isoformat(),
+            response.meal_call_id, family_id,
         )
-        resp_rows = await db.execute_fetchall(
-            "SELECT * FROM meal_responses WHERE meal_call_id = ?", (row["id"],)
+        entry = await self._renderer.render_response(family_id, response) if self._renderer else None
+
+        async def _upsert(db) -> tuple[bool, list[MealResponse]] | None:
+            cursor = await db.execute(
+                """INSERT INTO meal_responses
+                   (id, meal_call_id, member_id, response_type, custom_message, responded_at)
+                   SELECT ?, mc.id, ?, ?, ?, ? FROM meal_calls mc
+                   WHERE mc.id = ? AND mc.family_id = ? AND mc.status = 'ACTIVE'
+                   ON CONFLICT(meal_call_id, member_id) DO UPDATE SET
+                     id = excluded.id,
+                     response_type = excluded.response_type,
+                     custom_message = excluded.custom_message,
+                     responded_at = excluded.responded_at""",
+                params,
+            )
+            written = cursor.rowcount > 0
+            if written and entry is not None:
+                await _patch_view_response(db, family_id, response.meal_call_id, response.member_id, entry)
+            rows = await db.execute_fetchall(
+                """SELECT r.* FROM meal_calls mc
+                   LEFT JOIN meal_responses r ON r.meal_call_id = mc.id
+                   WHERE mc.id = ? AND mc.family_id = ?""",
+                (response.meal_call_id, family_id),
+            )
+            if not rows:
+                return None
+            return written, [_meal_response(r) for r in rows if r["id"] is not None]
+
+        return await write_returning(_upsert)
+
+    async def _view_update(self, mc: MealCall, is_new: bool) -> Callable[..., Awaitable[None]] | None:
+        """save와 같은 writer 작업에서 실행할 읽기 모델 갱신 (렌더링은 여기서 미리)"""
+        if self._renderer is None:
+            return None
+        if not mc.is_active():
+            return lambda db: _delete_view(db, mc.family_id, mc.id)
+        if is_new:
+            payload = await self._renderer.render_call(mc)
+            return lambda db: _upsert_view(db, mc.id, payload)
+        # ACTIVE 호출에서 바뀌는 것은 응답뿐 - 바뀐 구성원의 항목만 교체
+        entries = [
+            (r.member_id, await self._renderer.render_response(mc.family_id, r))
+            for r in mc.changed_responses()
+        ]
+
+        async def _patch(db) -> None:
+            for member_id, entry in entries:
+                await _patch_view_response(db, mc.family_id, mc.id, member_id, entry)
+        return _patch
+
+    async def _load_many(self, rows, db) -> list[MealCall]:
+        """meal_calls 행 개수와 상관없이 쿼리 2번으로 애그리거트를 복원"""
+        if not rows:
+            return []
+        call_ids = json.dumps([r["id"] for r in rows])
+
+        menu_rows = await db.execute_fetchall(
+            """SELECT mcm.meal_call_id, mi.* FROM meal_call_menus mcm
+               JOIN menu_items mi ON mi.id = mcm.menu_item_id
+               WHERE mcm.meal_call_id IN (SELECT value FROM json_each(?))""",
+            (call_ids,),
         )
-        # all_member_ids: 해당 가족의 현재 멤버 (응답 추적용)
+        # 대상 구성원(id IS NULL)과 응답을 한 번에 - all_member_ids는 생성 시점 스냅샷
         member_rows = await db.execute_fetchall(
-            "SELECT id FROM members WHERE family_id = ?", (row["family_id"],)
+            """SELECT meal_call_id, member_id, NULL AS id, NULL AS response_type,
+                      NULL AS custom_message, NULL AS responded_at
+               FROM meal_call_recipients WHERE meal_call_id IN (SELECT value FROM json_each(?1))
+               UNION ALL
+               SELECT meal_call_id, member_id, id, response_type, custom_message, responded_at
+               FROM meal_responses WHERE meal_call_id IN (SELECT value FROM json_each(?1))""",
+            (call_ids,),
         )
 
-        mc = MealCall(
-            id=row["id"], family_id=row["family_id"],
-            caller_id=row["caller_id"], message=row["message"],
-            status=MealCallStatus(row["status"]),
-            created_at=_parse_dt(row["created_at"]),
-            completed_at=_parse_dt_opt(row["completed_at"]),
-            menus=[
-                MenuItem(
-                    id=m["id"], family_id=m["family_id"], name=m["name"],
-                    emoji_icon=m["emoji_icon"], category=MenuCategory(m["category"]),
-                    created_at=_parse_dt(m["created_at"]),
-                )
-                for m in menus_rows
-            ],
-            responses=[
-                MealResponse(
-                    id=r["id"], meal_call_id=r["meal_call_id"],
-                    member_id=r["member_id"],
-                    response_type=ResponseType(r["response_type"]),
-                    custom_message=r["custom_message"],
-                    responded_at=_parse_dt(r["responded_at"]),
-                )
-                for r in resp_rows
-            ],
-            all_member_ids=[m["id"] for m in member_rows],
-        )
-        mc._domain_events.clear()
-        return mc
+        # 같은 메뉴가 여러 호출에 반복되므로 메뉴 객체는 id별로 한 번만 만든다
+        items: dict[str, MenuItem] = {}
+        menus: dict[str, list[MenuItem]] = defaultdict(list)
+        for m in menu_rows:
+            item = items.get(m["id"])
+            if item is None:
+                item = items[m["id"]] = _menu_item(m)
+            menus[m["meal_call_id"]].append(item)
+        responses: dict[str, list[MealResponse]] = defaultdict(list)
+        recipients: dict[str, list[str]] = defaultdict(list)
+        for r in member_rows:
+            if r["id"] is None:
+                recipients[r["meal_call_id"]].append(r["member_id"])
+            else:
+                responses[r["meal_call_id"]].append(_meal_response(r))
+
+        result = []
+        for row in rows:
+            mc = MealCall(
+                id=row["id"], family_id=row["family_id"],
+                caller_id=row["caller_id"], message=row["message"],
+                status=MealCallStatus(row["status"]),
+                created_at=_parse_dt(row["created_at"]),
+                completed_at=_parse_dt_opt(row["completed_at"]),
+                menus=menus[row["id"]],
+                responses=responses[row["id"]],
+                all_member_ids=recipients[row["id"]],
+                version=row["version"],
+            )
+            mc._domain_events.clear()
+            result.append(mc)
+        return result
 
     async def find_by_id(self, meal_call_id: str) -> MealCall | None:
-        async with get_db() as db:
+        async with read_connection() as db:
             rows = await db.execute_fetchall(
                 "SELECT * FROM meal_calls WHERE id = ?", (meal_call_id,)
             )
-            if not rows:
-                return None
-            return await self._load(rows[0], db)
+            loaded = await self._load_many(rows, db)
+        return loaded[0] if loaded else None
 
     async def find_active_by_family(self, family_id: str) -> MealCall | None:
-        async with get_db() as db:
+        async with read_connection() as db:
             rows = await db.execute_fetchall(
-                "SELECT * FROM meal_calls WHERE family_id = ? AND status = 'ACTIVE' ORDER BY created_at DESC LIMIT 1",
+                "SELECT * FROM meal_calls WHERE family_id = ? AND status = 'ACTIVE'",
                 (family_id,),
             )
-            if not rows:
-                return None
-            return await self._load(rows[0], db)
+            loaded = await self._load_many(rows, db)
+        return loaded[0] if loaded else None
 
     async def find_by_family(self, family_id: str, limit: int = 20) -> list[MealCall]:
-        async with get_db() as db:
+        async with read_connection() as db:
             rows = await db.execute_fetchall(
                 "SELECT * FROM meal_calls WHERE family_id = ? ORDER BY created_at DESC LIMIT ?",
                 (family_id, limit),
             )
-            return [await self._load(r, db) for r in rows]
+            return await self._load_many(rows, db)
+
+
+class SqliteActiveMealCallViewRepository(ActiveMealCallViewRepository):
+    """active_meal_call_views - GET /meal-calls/active는 PK 조회 한 번으로 끝난다
+
+    평소 갱신은 SqliteMealCallRepository가 호출을 바꾸는 writer 작업에서 한다.
+    여기서는 시작 시 전체 재생성과 조회만 한다.
+    """
+
+    def __init__(self):
+        self._calls = SqliteMealCallRepository()
+
+    async def rebuild(self, render: Callable[[MealCall], Awaitable[bytes]]) -> int:
+        async with read_connection() as db:
+            rows = await db.execute_fetchall("SELECT * FROM meal_calls WHERE status = 'ACTIVE'")
+            calls = await self._calls._load_many(rows, db)
+        rendered = [(mc, await render(mc)) for mc in calls]
+
+        async def _rebuild(db) -> None:
+            await db.execute("DELETE FROM active_meal_call_views")
+            for mc, payload in rendered:
+                await _upsert_view(db, mc.id, payload)
+
+        await write(_rebuild)
+        return len(rendered)
+
+    async def find_payload(self, family_id: str) -> bytes | None:
+        async with read_connection() as db:
+            rows = await db.execute_fetchall(
+                "SELECT payload FROM active_meal_call_views WHERE family_id = ?", (family_id,)
+            )
+        return rows[0]["payload"] if rows else None
 
 
 class SqliteMenuItemRepository(MenuItemRepository):
     async def save(self, item: MenuItem) -> None:
-        async with get_db() as db:
+        async def _save(db) -> None:
             await db.execute(
-                """INSERT OR REPLACE INTO menu_items
+                """INSERT INTO menu_items
                    (id, family_id, name, emoji_icon, category, created_at)
-                   VALUES (?, ?, ?, ?, ?, ?)""",
+                   VALUES (?, ?, ?, ?, ?, ?)
+                   ON CONFLICT(id) DO UPDATE SET
+                       name = excluded.name, emoji_icon = excluded.emoji_icon,
+                       category = excluded.category""",
                 (item.id, item.family_id, item.name, item.emoji_icon,
                  item.category.value if hasattr(item.category, 'value') else item.category,
                  item.created_at.isoformat()),
             )
-            await db.commit()
+
+        await write(_save)
 
     async def find_by_family(self, family_id: str) -> list[MenuItem]:
-        async with get_db() as db:
+        async with read_connection() as db:
             rows = await db.execute_fetchall(
                 "SELECT * FROM menu_items WHERE family_id = ? ORDER BY name",
                 (family_id,),
             )
-            return [
-                MenuItem(
-                    id=r["id"], family_id=r["family_id"], name=r["name"],
-                    emoji_icon=r["emoji_icon"], category=MenuCategory(r["category"]),
-                    created_at=_parse_dt(r["created_at"]),
-                )
-                for r in rows
-            ]
+            return [_menu_item(r) for r in rows]
 
     async def find_by_id(self, menu_item_id: str) -> MenuItem | None:
-        async with get_db() as db:
+        async with read_connection() as db:
             rows = await db.execute_fetchall(
                 "SELECT * FROM menu_items WHERE id = ?", (menu_item_id,)
             )
             if not rows:
                 return None
-            r = rows[0]
-            return MenuItem(
-                id=r["id"], family_id=r["family_id"], name=r["name"],
-                emoji_icon=r["emoji_icon"], category=MenuCategory(r["category"]),
-                created_at=_parse_dt(r["created_at"]),
+            return _menu_item(rows[0])
+
+    async def find_by_ids(self, family_id: str, menu_item_ids: list[str]) -> list[MenuItem]:
+        if not menu_item_ids:
+            return []
+        async with read_connection() as db:
+            rows = await db.execute_fetchall(
+                """SELECT * FROM menu_items
+                   WHERE family_id = ? AND id IN (SELECT value FROM json_each(?))""",
+                (family_id, json.dumps(menu_item_ids)),
             )
+        found = {r["id"]: _menu_item(r) for r in rows}
+        return [found[i] for i in dict.fromkeys(menu_item_ids) if i in found]
+
+
+# trigram 토크나이저는 3글자 미만 검색어를 인덱스로 찾지 못한다
+_TRIGRAM = 3
+
+# FTS5 인덱스(마이그레이션 v7)로 찾는다 - FTS 행에 저장된 원본 id로 원본 테이블 PK와 조인 (search_keys는 트리거만 쓴다)
+_FTS_SQL = """
+SELECT 'MENU' AS kind, m.id, NULL AS meal_call_id, m.name AS text, m.created_at AS occurred_at
+FROM menu_items_fts f JOIN menu_items m ON m.id = f.id
+WHERE menu_items_fts MATCH ?1 AND m.family_id = ?2
+UNION ALL
+SELECT 'MEAL_CALL', c.id, c.id, c.message, c.created_at
+FROM meal_calls_fts f JOIN meal_calls c ON c.id = f.id
+WHERE meal_calls_fts MATCH ?1 AND c.family_id = ?2
+UNION ALL
+SELECT 'RESPONSE', r.id, r.meal_call_id, r.custom_message, r.responded_at
+FROM meal_responses_fts f JOIN meal_responses r ON r.id = f.id
+JOIN meal_calls c ON c.id = r.meal_call_id
+WHERE meal_responses_fts MATCH ?1 AND c.family_id = ?2
+"""
+
+# 짧은 검색어는 가족 인덱스로 범위를 좁힌 뒤 부분 일치
+_SHORT_SQL = """
+SELECT 'MENU' AS kind, id, NULL AS meal_call_id, name AS text, created_at AS occurred_at
+FROM menu_items WHERE family_id = ?2 AND instr(lower(name), ?1) > 0
+UNION ALL
+SELECT 'MEAL_CALL', id, id, message, created_at
+FROM meal_calls WHERE family_id = ?2 AND instr(lower(message), ?1) > 0
+UNION ALL
+SELECT 'RESPONSE', r.id, r.meal_call_id, r.custom_message, r.responded_at
+FROM meal_calls c JOIN meal_responses r ON r.meal_call_id = c.id
+WHERE c.family_id = ?2 AND instr(lower(r.custom_message), ?1) > 0
+"""
+
+
+def _phrase(query: str) -> str:
+    # 검색어 전체를 FTS5 구문 하나로 - 연산자/특수문자를 그대로 검색
+    return '"' + query.replace('"', '""') + '"'
+
+
+class SqliteSearchRepository(SearchRepository):
+    async def search(self, family_id: str, query: str, limit: int = 20) -> list[SearchHit]:
+        query = query.strip().lower()
+        if not query:
+            return []
+        if len(query) >= _TRIGRAM:
+            sql, params = _FTS_SQL, (_phrase(query), family_id)
+        else:
+            sql, params = _SHORT_SQL, (query, family_id)
+        async with read_connection() as db:
+            rows = await db.execute_fetchall(sql, params)
+        # 세 결과를 합친 정렬은 인덱스로 할 수 없다 - 일치한 행만 메모리에서 고른다
+        hits = (
+            SearchHit(
+                kind=SearchHitKind(r["kind"]), id=r["id"], meal_call_id=r["meal_call_id"],
+                text=r["text"], occurred_at=_parse_dt(r["occurred_at"]),
+            )
+            for r in rows
+        )
+        return heapq.nlargest(limit, hits, key=lambda h: h.occurred_at)
@@ -1,10 +1,15 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header
+from fastapi.responses import StreamingResponse
 
 from src.notification.api.schemas import RegisterDeviceRequest, DeviceRegistrationResponse
 from src.notification.application.commands import RegisterDeviceCommand, UnregisterDeviceCommand
-from src.notification.domain.device_registration import DeviceRegistration
+from src.notification.application.command_handlers import (
+    RegisterDeviceHandler, UnregisterDeviceHandler,
+)
+from src.notification.infrastructure.event_stream import family_event_broker
 from src.notification.infrastructure.sqlite_device_repo import SqliteDeviceRepository
 from src.shared.api.dependencies import get_current_user, CurrentUser
+from src.shared.api.error_handlers import NotFoundError
 
 router = APIRouter(tags=["notification"])
 
@@ -17,12 +22,11 @@ async def register_device(
     body: RegisterDeviceRequest,
     current_user: CurrentUser = Depends(get_current_user),
 ):
-    repo = _repo()
-    reg = DeviceRegistration.create(
+    handler = RegisterDeviceHandler(_repo())
+    reg = await handler.handle(RegisterDeviceCommand(
         member_id=current_user.member_id,
         expo_push_token=body.expo_push_token,
-    )
-    await repo.save(reg)
+    ))
     return DeviceRegistrationResponse(
         id=reg.id, member_id=reg.member_id,
         expo_push_token=reg.expo_push_token,
@@ -32,5 +36,29 @@ async def register_device(
 
 @router.delete("/devices", status_code=204)
 async def unregister_device(current_user: CurrentUser = Depends(get_current_user)):
-    repo = _repo()
-    await repo.delete_by_member(current_user.member_id)
+    handler = UnregisterDeviceHandler(_repo())
+    await handler.handle(UnregisterDeviceCommand(member_id=current_user.member_id))
+
+
+@router.get(
+    "/families/{family_id}/events",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}}},
+)
+async def stream_family_events(
+    family_id: str,
+    last_event_id: str | None = Header(None),
+    current_user: CurrentUser = Depends(get_current_user),
+):
+    """밥먹자 생성/응답/재알림/완료 이벤트 스트림 (Server-Sent Events)
+
+    끊긴 뒤 Last-Event-ID로 다시 연결하면 놓친 이벤트를 이어서 받는다.
+    이어받을 수 없으면 reset 이벤트가 오고, 클라이언트는 상태를 다시 조회한다.
+    """
+    if family_id != current_user.family_id:
+        raise NotFoundError("가족", family_id)
+    return StreamingResponse(
+        family_event_broker.stream(family_id, last_event_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
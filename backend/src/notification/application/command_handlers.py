@@ -0,0 +1,29 @@
+from src.notification.application.commands import RegisterDeviceCommand, UnregisterDeviceCommand
+from src.notification.application.dto import DeviceRegistrationDto
+from src.notification.domain.device_registration import DeviceRegistration
+from src.notification.domain.repository import DeviceRegistrationRepository
+
+
+class RegisterDeviceHandler:
+    def __init__(self, repo: DeviceRegistrationRepository):
+        self._repo = repo
+
+    async def handle(self, cmd: RegisterDeviceCommand) -> DeviceRegistrationDto:
+        reg = DeviceRegistration.create(
+            member_id=cmd.member_id,
+            expo_push_token=cmd.expo_push_token,
+        )
+        await self._repo.save(reg)
+        return DeviceRegistrationDto(
+            id=reg.id, member_id=reg.member_id,
+            expo_push_token=reg.expo_push_token,
+            registered_at=reg.registered_at,
+        )
+
+
+class UnregisterDeviceHandler:
+    def __init__(self, repo: DeviceRegistrationRepository):
+        self._repo = repo
+
+    async def handle(self, cmd: UnregisterDeviceCommand) -> None:
+        await self._repo.delete_by_member(cmd.member_id)
@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass
+class DeviceRegistrationDto:
+    id: str
+    member_id: str
+    expo_push_token: str
+    registered_at: datetime
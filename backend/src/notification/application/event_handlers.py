@@ -1,7 +1,12 @@
+import json
 import logging
+from dataclasses import asdict
+
 from src.meal_call.domain.events import MealCallCreated, ReminderRequested
+from src.shared.domain.domain_event import DomainEvent
 from src.notification.domain.repository import DeviceRegistrationRepository
 from src.notification.domain.notification_service import PushNotificationService
+from src.notification.infrastructure.event_stream import FamilyEventBroker
 
 logger = logging.getLogger(__name__)
 
@@ -49,3 +54,19 @@ class MealCallNotificationHandler:
             data={"type": "MEAL_CALL_REMINDER", "meal_call_id": event.meal_call_id},
         )
         logger.info(f"Reminder push 발송: {len(tokens)}명, meal_call_id={event.meal_call_id}")
+
+
+class FamilyEventStreamHandler:
+    """가족 단위 도메인 이벤트를 SSE 구독자에게 전달"""
+
+    def __init__(self, broker: FamilyEventBroker):
+        self._broker = broker
+
+    async def on_event(self, event: DomainEvent) -> None:
+        data = asdict(event)
+        data["occurred_at"] = event.occurred_at.isoformat()
+        self._broker.publish(
+            event.family_id,  # type: ignore[attr-defined]
+            event.event_type(),
+            json.dumps(data, ensure_ascii=False),
+        )
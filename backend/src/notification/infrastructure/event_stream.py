@@ -0,0 +1,162 @@
+import asyncio
+import logging
+from collections import deque
+from dataclasses import dataclass
+from typing import AsyncIterator
+
+from src.config import SSE_HEARTBEAT_SECONDS, SSE_REPLAY_BUFFER_SIZE, SSE_CLIENT_QUEUE_SIZE
+from src.shared.infrastructure.change_tracker import BOOT_ID
+
+logger = logging.getLogger(__name__)
+
+# 재연결 대기 시간 (ms) - EventSource 기본값보다 길게
+_RETRY_MS = 3000
+
+
+@dataclass(frozen=True)
+class StreamEvent:
+    seq: int
+    name: str
+    data: str
+
+    @property
+    def id(self) -> str:
+        return f"{BOOT_ID}-{self.seq}"
+
+    def encode(self) -> bytes:
+        return f"id: {self.id}\nevent: {self.name}\ndata: {self.data}\n\n".encode()
+
+
+@dataclass
+class StreamStats:
+    families: int
+    subscribers: int
+    published: int
+    dropped: int
+
+
+class _FamilyBuffer:
+    __slots__ = ("events", "evicted_seq")
+
+    def __init__(self, size: int):
+        self.events: deque[StreamEvent] = deque(maxlen=size)
+        self.evicted_seq = 0  # 링 버퍼에서 밀려난 마지막 이벤트 번호
+
+    def append(self, event: StreamEvent) -> None:
+        if len(self.events) == self.events.maxlen:
+            self.evicted_seq = self.events[0].seq
+        self.events.append(event)
+
+
+class _Subscriber:
+    __slots__ = ("queue", "dropped")
+
+    def __init__(self, queue_size: int):
+        self.queue: asyncio.Queue[StreamEvent] = asyncio.Queue(maxsize=queue_size)
+        self.dropped = False
+
+
+class FamilyEventBroker:
+    """가족별 Server-Sent Events 팬아웃 (단일 프로세스)
+
+    가족마다 최근 이벤트를 링 버퍼(replay_buffer_size)에 남겨 Last-Event-ID로
+    이어받을 수 있게 한다. 구독자는 크기가 제한된 큐를 하나씩 가지며, 큐가
+    가득 찰 만큼 느린 구독자는 끊는다 - 발행 쪽은 절대 기다리지 않는다.
+    """
+
+    def __init__(
+        self,
+        replay_buffer_size: int = 100,
+        client_queue_size: int = 64,
+        heartbeat: float = 15.0,
+    ):
+        self._replay_buffer_size = replay_buffer_size
+        self._client_queue_size = client_queue_size
+        self._heartbeat = heartbeat
+        self._seq = 0
+        self._buffers: dict[str, _FamilyBuffer] = {}
+        self._subscribers: dict[str, set[_Subscriber]] = {}
+        self._dropped = 0
+
+    def publish(self, family_id: str, name: str, data: str) -> StreamEvent:
+        self._seq += 1
+        event = StreamEvent(self._seq, name, data)
+        buffer = self._buffers.get(family_id)
+        if buffer is None:
+            buffer = self._buffers[family_id] = _FamilyBuffer(self._replay_buffer_size)
+        buffer.append(event)
+
+        for sub in list(self._subscribers.get(family_id, ())):
+            try:
+                sub.queue.put_nowait(event)
+            except asyncio.QueueFull:
+                sub.dropped = True
+                self._unsubscribe(family_id, sub)
+                self._dropped += 1
+                logger.warning(f"SSE 구독자가 느려 연결을 끊습니다: family_id={family_id}")
+        return event
+
+    async def stream(self, family_id: str, last_event_id: str | None = None) -> AsyncIterator[bytes]:
+        """SSE 본문 - 놓친 이벤트 재전송 후 새 이벤트와 heartbeat를 보낸다
+
+        Last-Event-ID가 버퍼 밖이거나 이전 프로세스의 것이면 reset 이벤트를
+        보낸다 (클라이언트는 전체 상태를 다시 조회해야 한다).
+        """
+        # 구독 등록과 재전송 목록 계산 사이에 await가 없으므로 이벤트가 빠지거나 겹치지 않는다
+        sub = _Subscriber(self._client_queue_size)
+        self._subscribers.setdefault(family_id, set()).add(sub)
+        replay, reset = self._replay(family_id, last_event_id)
+        try:
+            yield f"retry: {_RETRY_MS}\n\n".encode()
+            if reset:
+                yield b"event: reset\ndata: {}\n\n"
+            for event in replay:
+                yield event.encode()
+            while not sub.dropped:
+                try:
+                    async with asyncio.timeout(self._heartbeat):
+                        event = await sub.queue.get()
+                except TimeoutError:
+                    yield b": heartbeat\n\n"
+                    continue
+                yield event.encode()
+        finally:
+            self._unsubscribe(family_id, sub)
+
+    def stats(self) -> StreamStats:
+        return StreamStats(
+            families=len(self._buffers),
+            subscribers=sum(len(s) for s in self._subscribers.values()),
+            published=self._seq,
+            dropped=self._dropped,
+        )
+
+    def _replay(self, family_id: str, last_event_id: str | None) -> tuple[list[StreamEvent], bool]:
+        if not last_event_id:
+            return [], False
+        boot_id, _, seq = last_event_id.rpartition("-")
+        if boot_id != BOOT_ID or not seq.isdigit():
+            return [], True
+        last_seq = int(seq)
+        buffer = self._buffers.get(family_id)
+        if buffer is None:
+            return [], False
+        # 놓친 이벤트가 이미 링 버퍼에서 밀려났다면 이어받을 수 없다
+        if last_seq < buffer.evicted_seq:
+            return [], True
+        return [e for e in buffer.events if e.seq > last_seq], False
+
+    def _unsubscribe(self, family_id: str, sub: _Subscriber) -> None:
+        subs = self._subscribers.get(family_id)
+        if subs is None:
+            return
+        subs.discard(sub)
+        if not subs:
+            del self._subscribers[family_id]
+
+
+family_event_broker = FamilyEventBroker(
+    replay_buffer_size=SSE_REPLAY_BUFFER_SIZE,
+    client_queue_size=SSE_CLIENT_QUEUE_SIZE,
+    heartbeat=SSE_HEARTBEAT_SECONDS,
+)
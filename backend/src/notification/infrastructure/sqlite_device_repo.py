@@ -2,7 +2,7 @@ from datetime import datetime, timezone
 
 from src.notification.domain.device_registration import DeviceRegistration
 from src.notification.domain.repository import DeviceRegistrationRepository
-from src.shared.infrastructure.database import get_db
+from src.shared.infrastructure.database import read_connection, write
 
 
 def _parse_dt(s: str) -> datetime:
@@ -14,7 +14,7 @@ def _parse_dt(s: str) -> datetime:
 
 class SqliteDeviceRepository(DeviceRegistrationRepository):
     async def save(self, reg: DeviceRegistration) -> None:
-        async with get_db() as db:
+        async def _save(db) -> None:
             # member당 1개 토큰 (upsert by member_id)
             await db.execute(
                 """INSERT INTO device_registrations (id, member_id, expo_push_token, registered_at)
@@ -24,10 +24,11 @@ class SqliteDeviceRepository(DeviceRegistrationRepository):
                      registered_at = excluded.registered_at""",
                 (reg.id, reg.member_id, reg.expo_push_token, reg.registered_at.isoformat()),
             )
-            await db.commit()
+
+        await write(_save)
 
     async def find_by_member(self, member_id: str) -> DeviceRegistration | None:
-        async with get_db() as db:
+        async with read_connection() as db:
             rows = await db.execute_fetchall(
                 "SELECT * FROM device_registrations WHERE member_id = ?", (member_id,)
             )
@@ -41,7 +42,7 @@ class SqliteDeviceRepository(DeviceRegistrationRepository):
             )
 
     async def find_by_family(self, family_id: str) -> list[DeviceRegistration]:
-        async with get_db() as db:
+        async with read_connection() as db:
             rows = await db.execute_fetchall(
                 """SELECT dr.* FROM device_registrations dr
                    JOIN members m ON dr.member_id = m.id
@@ -61,7 +62,7 @@ class SqliteDeviceRepository(DeviceRegistrationRepository):
         if not member_ids:
             return []
         placeholders = ",".join("?" * len(member_ids))
-        async with get_db() as db:
+        async with read_connection() as db:
             rows = await db.execute_fetchall(
                 f"SELECT * FROM device_registrations WHERE member_id IN ({placeholders})",
                 tuple(member_ids),
@@ -76,8 +77,9 @@ class SqliteDeviceRepository(DeviceRegistrationRepository):
             ]
 
     async def delete_by_member(self, member_id: str) -> None:
-        async with get_db() as db:
+        async def _delete(db) -> None:
             await db.execute(
                 "DELETE FROM device_registrations WHERE member_id = ?", (member_id,)
             )
-            await db.commit()
+
+        await write(_delete)
@@ -1,30 +1,102 @@
+import hashlib
+import time
+from typing import Callable
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 import jwt
-from src.config import JWT_SECRET_KEY, JWT_ALGORITHM
+from src.config import (
+    JWT_SECRET_KEY, JWT_ALGORITHM, AUTH_TOKEN_CACHE_SIZE, AUTH_TOKEN_CACHE_TTL_SECONDS,
+)
+from src.shared.infrastructure.cache import LruTtlCache
+from src.shared.infrastructure.token_revocation import revoked_tokens
 
 security = HTTPBearer()
 
 
 class CurrentUser:
-    def __init__(self, member_id: str, family_id: str, nickname: str, role: str):
+    __slots__ = ("member_id", "family_id", "nickname", "role", "token_id", "token_expires_at")
+
+    def __init__(
+        self,
+        member_id: str,
+        family_id: str,
+        nickname: str,
+        role: str,
+        token_id: str | None = None,
+        token_expires_at: int | None = None,
+    ):
         self.member_id = member_id
         self.family_id = family_id
         self.nickname = nickname
         self.role = role
+        self.token_id = token_id                  # jti (폐기 확인/로그아웃용)
+        self.token_expires_at = token_expires_at  # exp (epoch 초)
+
+
+class VerifiedTokenCache:
+    """서명 검증을 마친 access token → CurrentUser
+
+    같은 토큰이 하루에 수백 번 오므로 검증 결과를 토큰 해시(sha256)로 캐시한다
+    (원문 토큰은 메모리에 두지 않는다). 항목은 토큰의 exp와 max_ttl 중 먼저
+    오는 시점에 만료되고, 폐기된 토큰은 invalidate로 바로 뺀다.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 4096,
+        max_ttl: float = 600.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        self._max_ttl = max_ttl
+        self._clock = clock
+        # exp가 벽시계 기준이라 캐시도 같은 시계를 쓴다
+        self._cache: LruTtlCache[bytes, CurrentUser] = LruTtlCache(
+            "verified_token", max_size=max_size, ttl=max_ttl, clock=clock,
+        )
+
+    def get(self, token: str) -> CurrentUser | None:
+        return self._cache.get(self._key(token))
+
+    def put(self, token: str, user: CurrentUser, expires_at: float) -> None:
+        remaining = expires_at - self._clock()
+        if remaining > 0:
+            self._cache.put(self._key(token), user, ttl=min(remaining, self._max_ttl))
+
+    def invalidate(self, token: str) -> None:
+        self._cache.invalidate(self._key(token))
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+
+verified_tokens = VerifiedTokenCache(
+    max_size=AUTH_TOKEN_CACHE_SIZE, max_ttl=AUTH_TOKEN_CACHE_TTL_SECONDS,
+)
 
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
 ) -> CurrentUser:
     token = credentials.credentials
+    # 대부분의 요청은 여기서 끝난다 - 서명 검증 없이 dict 조회 한 번 (+ 폐기 필터)
+    user = verified_tokens.get(token)
+    if user is not None:
+        _reject_if_revoked(user)
+        return user
     try:
         payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
-        return CurrentUser(
+        user = CurrentUser(
             member_id=payload["sub"],
             family_id=payload["family_id"],
             nickname=payload["nickname"],
             role=payload["role"],
+            token_id=payload.get("jti"),
+            token_expires_at=payload["exp"],
         )
     except jwt.ExpiredSignatureError:
         raise HTTPException(
@@ -36,3 +108,15 @@ async def get_current_user(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="유효하지 않은 토큰입니다",
         )
+    _reject_if_revoked(user)
+    verified_tokens.put(token, user, payload["exp"])
+    return user
+
+
+def _reject_if_revoked(user: CurrentUser) -> None:
+    # 메모리 필터만 본다 - 요청마다 DB를 읽지 않는다
+    if revoked_tokens.is_revoked(user.token_id):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="폐기된 토큰입니다",
+        )
@@ -1,6 +1,8 @@
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 
+from src.shared.infrastructure.connection_pool import PoolTimeoutError
+
 
 class DomainError(Exception):
     """도메인 비즈니스 규칙 위반"""
@@ -21,6 +23,22 @@ class ConflictError(DomainError):
         super().__init__(message, "CONFLICT")
 
 
+class ConcurrencyError(ConflictError):
+    """낙관적 잠금 실패 - 읽은 뒤 다른 요청이 먼저 애그리거트를 바꿨다 (핸들러가 재시도)"""
+    def __init__(self, resource: str, id: str):
+        super().__init__(f"{resource}이(가) 동시에 변경되었습니다. 다시 시도해주세요: {id}")
+        self.code = "CONCURRENT_MODIFICATION"
+        self.resource = resource
+
+
+class OverloadedError(Exception):
+    """처리 용량 초과 - 대기열에 넣지 않고 바로 503 (클라이언트가 잠시 후 재시도)"""
+    def __init__(self, message: str = "서버가 혼잡합니다. 잠시 후 다시 시도해주세요", code: str = "OVERLOADED"):
+        super().__init__(message)
+        self.message = message
+        self.code = code
+
+
 def register_error_handlers(app: FastAPI) -> None:
     @app.exception_handler(DomainError)
     async def domain_error_handler(request: Request, exc: DomainError):
@@ -32,6 +50,21 @@ def register_error_handlers(app: FastAPI) -> None:
             content={"error": exc.code, "message": exc.message},
         )
 
+    @app.exception_handler(PoolTimeoutError)
+    async def pool_timeout_handler(request: Request, exc: PoolTimeoutError):
+        return JSONResponse(
+            status_code=503,
+            content={"error": "DB_BUSY", "message": "서버가 혼잡합니다. 잠시 후 다시 시도해주세요"},
+        )
+
+    @app.exception_handler(OverloadedError)
+    async def overloaded_handler(request: Request, exc: OverloadedError):
+        return JSONResponse(
+            status_code=503,
+            content={"error": exc.code, "message": exc.message},
+            headers={"Retry-After": "1"},
+        )
+
     @app.exception_handler(Exception)
     async def generic_error_handler(request: Request, exc: Exception):
         return JSONResponse(
@@ -0,0 +1,30 @@
+from fastapi import Request, Response
+
+from src.shared.infrastructure.change_tracker import BOOT_ID
+
+# 응답이 사용자(가족)별이므로 공유 캐시 금지, 매번 재검증
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(version: int, *parts: str) -> str:
+    """변경 카운터 기반 강한 ETag"""
+    return '"' + "-".join((BOOT_ID, str(version), *parts)) + '"'
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """If-None-Match가 현재 ETag와 일치하는지 (RFC 9110 약한 비교)"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in header.split(","))
+
+
+def not_modified_response(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
+
+
+def set_etag(response: Response, etag: str) -> None:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
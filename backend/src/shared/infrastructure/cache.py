@@ -0,0 +1,119 @@
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_MISSING = object()
+
+# /health에 노출할 캐시 (이름 → 캐시)
+_registry: dict[str, "LruTtlCache"] = {}
+
+
+@dataclass
+class CacheStats:
+    size: int
+    max_size: int
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    invalidations: int
+    hit_rate: float
+
+
+class LruTtlCache(Generic[K, V]):
+    """프로세스 내 LRU + TTL 캐시 (단일 이벤트 루프 전용, 잠금 없음)
+
+    max_size를 넘으면 가장 오래 안 쓴 항목부터 버리고, ttl이 지난 항목은
+    조회 시점에 만료시킨다. None도 값으로 캐시된다.
+
+    get_or_load는 로딩 중에 invalidate가 있었으면 결과를 캐시하지 않는다 -
+    이벤트로 무효화된 직후 이전 상태가 다시 들어가는 것을 막는다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_size: int = 1024,
+        ttl: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_size < 1:
+            raise ValueError("캐시 크기는 1 이상이어야 합니다")
+        self._max_size = max_size
+        self._ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[K, tuple[V, float]] = OrderedDict()
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+        _registry[name] = self
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        value = self._lookup(key)
+        return default if value is _MISSING else value
+
+    def put(self, key: K, value: V, ttl: float | None = None) -> None:
+        """ttl을 주면 이 항목만 기본 ttl 대신 그 시간 뒤에 만료"""
+        self._entries[key] = (value, self._clock() + (self._ttl if ttl is None else ttl))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    async def get_or_load(self, key: K, loader: Callable[[], Awaitable[V]]) -> V:
+        value = self._lookup(key)
+        if value is not _MISSING:
+            return value
+        generation = self._generation
+        value = await loader()
+        if generation == self._generation:
+            self.put(key, value)
+        return value
+
+    def invalidate(self, *keys: K) -> None:
+        self._generation += 1
+        for key in keys:
+            if self._entries.pop(key, None) is not None:
+                self._invalidations += 1
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            size=len(self._entries),
+            max_size=self._max_size,
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            expirations=self._expirations,
+            invalidations=self._invalidations,
+            hit_rate=self._hits / lookups if (lookups := self._hits + self._misses) else 0.0,
+        )
+
+    def _lookup(self, key: K):
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return _MISSING
+        value, expires_at = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            self._expirations += 1
+            self._misses += 1
+            return _MISSING
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return value
+
+
+def cache_stats() -> dict:
+    return {name: asdict(cache.stats()) for name, cache in _registry.items()}
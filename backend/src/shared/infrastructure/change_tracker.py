@@ -0,0 +1,63 @@
+import asyncio
+import uuid
+
+# 프로세스마다 새로 만든다 - 재시작 후 카운터가 0부터 다시 시작해도 이전 ETag와 겹치지 않도록
+BOOT_ID = uuid.uuid4().hex[:12]
+
+
+class _Signal:
+    __slots__ = ("event", "waiting")
+
+    def __init__(self):
+        self.event = asyncio.Event()
+        self.waiting = 0
+
+
+class ChangeTracker:
+    """키(가족)별 변경 카운터 - 프로세스 내 메모리, 이벤트 구독자가 올린다
+
+    값은 단조 증가만 하며 재시작하면 초기화된다. 외부에 노출할 때는
+    BOOT_ID와 함께 써야 한다.
+
+    wait_for_change로 다음 변경까지 기다릴 수 있다. 같은 키를 기다리는
+    요청들은 asyncio.Event 하나를 공유하므로 대기자당 메모리는 일정하고,
+    bump 한 번에 모두 깨어난다.
+    """
+
+    def __init__(self):
+        self._versions: dict[str, int] = {}
+        self._signals: dict[str, _Signal] = {}
+
+    def version(self, key: str) -> int:
+        return self._versions.get(key, 0)
+
+    def bump(self, key: str) -> int:
+        version = self._versions.get(key, 0) + 1
+        self._versions[key] = version
+        signal = self._signals.pop(key, None)
+        if signal is not None:
+            signal.event.set()
+        return version
+
+    def waiting(self) -> int:
+        return sum(s.waiting for s in self._signals.values())
+
+    async def wait_for_change(self, key: str, since: int, timeout: float) -> int:
+        """버전이 since와 다르면 즉시, 아니면 변경되거나 timeout까지 기다린 뒤 현재 버전 반환"""
+        if self.version(key) != since:
+            return self.version(key)
+        signal = self._signals.get(key)
+        if signal is None:
+            signal = self._signals[key] = _Signal()
+        signal.waiting += 1
+        try:
+            async with asyncio.timeout(timeout):
+                await signal.event.wait()
+        except TimeoutError:
+            pass
+        finally:
+            signal.waiting -= 1
+            # 아무도 기다리지 않는 신호는 치운다 (bump로 이미 빠졌으면 그대로)
+            if signal.waiting == 0 and self._signals.get(key) is signal:
+                del self._signals[key]
+        return self.version(key)
@@ -0,0 +1,171 @@
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncGenerator, Awaitable, Callable
+
+import aiosqlite
+
+logger = logging.getLogger(__name__)
+
+Connector = Callable[[], Awaitable[aiosqlite.Connection]]
+
+
+class PoolTimeoutError(Exception):
+    """제한 시간 내에 풀에서 연결을 얻지 못함"""
+
+
+@dataclass
+class PoolStats:
+    size: int
+    idle: int
+    in_use: int
+    waiting: int
+    acquired_total: int
+    timeouts: int
+    created: int
+    recycled: int
+
+
+class ConnectionPool:
+    """앱 수명 동안 유지되는 aiosqlite 연결 풀
+
+    연결은 open() 시점에 미리 만들어 두고(PRAGMA 포함) 요청마다 빌려준다.
+    오래 쉬고 있던 연결은 빌려주기 전에 SELECT 1로 상태를 확인하고,
+    실패하면 새 연결로 교체한다.
+    """
+
+    def __init__(
+        self,
+        connect: Connector,
+        size: int = 4,
+        acquire_timeout: float = 5.0,
+        health_check_interval: float = 30.0,
+    ):
+        if size < 1:
+            raise ValueError("풀 크기는 1 이상이어야 합니다")
+        self._connect = connect
+        self._size = size
+        self._acquire_timeout = acquire_timeout
+        self._health_check_interval = health_check_interval
+        # LIFO: 가장 최근에 쓴(따뜻한) 연결부터 재사용
+        self._idle: asyncio.LifoQueue[tuple[aiosqlite.Connection, float]] = asyncio.LifoQueue()
+        self._all: set[aiosqlite.Connection] = set()
+        self._closed = True
+        self._waiting = 0
+        self._acquired_total = 0
+        self._timeouts = 0
+        self._created = 0
+        self._recycled = 0
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    async def open(self) -> None:
+        for _ in range(self._size):
+            conn = await self._new_connection()
+            self._idle.put_nowait((conn, time.monotonic()))
+        self._closed = False
+
+    async def close(self) -> None:
+        self._closed = True
+        conns = list(self._all)
+        self._all.clear()
+        while not self._idle.empty():
+            self._idle.get_nowait()
+        for conn in conns:
+            try:
+                await conn.close()
+            except Exception as e:
+                logger.warning(f"DB 연결 종료 실패: {e}")
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncGenerator[aiosqlite.Connection, None]:
+        conn = await self._checkout()
+        try:
+            yield conn
+        finally:
+            await self._checkin(conn)
+
+    def stats(self) -> PoolStats:
+        idle = self._idle.qsize()
+        return PoolStats(
+            size=self._size,
+            idle=idle,
+            in_use=len(self._all) - idle,
+            waiting=self._waiting,
+            acquired_total=self._acquired_total,
+            timeouts=self._timeouts,
+            created=self._created,
+            recycled=self._recycled,
+        )
+
+    async def _new_connection(self) -> aiosqlite.Connection:
+        conn = await self._connect()
+        self._all.add(conn)
+        self._created += 1
+        return conn
+
+    async def _checkout(self) -> aiosqlite.Connection:
+        if self._closed:
+            raise RuntimeError("DB 연결 풀이 열려 있지 않습니다")
+        self._waiting += 1
+        try:
+            conn, last_used = await asyncio.wait_for(
+                self._idle.get(), timeout=self._acquire_timeout
+            )
+        except asyncio.TimeoutError:
+            self._timeouts += 1
+            raise PoolTimeoutError(
+                f"{self._acquire_timeout}초 안에 DB 연결을 얻지 못했습니다"
+            )
+        finally:
+            self._waiting -= 1
+
+        if time.monotonic() - last_used > self._health_check_interval:
+            conn = await self._ensure_healthy(conn)
+        self._acquired_total += 1
+        return conn
+
+    async def _checkin(self, conn: aiosqlite.Connection) -> None:
+        if conn not in self._all:
+            # close() 이후 반납된 연결
+            await conn.close()
+            return
+        try:
+            if conn.in_transaction:
+                # 커밋되지 않은 작업이 다음 사용자에게 새어 나가지 않도록
+                await conn.rollback()
+        except Exception as e:
+            logger.warning(f"반납된 DB 연결 롤백 실패, 교체합니다: {e}")
+            try:
+                conn = await self._replace(conn)
+            except Exception as e:
+                logger.error(f"DB 연결 교체 실패: {e}")
+        self._idle.put_nowait((conn, time.monotonic()))
+
+    async def _ensure_healthy(self, conn: aiosqlite.Connection) -> aiosqlite.Connection:
+        try:
+            await conn.execute("SELECT 1")
+            return conn
+        except Exception as e:
+            logger.warning(f"DB 연결 헬스체크 실패, 교체합니다: {e}")
+            try:
+                return await self._replace(conn)
+            except Exception:
+                # 교체도 실패하면 슬롯을 돌려놓고 호출자에게 오류 전달
+                self._idle.put_nowait((conn, time.monotonic()))
+                raise
+
+    async def _replace(self, conn: aiosqlite.Connection) -> aiosqlite.Connection:
+        # 새 연결을 먼저 만든다 - 실패하면 기존 연결이 슬롯을 그대로 유지
+        new_conn = await self._new_connection()
+        self._all.discard(conn)
+        try:
+            await conn.close()
+        except Exception:
+            pass
+        self._recycled += 1
+        return new_conn
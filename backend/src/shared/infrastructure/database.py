@@ -1,118 +1,122 @@
 import aiosqlite
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from dataclasses import asdict
+from typing import AsyncGenerator, TypeVar
 
-from src.config import DB_PATH
+from src.config import (
+    DB_PATH, DB_POOL_SIZE, DB_POOL_ACQUIRE_TIMEOUT, DB_POOL_HEALTH_CHECK_INTERVAL,
+    DB_BUSY_TIMEOUT_MS, DB_GROUP_COMMIT_WINDOW_MS, DB_GROUP_COMMIT_MAX_BATCH,
+)
+from src.shared.infrastructure.connection_pool import ConnectionPool
+from src.shared.infrastructure.migrations import migrate
+from src.shared.infrastructure.sqlite_writer import SqliteWriter, WriteFn
+from src.shared.infrastructure.unit_of_work import current_unit_of_work
 import os
 
+T = TypeVar("T")
+
+# 읽기: query_only 연결 풀 / 쓰기: 단일 연결 + 큐
+_read_pool: ConnectionPool | None = None
+_writer: SqliteWriter | None = None
+
 
 async def init_db() -> None:
-    """앱 시작 시 DB 파일 및 테이블 초기화"""
+    """앱 시작 시 DB 파일 생성 및 스키마 마이그레이션 (최신이면 DDL 생략)"""
     os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
-    async with aiosqlite.connect(DB_PATH) as db:
-        await db.execute("PRAGMA journal_mode=WAL")
-        await db.execute("PRAGMA foreign_keys=ON")
-        await _create_tables(db)
-        await db.commit()
-
-
-async def _create_tables(db: aiosqlite.Connection) -> None:
-    # Identity & Access
-    await db.execute("""
-        CREATE TABLE IF NOT EXISTS families (
-            id TEXT PRIMARY KEY,
-            name TEXT NOT NULL,
-            created_at TEXT NOT NULL
-        )
-    """)
-    await db.execute("""
-        CREATE TABLE IF NOT EXISTS members (
-            id TEXT PRIMARY KEY,
-            family_id TEXT NOT NULL,
-            nickname TEXT NOT NULL,
-            hashed_pin TEXT NOT NULL,
-            role TEXT NOT NULL DEFAULT 'MEMBER',
-            created_at TEXT NOT NULL,
-            FOREIGN KEY (family_id) REFERENCES families(id),
-            UNIQUE (family_id, nickname)
-        )
-    """)
-    await db.execute("""
-        CREATE TABLE IF NOT EXISTS invite_links (
-            id TEXT PRIMARY KEY,
-            family_id TEXT NOT NULL,
-            token TEXT NOT NULL UNIQUE,
-            expires_at TEXT NOT NULL,
-            max_uses INTEGER NOT NULL DEFAULT 1,
-            used_count INTEGER NOT NULL DEFAULT 0,
-            created_by TEXT NOT NULL,
-            FOREIGN KEY (family_id) REFERENCES families(id)
-        )
-    """)
-    # Meal Call
-    await db.execute("""
-        CREATE TABLE IF NOT EXISTS menu_items (
-            id TEXT PRIMARY KEY,
-            family_id TEXT NOT NULL,
-            name TEXT NOT NULL,
-            emoji_icon TEXT NOT NULL DEFAULT '🍽️',
-            category TEXT NOT NULL DEFAULT 'ETC',
-            created_at TEXT NOT NULL,
-            FOREIGN KEY (family_id) REFERENCES families(id)
-        )
-    """)
-    await db.execute("""
-        CREATE TABLE IF NOT EXISTS meal_calls (
-            id TEXT PRIMARY KEY,
-            family_id TEXT NOT NULL,
-            caller_id TEXT NOT NULL,
-            message TEXT,
-            status TEXT NOT NULL DEFAULT 'ACTIVE',
-            created_at TEXT NOT NULL,
-            completed_at TEXT,
-            FOREIGN KEY (family_id) REFERENCES families(id),
-            FOREIGN KEY (caller_id) REFERENCES members(id)
-        )
-    """)
-    await db.execute("""
-        CREATE TABLE IF NOT EXISTS meal_call_menus (
-            meal_call_id TEXT NOT NULL,
-            menu_item_id TEXT NOT NULL,
-            PRIMARY KEY (meal_call_id, menu_item_id),
-            FOREIGN KEY (meal_call_id) REFERENCES meal_calls(id),
-            FOREIGN KEY (menu_item_id) REFERENCES menu_items(id)
-        )
-    """)
-    await db.execute("""
-        CREATE TABLE IF NOT EXISTS meal_responses (
-            id TEXT PRIMARY KEY,
-            meal_call_id TEXT NOT NULL,
-            member_id TEXT NOT NULL,
-            response_type TEXT NOT NULL,
-            custom_message TEXT,
-            responded_at TEXT NOT NULL,
-            FOREIGN KEY (meal_call_id) REFERENCES meal_calls(id),
-            FOREIGN KEY (member_id) REFERENCES members(id),
-            UNIQUE (meal_call_id, member_id)
-        )
-    """)
-    # Notification
-    await db.execute("""
-        CREATE TABLE IF NOT EXISTS device_registrations (
-            id TEXT PRIMARY KEY,
-            member_id TEXT NOT NULL,
-            expo_push_token TEXT NOT NULL,
-            registered_at TEXT NOT NULL,
-            FOREIGN KEY (member_id) REFERENCES members(id),
-            UNIQUE (member_id)
-        )
-    """)
+    db = await _connect()
+    try:
+        await migrate(db)
+    finally:
+        await db.close()
+
+
+async def _connect() -> aiosqlite.Connection:
+    db = await aiosqlite.connect(DB_PATH)
+    db.row_factory = aiosqlite.Row
+    await db.execute("PRAGMA journal_mode=WAL")
+    await db.execute("PRAGMA foreign_keys=ON")
+    await db.execute(f"PRAGMA busy_timeout={DB_BUSY_TIMEOUT_MS}")
+    return db
+
+
+async def _connect_read_only() -> aiosqlite.Connection:
+    db = await _connect()
+    await db.execute("PRAGMA query_only=ON")
+    return db
+
+
+async def open_db() -> None:
+    """앱 시작 시 읽기 풀과 writer 생성 (lifespan에서 호출)"""
+    global _read_pool, _writer
+    await close_db()
+    read_pool = ConnectionPool(
+        _connect_read_only,
+        size=DB_POOL_SIZE,
+        acquire_timeout=DB_POOL_ACQUIRE_TIMEOUT,
+        health_check_interval=DB_POOL_HEALTH_CHECK_INTERVAL,
+    )
+    await read_pool.open()
+    writer = SqliteWriter(
+        _connect,
+        group_commit_window=DB_GROUP_COMMIT_WINDOW_MS / 1000,
+        max_batch=DB_GROUP_COMMIT_MAX_BATCH,
+    )
+    await writer.open()
+    _read_pool, _writer = read_pool, writer
+
+
+async def close_db() -> None:
+    global _read_pool, _writer
+    if _writer is not None:
+        await _writer.close()
+        _writer = None
+    if _read_pool is not None:
+        await _read_pool.close()
+        _read_pool = None
+
+
+def db_stats() -> dict:
+    if _read_pool is None or _writer is None:
+        raise RuntimeError("DB가 초기화되지 않았습니다 (open_db 필요)")
+    return {
+        "read_pool": asdict(_read_pool.stats()),
+        "writer": asdict(_writer.stats()),
+    }
 
 
 @asynccontextmanager
-async def get_db() -> AsyncGenerator[aiosqlite.Connection, None]:
-    async with aiosqlite.connect(DB_PATH) as db:
-        db.row_factory = aiosqlite.Row
-        await db.execute("PRAGMA journal_mode=WAL")
-        await db.execute("PRAGMA foreign_keys=ON")
+async def read_connection() -> AsyncGenerator[aiosqlite.Connection, None]:
+    """읽기 전용 풀에서 연결을 빌려 사용 후 반납 - 쓰기 작업을 기다리지 않는다"""
+    if _read_pool is None:
+        raise RuntimeError("DB가 초기화되지 않았습니다 (open_db 필요)")
+    async with _read_pool.acquire() as db:
         yield db
+
+
+async def write(fn: WriteFn) -> None:
+    """fn(db)을 단일 writer 연결의 큐에 넣고 커밋될 때까지 대기
+
+    UnitOfWork 블록 안에서는 바로 실행하지 않고 작업 단위에 등록만 한다.
+    fn의 반환값은 버린다 - 결과가 필요하면 write_returning을 쓴다.
+    """
+    uow = current_unit_of_work()
+    if uow is not None:
+        uow.register(fn)
+        return
+    await _writer_or_raise().write(fn)
+
+
+async def write_returning(fn: WriteFn[T]) -> T:
+    """write와 같지만 커밋된 fn(db)의 결과를 돌려준다
+
+    결과는 실행해야 알 수 있으므로 UnitOfWork 블록 안에서는 쓸 수 없다 (RuntimeError).
+    """
+    if current_unit_of_work() is not None:
+        raise RuntimeError("결과를 돌려받는 쓰기는 UnitOfWork 안에서 호출할 수 없습니다")
+    return await _writer_or_raise().write(fn)
+
+
+def _writer_or_raise() -> SqliteWriter:
+    if _writer is None:
+        raise RuntimeError("DB가 초기화되지 않았습니다 (open_db 필요)")
+    return _writer
@@ -0,0 +1,315 @@
+import logging
+from dataclasses import dataclass
+
+import aiosqlite
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    description: str
+    statements: tuple[str, ...]
+
+
+# 스키마 변경은 여기에 새 버전을 추가한다 (기존 항목은 수정하지 않는다).
+# 적용 상태는 PRAGMA user_version에 기록된다.
+MIGRATIONS: tuple[Migration, ...] = (
+    Migration(1, "initial schema", (
+        # Identity & Access
+        """
+        CREATE TABLE IF NOT EXISTS families (
+            id TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            created_at TEXT NOT NULL
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS members (
+            id TEXT PRIMARY KEY,
+            family_id TEXT NOT NULL,
+            nickname TEXT NOT NULL,
+            hashed_pin TEXT NOT NULL,
+            role TEXT NOT NULL DEFAULT 'MEMBER',
+            created_at TEXT NOT NULL,
+            FOREIGN KEY (family_id) REFERENCES families(id),
+            UNIQUE (family_id, nickname)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS invite_links (
+            id TEXT PRIMARY KEY,
+            family_id TEXT NOT NULL,
+            token TEXT NOT NULL UNIQUE,
+            expires_at TEXT NOT NULL,
+            max_uses INTEGER NOT NULL DEFAULT 1,
+            used_count INTEGER NOT NULL DEFAULT 0,
+            created_by TEXT NOT NULL,
+            FOREIGN KEY (family_id) REFERENCES families(id)
+        )
+        """,
+        # Meal Call
+        """
+        CREATE TABLE IF NOT EXISTS menu_items (
+            id TEXT PRIMARY KEY,
+            family_id TEXT NOT NULL,
+            name TEXT NOT NULL,
+            emoji_icon TEXT NOT NULL DEFAULT '🍽️',
+            category TEXT NOT NULL DEFAULT 'ETC',
+            created_at TEXT NOT NULL,
+            FOREIGN KEY (family_id) REFERENCES families(id)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS meal_calls (
+            id TEXT PRIMARY KEY,
+            family_id TEXT NOT NULL,
+            caller_id TEXT NOT NULL,
+            message TEXT,
+            status TEXT NOT NULL DEFAULT 'ACTIVE',
+            created_at TEXT NOT NULL,
+            completed_at TEXT,
+            FOREIGN KEY (family_id) REFERENCES families(id),
+            FOREIGN KEY (caller_id) REFERENCES members(id)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS meal_call_menus (
+            meal_call_id TEXT NOT NULL,
+            menu_item_id TEXT NOT NULL,
+            PRIMARY KEY (meal_call_id, menu_item_id),
+            FOREIGN KEY (meal_call_id) REFERENCES meal_calls(id),
+            FOREIGN KEY (menu_item_id) REFERENCES menu_items(id)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS meal_responses (
+            id TEXT PRIMARY KEY,
+            meal_call_id TEXT NOT NULL,
+            member_id TEXT NOT NULL,
+            response_type TEXT NOT NULL,
+            custom_message TEXT,
+            responded_at TEXT NOT NULL,
+            FOREIGN KEY (meal_call_id) REFERENCES meal_calls(id),
+            FOREIGN KEY (member_id) REFERENCES members(id),
+            UNIQUE (meal_call_id, member_id)
+        )
+        """,
+        # Notification
+        """
+        CREATE TABLE IF NOT EXISTS device_registrations (
+            id TEXT PRIMARY KEY,
+            member_id TEXT NOT NULL,
+            expo_push_token TEXT NOT NULL,
+            registered_at TEXT NOT NULL,
+            FOREIGN KEY (member_id) REFERENCES members(id),
+            UNIQUE (member_id)
+        )
+        """,
+    )),
+    Migration(2, "secondary indexes for repository queries", (
+        # members(family_id), meal_responses(meal_call_id), meal_call_menus(meal_call_id),
+        # device_registrations(member_id)는 UNIQUE/PK 자동 인덱스가 이미 선두 컬럼으로 커버한다
+        "CREATE INDEX IF NOT EXISTS idx_invite_links_family ON invite_links (family_id)",
+        "CREATE INDEX IF NOT EXISTS idx_menu_items_family_name ON menu_items (family_id, name)",
+        "CREATE INDEX IF NOT EXISTS idx_meal_calls_family_status_created"
+        " ON meal_calls (family_id, status, created_at)",
+        "CREATE INDEX IF NOT EXISTS idx_meal_calls_family_created ON meal_calls (family_id, created_at)",
+        # 외래 키 자식 쪽 인덱스 - INSERT OR REPLACE가 부모 행을 지울 때 FK 검사가 풀 스캔하지 않도록
+        "CREATE INDEX IF NOT EXISTS idx_meal_calls_caller ON meal_calls (caller_id)",
+        "CREATE INDEX IF NOT EXISTS idx_meal_responses_member ON meal_responses (member_id)",
+        "CREATE INDEX IF NOT EXISTS idx_meal_call_menus_menu_item ON meal_call_menus (menu_item_id)",
+    )),
+    Migration(3, "one active meal call per family", (
+        # 기존 중복 ACTIVE 호출은 가장 최근 것만 남기고 완료 처리
+        """
+        UPDATE meal_calls
+        SET status = 'COMPLETED', completed_at = COALESCE(completed_at, created_at)
+        WHERE status = 'ACTIVE' AND EXISTS (
+            SELECT 1 FROM meal_calls newer
+            WHERE newer.family_id = meal_calls.family_id
+              AND newer.status = 'ACTIVE'
+              AND (newer.created_at > meal_calls.created_at
+                   OR (newer.created_at = meal_calls.created_at AND newer.id > meal_calls.id))
+        )
+        """,
+        "CREATE UNIQUE INDEX IF NOT EXISTS uq_meal_calls_active_family"
+        " ON meal_calls (family_id) WHERE status = 'ACTIVE'",
+        # ACTIVE 조회는 부분 인덱스가 담당
+        "DROP INDEX IF EXISTS idx_meal_calls_family_status_created",
+    )),
+    Migration(4, "aggregate version columns for optimistic concurrency", (
+        "ALTER TABLE meal_calls ADD COLUMN version INTEGER NOT NULL DEFAULT 0",
+        "ALTER TABLE families ADD COLUMN version INTEGER NOT NULL DEFAULT 0",
+    )),
+    Migration(5, "active meal call read model", (
+        # 가족별 ACTIVE 호출의 직렬화된 응답 본문 - 이벤트 구독자가 갱신한다
+        """
+        CREATE TABLE IF NOT EXISTS active_meal_call_views (
+            family_id TEXT PRIMARY KEY,
+            meal_call_id TEXT NOT NULL,
+            payload BLOB NOT NULL,
+            updated_at TEXT NOT NULL
+        )
+        """,
+    )),
+    Migration(6, "meal call recipient snapshot", (
+        # 호출 생성 시점의 대상 구성원 - 이후 가입한 사람은 미응답 목록에 들어가지 않는다
+        """
+        CREATE TABLE IF NOT EXISTS meal_call_recipients (
+            meal_call_id TEXT NOT NULL,
+            member_id TEXT NOT NULL,
+            PRIMARY KEY (meal_call_id, member_id),
+            FOREIGN KEY (meal_call_id) REFERENCES meal_calls(id),
+            FOREIGN KEY (member_id) REFERENCES members(id)
+        ) WITHOUT ROWID
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_meal_call_recipients_member ON meal_call_recipients (member_id)",
+        # 기존 호출: 호출 시점 이전에 가입한 구성원 + 실제로 응답한 구성원
+        """
+        INSERT OR IGNORE INTO meal_call_recipients (meal_call_id, member_id)
+        SELECT mc.id, m.id FROM meal_calls mc
+        JOIN members m ON m.family_id = mc.family_id AND m.created_at <= mc.created_at
+        UNION
+        SELECT meal_call_id, member_id FROM meal_responses
+        """,
+    )),
+    Migration(7, "full-text search", (
+        # trigram FTS5 인덱스 (한글 부분 일치, 3글자 이상) - 텍스트와 원본 id를 직접 저장한다.
+        # 원본 테이블은 TEXT PK라 암묵적 rowid가 VACUUM 때 바뀔 수 있으므로 외부 콘텐츠로
+        # 참조하지 않고, 트리거는 (원본, id) → FTS rowid를 search_keys(INTEGER PRIMARY KEY)에서 찾는다.
+        # 리포지토리의 INSERT/UPSERT와 같은 트랜잭션에서 트리거로 갱신된다.
+        # INSERT OR REPLACE는 삭제 트리거를 건너뛰므로 이 테이블들에는 쓰지 않는다.
+        """
+        CREATE TABLE IF NOT EXISTS search_keys (
+            key INTEGER PRIMARY KEY,
+            source TEXT NOT NULL,
+            id TEXT NOT NULL,
+            UNIQUE (source, id)
+        )
+        """,
+        "CREATE VIRTUAL TABLE IF NOT EXISTS menu_items_fts USING fts5(id UNINDEXED, name, tokenize='trigram')",
+        """
+        CREATE TRIGGER IF NOT EXISTS menu_items_fts_ai AFTER INSERT ON menu_items BEGIN
+            INSERT INTO search_keys (source, id) VALUES ('menu_items', new.id);
+            INSERT INTO menu_items_fts (rowid, id, name) VALUES (
+                (SELECT key FROM search_keys WHERE source = 'menu_items' AND id = new.id), new.id, new.name);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS menu_items_fts_ad AFTER DELETE ON menu_items BEGIN
+            DELETE FROM menu_items_fts WHERE rowid = (SELECT key FROM search_keys WHERE source = 'menu_items' AND id = old.id);
+            DELETE FROM search_keys WHERE source = 'menu_items' AND id = old.id;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS menu_items_fts_au AFTER UPDATE OF id, name ON menu_items BEGIN
+            DELETE FROM menu_items_fts WHERE rowid = (SELECT key FROM search_keys WHERE source = 'menu_items' AND id = old.id);
+            DELETE FROM search_keys WHERE source = 'menu_items' AND id = old.id;
+            INSERT INTO search_keys (source, id) VALUES ('menu_items', new.id);
+            INSERT INTO menu_items_fts (rowid, id, name) VALUES (
+                (SELECT key FROM search_keys WHERE source = 'menu_items' AND id = new.id), new.id, new.name);
+        END
+        """,
+        "INSERT OR IGNORE INTO search_keys (source, id) SELECT 'menu_items', id FROM menu_items",
+        "INSERT INTO menu_items_fts (rowid, id, name) SELECT k.key, s.id, s.name "
+        "FROM menu_items s JOIN search_keys k ON k.source = 'menu_items' AND k.id = s.id"
+        " WHERE k.key NOT IN (SELECT rowid FROM menu_items_fts)",
+        "CREATE VIRTUAL TABLE IF NOT EXISTS meal_calls_fts USING fts5(id UNINDEXED, message, tokenize='trigram')",
+        """
+        CREATE TRIGGER IF NOT EXISTS meal_calls_fts_ai AFTER INSERT ON meal_calls BEGIN
+            INSERT INTO search_keys (source, id) VALUES ('meal_calls', new.id);
+            INSERT INTO meal_calls_fts (rowid, id, message) VALUES (
+                (SELECT key FROM search_keys WHERE source = 'meal_calls' AND id = new.id), new.id, new.message);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS meal_calls_fts_ad AFTER DELETE ON meal_calls BEGIN
+            DELETE FROM meal_calls_fts WHERE rowid = (SELECT key FROM search_keys WHERE source = 'meal_calls' AND id = old.id);
+            DELETE FROM search_keys WHERE source = 'meal_calls' AND id = old.id;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS meal_calls_fts_au AFTER UPDATE OF id, message ON meal_calls BEGIN
+            DELETE FROM meal_calls_fts WHERE rowid = (SELECT key FROM search_keys WHERE source = 'meal_calls' AND id = old.id);
+            DELETE FROM search_keys WHERE source = 'meal_calls' AND id = old.id;
+            INSERT INTO search_keys (source, id) VALUES ('meal_calls', new.id);
+            INSERT INTO meal_calls_fts (rowid, id, message) VALUES (
+                (SELECT key FROM search_keys WHERE source = 'meal_calls' AND id = new.id), new.id, new.message);
+        END
+        """,
+        "INSERT OR IGNORE INTO search_keys (source, id) SELECT 'meal_calls', id FROM meal_calls",
+        "INSERT INTO meal_calls_fts (rowid, id, message) SELECT k.key, s.id, s.message "
+        "FROM meal_calls s JOIN search_keys k ON k.source = 'meal_calls' AND k.id = s.id"
+        " WHERE k.key NOT IN (SELECT rowid FROM meal_calls_fts)",
+        "CREATE VIRTUAL TABLE IF NOT EXISTS meal_responses_fts USING fts5(id UNINDEXED, custom_message, tokenize='trigram')",
+        """
+        CREATE TRIGGER IF NOT EXISTS meal_responses_fts_ai AFTER INSERT ON meal_responses BEGIN
+            INSERT INTO search_keys (source, id) VALUES ('meal_responses', new.id);
+            INSERT INTO meal_responses_fts (rowid, id, custom_message) VALUES (
+                (SELECT key FROM search_keys WHERE source = 'meal_responses' AND id = new.id), new.id, new.custom_message);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS meal_responses_fts_ad AFTER DELETE ON meal_responses BEGIN
+            DELETE FROM meal_responses_fts WHERE rowid = (SELECT key FROM search_keys WHERE source = 'meal_responses' AND id = old.id);
+            DELETE FROM search_keys WHERE source = 'meal_responses' AND id = old.id;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS meal_responses_fts_au AFTER UPDATE OF id, custom_message ON meal_responses BEGIN
+            DELETE FROM meal_responses_fts WHERE rowid = (SELECT key FROM search_keys WHERE source = 'meal_responses' AND id = old.id);
+            DELETE FROM search_keys WHERE source = 'meal_responses' AND id = old.id;
+            INSERT INTO search_keys (source, id) VALUES ('meal_responses', new.id);
+            INSERT INTO meal_responses_fts (rowid, id, custom_message) VALUES (
+                (SELECT key FROM search_keys WHERE source = 'meal_responses' AND id = new.id), new.id, new.custom_message);
+        END
+        """,
+        "INSERT OR IGNORE INTO search_keys (source, id) SELECT 'meal_responses', id FROM meal_responses",
+        "INSERT INTO meal_responses_fts (rowid, id, custom_message) SELECT k.key, s.id, s.custom_message "
+        "FROM meal_responses s JOIN search_keys k ON k.source = 'meal_responses' AND k.id = s.id"
+        " WHERE k.key NOT IN (SELECT rowid FROM meal_responses_fts)",
+    )),
+    Migration(8, "token revocation list", (
+        """
+        CREATE TABLE IF NOT EXISTS revoked_tokens (
+            jti TEXT PRIMARY KEY,
+            expires_at INTEGER NOT NULL
+        ) WITHOUT ROWID
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_revoked_tokens_expires ON revoked_tokens(expires_at)",
+    )),
+)
+
+LATEST_VERSION = MIGRATIONS[-1].version
+
+
+async def migrate(db: aiosqlite.Connection) -> int:
+    """미적용 마이그레이션을 버전 순서대로 적용하고 최종 버전을 반환
+
+    스키마가 최신이면 PRAGMA 하나만 읽고 끝난다. 각 버전은 DDL과
+    user_version 갱신을 한 트랜잭션으로 묶어 중간에 죽어도 재시도할 수 있다.
+    """
+    rows = await db.execute_fetchall("PRAGMA user_version")
+    current = rows[0][0]
+    if current >= LATEST_VERSION:
+        if current > LATEST_VERSION:
+            logger.warning(f"DB 스키마 버전({current})이 코드({LATEST_VERSION})보다 높습니다")
+        return current
+
+    for migration in MIGRATIONS:
+        if migration.version <= current:
+            continue
+        await db.execute("BEGIN IMMEDIATE")
+        try:
+            for statement in migration.statements:
+                await db.execute(statement)
+            await db.execute(f"PRAGMA user_version = {migration.version}")
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+        logger.info(f"DB 마이그레이션 적용: v{migration.version} {migration.description}")
+        current = migration.version
+    return current
@@ -0,0 +1,177 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, TypeVar
+
+import aiosqlite
+
+from src.shared.infrastructure.connection_pool import Connector
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+WriteFn = Callable[[aiosqlite.Connection], Awaitable[T]]
+
+
+@dataclass
+class WriterStats:
+    queued: int
+    executed: int
+    failed: int
+    commits: int
+
+
+@dataclass
+class _WriteJob:
+    fn: WriteFn
+    future: asyncio.Future
+
+
+class SqliteWriter:
+    """단일 쓰기 전용 연결 + asyncio 큐
+
+    SQLite(WAL)는 한 번에 하나의 writer만 허용한다. 여러 연결이 쓰기 잠금을
+    두고 경쟁하면 'database is locked'가 나므로, 모든 쓰기를 하나의 연결에서
+    큐 순서대로 실행한다. 각 작업은 자체 트랜잭션으로 커밋되며 실패 시
+    롤백 후 예외를 호출자에게 그대로 돌려준다.
+
+    group_commit_window > 0이면 그룹 커밋 모드: 첫 작업이 도착한 뒤 window 동안
+    쌓인 작업(최대 max_batch개)을 한 트랜잭션으로 묶어 커밋(=fsync) 한 번에
+    처리한다. 작업마다 SAVEPOINT를 걸어 실패한 작업만 되돌리고, 나머지 작업의
+    결과는 커밋이 끝난 뒤에 돌려준다. 작업 함수는 직접 commit하면 안 된다.
+    """
+
+    def __init__(
+        self,
+        connect: Connector,
+        group_commit_window: float = 0.0,
+        max_batch: int = 64,
+    ):
+        self._connect = connect
+        self._group_commit_window = group_commit_window
+        self._max_batch = max_batch
+        self._conn: aiosqlite.Connection | None = None
+        self._queue: asyncio.Queue[_WriteJob | None] = asyncio.Queue()
+        self._task: asyncio.Task | None = None
+        self._executed = 0
+        self._failed = 0
+        self._commits = 0
+
+    async def open(self) -> None:
+        self._conn = await self._connect()
+        self._task = asyncio.create_task(self._run(), name="sqlite-writer")
+
+    async def close(self) -> None:
+        if self._task is None:
+            return
+        self._queue.put_nowait(None)
+        await self._task
+        self._task = None
+        if self._conn is not None:
+            await self._conn.close()
+            self._conn = None
+
+    async def write(self, fn: WriteFn[T]) -> T:
+        """fn(db)을 writer 연결에서 실행하고 커밋한 뒤 결과를 반환"""
+        if self._task is None:
+            raise RuntimeError("DB writer가 열려 있지 않습니다")
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait(_WriteJob(fn, future))
+        return await future
+
+    def stats(self) -> WriterStats:
+        return WriterStats(
+            queued=self._queue.qsize(),
+            executed=self._executed,
+            failed=self._failed,
+            commits=self._commits,
+        )
+
+    async def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            job = await self._queue.get()
+            if job is None:
+                break
+            if self._group_commit_window <= 0:
+                await self._execute(job)
+                continue
+            batch, stopping = await self._collect_batch(job)
+            await self._execute_batch(batch)
+        # close() 이후 남은 작업은 실패 처리
+        while not self._queue.empty():
+            job = self._queue.get_nowait()
+            if job is not None and not job.future.done():
+                job.future.set_exception(RuntimeError("DB writer가 종료되었습니다"))
+
+    async def _collect_batch(self, first: _WriteJob) -> tuple[list[_WriteJob], bool]:
+        await asyncio.sleep(self._group_commit_window)
+        batch = [first]
+        while len(batch) < self._max_batch and not self._queue.empty():
+            job = self._queue.get_nowait()
+            if job is None:
+                return batch, True
+            batch.append(job)
+        return batch, False
+
+    async def _execute(self, job: _WriteJob) -> None:
+        db = self._conn
+        self._executed += 1
+        try:
+            result: Any = await job.fn(db)
+            await db.commit()
+        except Exception as e:
+            self._failed += 1
+            await self._rollback()
+            if not job.future.done():
+                job.future.set_exception(e)
+            return
+        except BaseException:
+            job.future.cancel()
+            raise
+        self._commits += 1
+        # 호출자가 이미 취소했더라도 커밋은 유지된다
+        if not job.future.done():
+            job.future.set_result(result)
+
+    async def _execute_batch(self, batch: list[_WriteJob]) -> None:
+        db = self._conn
+        done: list[tuple[_WriteJob, Any]] = []
+        try:
+            await db.execute("BEGIN IMMEDIATE")
+            for job in batch:
+                self._executed += 1
+                await db.execute("SAVEPOINT write_job")
+                try:
+                    result = await job.fn(db)
+                except Exception as e:
+                    self._failed += 1
+                    await db.execute("ROLLBACK TO write_job")
+                    await db.execute("RELEASE write_job")
+                    if not job.future.done():
+                        job.future.set_exception(e)
+                    continue
+                await db.execute("RELEASE write_job")
+                done.append((job, result))
+            await db.commit()
+        except Exception as e:
+            # 트랜잭션 자체가 깨진 경우 - 아직 결과를 받지 못한 작업 모두 실패
+            await self._rollback()
+            for job in batch:
+                if not job.future.done():
+                    job.future.set_exception(e)
+            return
+        except BaseException:
+            for job in batch:
+                job.future.cancel()
+            raise
+        self._commits += 1
+        for job, result in done:
+            if not job.future.done():
+                job.future.set_result(result)
+
+    async def _rollback(self) -> None:
+        try:
+            await self._conn.rollback()
+        except Exception as e:
+            logger.error(f"쓰기 작업 롤백 실패: {e}", exc_info=True)
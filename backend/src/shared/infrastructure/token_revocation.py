@@ -0,0 +1,174 @@
+import asyncio
+import hashlib
+import logging
+import math
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterable
+
+import aiosqlite
+
+from src.shared.infrastructure.database import read_connection, write
+
+logger = logging.getLogger(__name__)
+
+
+class BloomFilter:
+    """jti 집합의 근사 멤버십 - False면 확실히 없고, True면 있을 수도 있다
+
+    비트 배열 하나와 blake2b 해시 하나(두 64비트 값으로 k개 위치를 만든다)로
+    구성된다. 항목을 뺄 수 없으므로 만료된 jti를 정리할 때는 새로 만든다.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        capacity = max(capacity, 1)
+        self.capacity = capacity
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def add(self, key: str) -> None:
+        for pos in self._positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def _positions(self, key: str) -> Iterable[int]:
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.num_bits for i in range(self.num_hashes))
+
+
+@dataclass
+class RevocationStats:
+    revoked: int
+    filter_capacity: int
+    filter_bits: int
+    filter_hashes: int
+    checks: int
+    filter_passes: int      # 필터가 "있을 수도"라고 답해 정확한 집합까지 확인한 횟수
+    false_positives: int
+    compactions: int
+
+
+class TokenRevocationList:
+    """폐기된 토큰(jti) 목록 - revoked_tokens 테이블의 메모리 사본
+
+    시작 시 만료 전 항목을 모두 읽어 두고, 이후 폐기는 DB에 쓴 다음 메모리에
+    반영한다. 요청마다의 확인(is_revoked)은 DB를 읽지 않는다 - Bloom 필터가
+    대부분을 비트 몇 개로 걸러내고, 통과한 것만 정확한 집합(jti → exp)으로 확인한다.
+
+    exp가 지난 jti는 어차피 서명 검증에서 거절되므로 compact가 주기적으로
+    메모리와 테이블에서 지운다 (run_compaction을 lifespan에서 백그라운드로).
+    단일 프로세스 전제 - 다른 프로세스의 폐기는 다음 load 때 반영된다.
+    """
+
+    def __init__(
+        self,
+        initial_capacity: int = 1024,
+        error_rate: float = 0.01,
+        clock: Callable[[], float] = time.time,
+    ):
+        self._initial_capacity = initial_capacity
+        self._error_rate = error_rate
+        self._clock = clock
+        self._expires: dict[str, int] = {}
+        self._filter = BloomFilter(initial_capacity, error_rate)
+        self._checks = 0
+        self._filter_passes = 0
+        self._false_positives = 0
+        self._compactions = 0
+
+    async def load(self) -> None:
+        """테이블에서 만료 전 항목을 읽어 메모리를 다시 만든다 (시작 시 한 번)"""
+        async with read_connection() as db:
+            rows = await db.execute_fetchall(
+                "SELECT jti, expires_at FROM revoked_tokens WHERE expires_at > ?",
+                (int(self._clock()),),
+            )
+        self._expires = {r["jti"]: r["expires_at"] for r in rows}
+        self._rebuild_filter()
+        logger.info(f"폐기된 토큰 {len(self._expires)}개 로드")
+
+    def is_revoked(self, jti: str | None) -> bool:
+        """jti 없는 토큰(도입 전 발급)은 폐기할 수 없으므로 False"""
+        if jti is None:
+            return False
+        self._checks += 1
+        if jti not in self._filter:
+            return False
+        self._filter_passes += 1
+        if jti in self._expires:
+            return True
+        self._false_positives += 1
+        return False
+
+    async def revoke(self, jti: str | None, expires_at: int) -> None:
+        """expires_at(토큰 exp, epoch 초)까지 jti를 폐기 - 이미 만료됐으면 아무것도 하지 않는다"""
+        if jti is None or expires_at <= self._clock() or jti in self._expires:
+            return
+
+        async def _insert(db: aiosqlite.Connection) -> None:
+            await db.execute(
+                "INSERT OR IGNORE INTO revoked_tokens (jti, expires_at) VALUES (?, ?)",
+                (jti, expires_at),
+            )
+
+        await write(_insert)
+        self._expires[jti] = expires_at
+        if len(self._expires) > self._filter.capacity:
+            self._rebuild_filter()  # 용량을 넘으면 오탐률이 올라가므로 두 배로 다시 만든다
+        else:
+            self._filter.add(jti)
+
+    async def compact(self) -> int:
+        """만료된 항목을 메모리와 테이블에서 지우고 지운 개수(메모리 기준)를 반환"""
+        now = int(self._clock())
+        live = {jti: exp for jti, exp in self._expires.items() if exp > now}
+        removed = len(self._expires) - len(live)
+        if removed:
+            self._expires = live
+            self._rebuild_filter()
+
+        async def _delete(db: aiosqlite.Connection) -> None:
+            await db.execute("DELETE FROM revoked_tokens WHERE expires_at <= ?", (now,))
+
+        await write(_delete)
+        self._compactions += 1
+        return removed
+
+    async def run_compaction(self, interval: float) -> None:
+        """interval초마다 compact (취소될 때까지)"""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                removed = await self.compact()
+                if removed:
+                    logger.info(f"만료된 폐기 토큰 {removed}개 정리")
+            except Exception:
+                logger.exception("폐기 토큰 정리 실패")
+
+    def stats(self) -> RevocationStats:
+        return RevocationStats(
+            revoked=len(self._expires),
+            filter_capacity=self._filter.capacity,
+            filter_bits=self._filter.num_bits,
+            filter_hashes=self._filter.num_hashes,
+            checks=self._checks,
+            filter_passes=self._filter_passes,
+            false_positives=self._false_positives,
+            compactions=self._compactions,
+        )
+
+    def _rebuild_filter(self) -> None:
+        capacity = self._initial_capacity
+        while capacity < len(self._expires) * 2:
+            capacity *= 2
+        self._filter = BloomFilter(capacity, self._error_rate)
+        for jti in self._expires:
+            self._filter.add(jti)
+
+
+revoked_tokens = TokenRevocationList()
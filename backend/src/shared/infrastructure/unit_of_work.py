@@ -0,0 +1,94 @@
+from contextvars import ContextVar, Token
+from typing import TYPE_CHECKING, Callable
+
+from src.shared.infrastructure.event_bus import event_bus
+
+if TYPE_CHECKING:
+    import aiosqlite
+    from src.shared.domain.aggregate_root import AggregateRoot
+    from src.shared.domain.domain_event import DomainEvent
+    from src.shared.infrastructure.sqlite_writer import WriteFn
+
+_current: ContextVar["UnitOfWork | None"] = ContextVar("unit_of_work", default=None)
+
+
+def current_unit_of_work() -> "UnitOfWork | None":
+    return _current.get()
+
+
+def after_commit(fn: Callable[[], None]) -> None:
+    """쓰기가 커밋된 뒤 반영할 메모리 상태 변경(version, 변경 추적 등)을 등록
+
+    UnitOfWork 밖에서는 write()가 이미 커밋된 뒤이므로 바로 실행한다.
+    안에서는 작업 단위가 커밋에 성공했을 때만 실행된다 (이벤트 발행 전).
+    """
+    uow = _current.get()
+    if uow is None:
+        fn()
+    else:
+        uow._callbacks.append(fn)
+
+
+class UnitOfWork:
+    """커맨드 하나의 쓰기를 한 트랜잭션으로 묶는 작업 단위
+
+    블록 안에서 호출된 리포지토리 쓰기(database.write)는 바로 실행되지 않고
+    모였다가, 블록이 정상 종료될 때 writer 연결에서 한 번에 실행되고 한 번
+    커밋된다. 수집된 도메인 이벤트는 커밋이 성공한 뒤에만 발행된다.
+    블록에서 예외가 나면 쓰기와 이벤트 모두 버려진다.
+
+        async with UnitOfWork() as uow:
+            await repo.save_member(...)
+            await repo.save_invite_link(link)
+            uow.collect(family)
+
+    블록 안에서는 결과를 돌려받는 쓰기(database.write_returning)를 쓸 수 없고,
+    쓰기 결과에 따른 메모리 상태 변경은 after_commit으로 커밋 뒤로 미룬다.
+    """
+
+    def __init__(self):
+        self._jobs: list["WriteFn"] = []
+        self._events: list["DomainEvent"] = []
+        self._callbacks: list[Callable[[], None]] = []
+        self._token: Token | None = None
+
+    async def __aenter__(self) -> "UnitOfWork":
+        if _current.get() is not None:
+            raise RuntimeError("UnitOfWork는 중첩할 수 없습니다")
+        self._token = _current.set(self)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        _current.reset(self._token)
+        self._token = None
+        if exc_type is not None:
+            self._jobs.clear()
+            self._events.clear()
+            self._callbacks.clear()
+            return
+        await self._commit()
+
+    def register(self, fn: "WriteFn") -> None:
+        self._jobs.append(fn)
+
+    def collect(self, aggregate: "AggregateRoot") -> None:
+        self._events.extend(aggregate.collect_events())
+
+    def add_events(self, events: list["DomainEvent"]) -> None:
+        self._events.extend(events)
+
+    async def _commit(self) -> None:
+        from src.shared.infrastructure.database import write
+
+        jobs, self._jobs = self._jobs, []
+        events, self._events = self._events, []
+        callbacks, self._callbacks = self._callbacks, []
+        if jobs:
+            async def _run_all(db: "aiosqlite.Connection") -> None:
+                for fn in jobs:
+                    await fn(db)
+
+            await write(_run_all)
+        for fn in callbacks:
+            fn()
+        await event_bus.publish_all(events)
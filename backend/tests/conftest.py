@@ -1,11 +1,19 @@
 import pytest
 import pytest_asyncio
 from httpx import AsyncClient, ASGITransport
-from src.main import app
-from src.shared.infrastructure.database import init_db
+from src.main import app, _setup_cache_invalidation, _setup_event_stream
+from src.shared.infrastructure.database import init_db, open_db, close_db
+from src.shared.infrastructure.token_revocation import revoked_tokens
 import os
 
 
+@pytest.fixture(scope="session", autouse=True)
+def setup_projections():
+    # lifespan 대신 캐시/SSE 구독만 등록 (푸시 알림 구독자는 등록하지 않는다)
+    _setup_cache_invalidation()
+    _setup_event_stream()
+
+
 @pytest_asyncio.fixture(autouse=True)
 async def setup_test_db(tmp_path, monkeypatch):
     db_path = str(tmp_path / "test.db")
@@ -16,7 +24,11 @@ async def setup_test_db(tmp_path, monkeypatch):
     import src.shared.infrastructure.database as db_module
     monkeypatch.setattr(db_module, "DB_PATH", db_path)
     await init_db()
+    # ASGITransport는 lifespan을 실행하지 않으므로 직접 연다
+    await open_db()
+    await revoked_tokens.load()
     yield
+    await close_db()
 
 
 @pytest_asyncio.fixture
@@ -25,3 +37,26 @@ async def client():
         transport=ASGITransport(app=app), base_url="http://test"
     ) as ac:
         yield ac
+
+
+@pytest_asyncio.fixture
+async def traced_statements(monkeypatch):
+    """이후 모든 DB 연결에서 실행되는 SQL을 수집"""
+    import src.shared.infrastructure.database as db_module
+    statements: list[str] = []
+    connect = db_module._connect
+
+    def trace(sql: str) -> None:
+        # FTS5 내부 문장(섀도 테이블 접근)과 트리거 진입 때 다시 보고되는 같은 문장은 제외
+        if sql.startswith("--") or "_fts_" in sql or (statements and statements[-1] == sql):
+            return
+        statements.append(sql)
+
+    async def traced_connect():
+        db = await connect()
+        await db.set_trace_callback(trace)
+        return db
+
+    monkeypatch.setattr(db_module, "_connect", traced_connect)
+    await db_module.open_db()
+    return statements
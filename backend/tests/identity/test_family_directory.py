@@ -0,0 +1,57 @@
+from datetime import datetime, timezone, timedelta
+
+from httpx import AsyncClient
+
+from src.identity.infrastructure.family_directory import family_directory
+
+
+async def _family_with_invite(client: AsyncClient) -> tuple[str, str, str]:
+    create_res = await client.post("/api/v1/families", json={
+        "family_name": "디렉터리 가족",
+        "owner_nickname": "아빠",
+        "owner_pin": "1234",
+    })
+    token = create_res.json()["access_token"]
+    family_id = create_res.json()["member"]["family_id"]
+    expires_at = (datetime.now(timezone.utc) + timedelta(hours=24)).isoformat()
+    invite_res = await client.post(
+        f"/api/v1/families/{family_id}/invite-links",
+        json={"expires_at": expires_at, "max_uses": 3},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    return family_id, token, invite_res.json()["token"]
+
+
+async def test_directory_is_cached_and_refreshed_on_join(client: AsyncClient, traced_statements):
+    family_id, _, invite_token = await _family_with_invite(client)
+
+    traced_statements.clear()
+    first = await family_directory.get(family_id)
+    again = await family_directory.get(family_id)
+    assert again is first and list(first.nicknames.values()) == ["아빠"]
+    assert sum("FROM members" in s for s in traced_statements) == 1
+
+    await client.post(f"/api/v1/invite/{invite_token}/join", json={"nickname": "엄마", "pin": "5678"})
+    joined = await family_directory.get(family_id)
+    assert sorted(joined.nicknames.values()) == ["아빠", "엄마"]
+    assert len(joined.member_ids) == 2
+
+
+async def test_meal_call_shows_member_nicknames(client: AsyncClient):
+    family_id, token, invite_token = await _family_with_invite(client)
+    join_res = await client.post(f"/api/v1/invite/{invite_token}/join",
+                                 json={"nickname": "엄마", "pin": "5678"})
+    mom = {"Authorization": f"Bearer {join_res.json()['access_token']}"}
+    dad = {"Authorization": f"Bearer {token}"}
+
+    mc = await client.post("/api/v1/meal-calls", json={}, headers=dad)
+    assert mc.json()["caller_nickname"] == "아빠"
+    assert len(mc.json()["pending_member_ids"]) == 2
+
+    res = await client.post(f"/api/v1/meal-calls/{mc.json()['id']}/respond",
+                            json={"response_type": "COMING_NOW"}, headers=mom)
+    assert res.json()["responses"][0]["member_nickname"] == "엄마"
+
+    active = await client.get("/api/v1/meal-calls/active", headers=dad)
+    assert active.json()["caller_nickname"] == "아빠"
+    assert active.json()["responses"][0]["member_nickname"] == "엄마"
@@ -116,3 +116,99 @@ async def test_get_family(client: AsyncClient):
     assert res.status_code == 200
     assert res.json()["name"] == "우리 가족"
     assert len(res.json()["members"]) == 1
+
+
+async def test_join_commits_member_and_invite_link_together(client: AsyncClient):
+    from datetime import datetime, timezone, timedelta
+    from src.shared.infrastructure.database import db_stats
+
+    create_res = await client.post("/api/v1/families", json={
+        "family_name": "트랜잭션 가족",
+        "owner_nickname": "아빠",
+        "owner_pin": "1234",
+    })
+    token = create_res.json()["access_token"]
+    family_id = create_res.json()["member"]["family_id"]
+    expires_at = (datetime.now(timezone.utc) + timedelta(hours=24)).isoformat()
+    invite_res = await client.post(
+        f"/api/v1/families/{family_id}/invite-links",
+        json={"expires_at": expires_at, "max_uses": 1},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    invite_token = invite_res.json()["token"]
+
+    commits_before = db_stats()["writer"]["commits"]
+    join_res = await client.post(f"/api/v1/invite/{invite_token}/join", json={
+        "nickname": "엄마",
+        "pin": "5678",
+    })
+    assert join_res.status_code == 201
+    assert db_stats()["writer"]["commits"] - commits_before == 1
+
+    # 사용 횟수가 함께 반영되어 두 번째 가입은 거절
+    second = await client.post(f"/api/v1/invite/{invite_token}/join", json={
+        "nickname": "동생",
+        "pin": "0000",
+    })
+    assert second.status_code == 400
+
+
+async def test_concurrent_joins_respect_invite_link_max_uses(client: AsyncClient):
+    import asyncio
+    from datetime import datetime, timezone, timedelta
+
+    create_res = await client.post("/api/v1/families", json={
+        "family_name": "동시 가입 가족",
+        "owner_nickname": "아빠",
+        "owner_pin": "1234",
+    })
+    token = create_res.json()["access_token"]
+    family_id = create_res.json()["member"]["family_id"]
+    expires_at = (datetime.now(timezone.utc) + timedelta(hours=24)).isoformat()
+    invite_res = await client.post(
+        f"/api/v1/families/{family_id}/invite-links",
+        json={"expires_at": expires_at, "max_uses": 1},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    invite_token = invite_res.json()["token"]
+
+    results = await asyncio.gather(*(
+        client.post(f"/api/v1/invite/{invite_token}/join", json={"nickname": name, "pin": "0000"})
+        for name in ("엄마", "동생", "할머니")
+    ))
+
+    # 한 번만 쓸 수 있는 링크 - 동시에 가입해도 한 명만 성공
+    assert sorted(r.status_code for r in results) == [201, 400, 400]
+    family_res = await client.get(
+        f"/api/v1/families/{family_id}",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert len(family_res.json()["members"]) == 2
+
+
+async def test_login_and_refresh_read_only_the_member(client: AsyncClient, traced_statements):
+    create_res = await client.post("/api/v1/families", json={
+        "family_name": "부분 조회 가족",
+        "owner_nickname": "아빠",
+        "owner_pin": "1234",
+    })
+    tokens = create_res.json()
+    family_id = tokens["member"]["family_id"]
+
+    traced_statements.clear()
+    res = await client.post("/api/v1/auth/login", json={
+        "family_id": family_id, "nickname": "아빠", "pin": "1234",
+    })
+    assert res.status_code == 200
+    res = await client.post("/api/v1/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert res.status_code == 200
+
+    # 로그인/갱신 각각 members 쿼리 한 번 - 가족 전체나 초대 링크는 읽지 않는다
+    selects = [s for s in traced_statements if s.lstrip().upper().startswith("SELECT")]
+    assert len(selects) == 2
+    assert all("FROM members WHERE" in s for s in selects)
+
+    res = await client.post("/api/v1/auth/login", json={
+        "family_id": "없는-가족", "nickname": "아빠", "pin": "1234",
+    })
+    assert res.status_code == 404
@@ -0,0 +1,196 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.identity.infrastructure.pin_hasher import (
+    AsyncPinHasher, BcryptScheme, PinHasher, ScryptScheme,
+)
+from src.shared.api.error_handlers import OverloadedError
+
+
+class _GatedHasher(PinHasher):
+    """release될 때까지 워커 스레드를 붙잡는 해셔 (느린 bcrypt 대신)"""
+
+    def __init__(self):
+        super().__init__()
+        self.gate = threading.Event()
+
+    def hash(self, pin: str) -> str:
+        self.gate.wait(5)
+        return f"hashed:{pin}"
+
+    def verify(self, pin: str, hashed: str) -> bool:
+        self.gate.wait(5)
+        return hashed == f"hashed:{pin}"
+
+
+async def test_hashing_runs_off_the_event_loop_and_sheds_load():
+    gated = _GatedHasher()
+    hasher = AsyncPinHasher(gated, workers=1, max_queue=1)
+    try:
+        running = asyncio.create_task(hasher.hash("1234"))
+        queued = asyncio.create_task(hasher.verify("1234", "hashed:1234"))
+        await asyncio.sleep(0.01)
+
+        # 워커가 막혀 있어도 이벤트 루프는 계속 돈다
+        start = time.perf_counter()
+        await asyncio.sleep(0.01)
+        assert time.perf_counter() - start < 0.1
+        stats = hasher.stats()
+        assert (stats.running, stats.queued) == (1, 1)
+
+        with pytest.raises(OverloadedError):
+            await hasher.hash("5678")
+        assert hasher.stats().rejected == 1
+
+        gated.gate.set()
+        assert await running == "hashed:1234"
+        assert await queued is True
+        assert hasher.stats().completed == 2
+    finally:
+        gated.gate.set()
+        hasher.shutdown()
+
+
+async def test_cancelled_callers_keep_their_slot_until_the_job_finishes():
+    gated = _GatedHasher()
+    hasher = AsyncPinHasher(gated, workers=1, max_queue=0)
+    try:
+        caller = asyncio.create_task(hasher.hash("1234"))
+        await asyncio.sleep(0.01)
+        caller.cancel()
+        await asyncio.sleep(0.01)
+
+        # 요청은 취소됐지만 워커는 아직 해싱 중 - 새 작업을 더 받지 않는다
+        assert hasher.stats().running == 1
+        with pytest.raises(OverloadedError):
+            await hasher.hash("5678")
+
+        gated.gate.set()
+        for _ in range(100):
+            if hasher.stats().running == 0:
+                break
+            await asyncio.sleep(0.01)
+        assert hasher.stats().running == 0
+        assert await hasher.hash("5678") == "hashed:5678"
+        assert hasher.stats().completed == 2   # 취소된 요청의 작업도 워커에서는 끝까지 실행됐다
+
+        def failing(pin: str) -> str:
+            raise ValueError(pin)
+
+        hasher._hasher.hash = failing
+        with pytest.raises(ValueError):
+            await hasher.hash("0000")
+        await asyncio.sleep(0.01)
+        assert hasher.stats().completed == 2   # 실패는 완료로 세지 않는다
+    finally:
+        gated.gate.set()
+        hasher.shutdown()
+
+
+async def test_login_returns_503_when_pin_hashing_is_saturated(client, monkeypatch):
+    import src.identity.api.router as identity_router
+    res = await client.post("/api/v1/families", json={
+        "family_name": "혼잡 가족", "owner_nickname": "아빠", "owner_pin": "1234",
+    })
+    family_id = res.json()["member"]["family_id"]
+
+    gated = _GatedHasher()
+    busy = AsyncPinHasher(gated, workers=1, max_queue=0)
+    monkeypatch.setattr(identity_router, "pin_hasher", busy)
+    try:
+        blocked = asyncio.create_task(busy.hash("0000"))
+        await asyncio.sleep(0.01)
+        res = await client.post("/api/v1/auth/login", json={
+            "family_id": family_id, "nickname": "아빠", "pin": "1234",
+        })
+        assert res.status_code == 503
+        assert res.json()["error"] == "PIN_HASH_BUSY"
+        assert res.headers["retry-after"] == "1"
+    finally:
+        gated.gate.set()
+        await blocked
+        busy.shutdown()
+
+
+def test_schemes_are_detected_by_prefix_and_rehash_follows_settings():
+    bcrypt_hasher = PinHasher("bcrypt", cost=10)
+    scrypt_hasher = PinHasher("scrypt", cost=ScryptScheme.min_cost)
+    old = bcrypt_hasher.hash("1234")
+    new = scrypt_hasher.hash("1234")
+    assert old.startswith("$2b$10$") and new.startswith("$scrypt$ln=14,")
+
+    # 기본 방식과 상관없이 저장된 해시의 방식으로 검증
+    assert scrypt_hasher.verify("1234", old) and bcrypt_hasher.verify("1234", new)
+    assert not scrypt_hasher.verify("0000", old) and not bcrypt_hasher.verify("0000", new)
+    assert not bcrypt_hasher.verify("1234", "$unknown$hash")
+
+    assert scrypt_hasher.needs_rehash(old) and not scrypt_hasher.needs_rehash(new)
+    assert not bcrypt_hasher.needs_rehash(old)
+    assert PinHasher("bcrypt", cost=11).needs_rehash(old)   # cost를 올린 경우
+    assert PinHasher("bcrypt", cost=9).needs_rehash(old)      # 내린 경우도
+
+
+def test_calibrated_cost_moves_hashes_both_ways_outside_the_tolerance():
+    def bcrypt_hash(cost: int) -> str:
+        return f"$2b${cost:02d}$" + "x" * 53
+
+    # cost를 지정하면 보정하지 않는다 - 다르면 어느 쪽이든 다시 저장
+    pinned = PinHasher("bcrypt", cost=10)
+    assert pinned.calibrate(10_000) == 10
+    assert pinned.needs_rehash(bcrypt_hash(12)) and not pinned.needs_rehash(bcrypt_hash(10))
+
+    # 느린 장비 - 방식별 최솟값(10)까지 내려간다
+    calibrated = PinHasher("bcrypt")
+    assert calibrated.calibrate(0) == BcryptScheme.min_cost
+    # 보정한 cost와 1 차이는 측정 잡음으로 보고 그대로 둔다
+    assert not calibrated.needs_rehash(bcrypt_hash(11))
+    assert calibrated.needs_rehash(bcrypt_hash(12))          # 기존 기본값 해시는 내려서 다시 저장
+
+
+async def test_login_rehashes_pin_with_current_scheme(client, monkeypatch):
+    import src.identity.api.router as identity_router
+    from src.shared.infrastructure.database import read_connection
+    res = await client.post("/api/v1/families", json={
+        "family_name": "재해시 가족", "owner_nickname": "아빠", "owner_pin": "1234",
+    })
+    member_id = res.json()["member"]["id"]
+    login = {"family_id": res.json()["member"]["family_id"], "nickname": "아빠", "pin": "1234"}
+
+    async def stored_hash() -> str:
+        async with read_connection() as db:
+            rows = await db.execute_fetchall("SELECT hashed_pin FROM members WHERE id = ?", (member_id,))
+        return rows[0]["hashed_pin"]
+
+    assert (await stored_hash()).startswith("$2b$")
+    scrypt = AsyncPinHasher(PinHasher("scrypt", cost=ScryptScheme.min_cost), workers=1)
+    monkeypatch.setattr(identity_router, "pin_hasher", scrypt)
+    try:
+        assert (await client.post("/api/v1/auth/login", json=login)).status_code == 200
+        rehashed = await stored_hash()
+        assert rehashed.startswith("$scrypt$")
+
+        assert (await client.post("/api/v1/auth/login", json=login)).status_code == 200
+        assert await stored_hash() == rehashed   # 이미 최신 - 다시 쓰지 않는다
+        res = await client.post("/api/v1/auth/login", json={**login, "pin": "0000"})
+        assert res.status_code == 400
+    finally:
+        scrypt.shutdown()
+
+
+async def test_pin_hashing_benchmark_runs(monkeypatch, capsys):
+    import src.config as config
+    import src.identity.api.router as identity_router
+    import src.shared.infrastructure.database as database
+    from benchmarks import pin_hashing
+
+    # 벤치마크가 바꿔 끼우는 전역을 테스트 뒤에 되돌린다
+    monkeypatch.setattr(identity_router, "pin_hasher", identity_router.pin_hasher)
+    monkeypatch.setattr(config, "DB_PATH", config.DB_PATH)
+    monkeypatch.setattr(database, "DB_PATH", database.DB_PATH)
+
+    await pin_hashing.main(["--logins", "2", "--workers", "1"])
+    lines = capsys.readouterr().out.splitlines()
+    assert [line.split()[0] for line in lines[1:]] == ["inline", "pool"]
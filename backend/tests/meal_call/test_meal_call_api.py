@@ -76,6 +76,7 @@ async def test_respond_meal_call(auth_client):
         "response_type": "COMING_NOW",
     })
     assert res.status_code == 200
+    assert res.json()["meal_call_id"] == meal_call_id
     assert len(res.json()["responses"]) == 1
     assert res.json()["responses"][0]["response_type"] == "COMING_NOW"
 
@@ -107,3 +108,314 @@ async def test_remind_meal_call(auth_client):
     res = await client.post(f"/api/v1/meal-calls/{meal_call_id}/remind")
     assert res.status_code == 200
     assert "pending_member_ids" in res.json()
+
+
+async def test_respond_again_replaces_previous_response(auth_client):
+    client, _ = auth_client
+    mc_res = await client.post("/api/v1/meal-calls", json={})
+    meal_call_id = mc_res.json()["id"]
+
+    await client.post(f"/api/v1/meal-calls/{meal_call_id}/respond", json={
+        "response_type": "COMING_NOW",
+    })
+    res = await client.post(f"/api/v1/meal-calls/{meal_call_id}/respond", json={
+        "response_type": "CUSTOM", "custom_message": "10분 뒤에",
+    })
+    assert res.status_code == 200
+    assert len(res.json()["responses"]) == 1
+    assert res.json()["responses"][0]["custom_message"] == "10분 뒤에"
+
+
+async def test_respond_to_completed_meal_call(auth_client):
+    client, _ = auth_client
+    mc_res = await client.post("/api/v1/meal-calls", json={})
+    meal_call_id = mc_res.json()["id"]
+    await client.put(f"/api/v1/meal-calls/{meal_call_id}/complete")
+
+    res = await client.post(f"/api/v1/meal-calls/{meal_call_id}/respond", json={
+        "response_type": "COMING_NOW",
+    })
+    assert res.status_code == 400
+    assert res.json()["error"] == "MEAL_CALL_CLOSED"
+
+
+async def test_respond_to_unknown_meal_call(auth_client):
+    client, _ = auth_client
+    res = await client.post("/api/v1/meal-calls/unknown/respond", json={
+        "response_type": "COMING_NOW",
+    })
+    assert res.status_code == 404
+
+
+async def test_only_one_active_meal_call_per_family(auth_client):
+    import asyncio
+    client, _ = auth_client
+
+    first, second = await asyncio.gather(
+        client.post("/api/v1/meal-calls", json={"message": "밥 먹자!"}),
+        client.post("/api/v1/meal-calls", json={"message": "나도 밥!"}),
+    )
+
+    assert sorted([first.status_code, second.status_code]) == [200, 201]
+    assert first.json()["id"] == second.json()["id"]
+
+    # 완료 후에는 새로 만들 수 있다
+    await client.put(f"/api/v1/meal-calls/{first.json()['id']}/complete")
+    res = await client.post("/api/v1/meal-calls", json={})
+    assert res.status_code == 201
+    assert res.json()["id"] != first.json()["id"]
+
+
+async def test_active_meal_call_read_model_follows_events(auth_client, traced_statements):
+    from src.shared.infrastructure.database import db_stats
+    client, _ = auth_client
+
+    def commits() -> int:
+        return db_stats()["writer"]["commits"]
+
+    # 읽기 모델은 호출을 바꾸는 쓰기와 같은 커밋에서 갱신된다
+    before = commits()
+    mc_res = await client.post("/api/v1/meal-calls", json={"message": "저녁 먹자"})
+    assert commits() - before == 1
+    meal_call_id = mc_res.json()["id"]
+    before = commits()
+    await client.post(f"/api/v1/meal-calls/{meal_call_id}/respond", json={
+        "response_type": "COMING_5MIN",
+    })
+    assert commits() - before == 1
+
+    traced_statements.clear()
+    res = await client.get("/api/v1/meal-calls/active")
+    # 읽기 모델 PK 조회 한 번
+    selects = [s for s in traced_statements if s.lstrip().upper().startswith("SELECT")]
+    assert len(selects) == 1 and "active_meal_call_views" in selects[0]
+    detail = await client.get(f"/api/v1/meal-calls/{meal_call_id}")
+    assert res.json() == detail.json()
+    assert res.json()["responses"][0]["response_type"] == "COMING_5MIN"
+
+    before = commits()
+    await client.put(f"/api/v1/meal-calls/{meal_call_id}/complete")
+    assert commits() - before == 1
+    res = await client.get("/api/v1/meal-calls/active")
+    assert res.status_code == 200
+    assert res.json() is None
+
+
+async def test_active_meal_call_read_model_rebuild(auth_client):
+    from src.shared.infrastructure.database import write
+    client, _ = auth_client
+    mc_res = await client.post("/api/v1/meal-calls", json={"message": "저녁 먹자"})
+
+    async def _drop_views(db):
+        await db.execute("DELETE FROM active_meal_call_views")
+    await write(_drop_views)
+    assert (await client.get("/api/v1/meal-calls/active")).json() is None
+
+    # 시작 시 재생성 (새 프로세스라 캐시도 비어 있음)
+    from src.meal_call.application.query_cache import active_meal_call_cache
+    active_meal_call_cache.clear()
+    from src.meal_call.api.router import active_meal_call_projector
+    await active_meal_call_projector.rebuild()
+
+    res = await client.get("/api/v1/meal-calls/active")
+    assert res.json()["id"] == mc_res.json()["id"]
+
+
+async def test_polling_hits_cache_without_sqlite(auth_client, traced_statements):
+    from src.shared.infrastructure.cache import cache_stats
+    client, _ = auth_client
+    mc_res = await client.post("/api/v1/meal-calls", json={"message": "점심 먹자"})
+    meal_call_id = mc_res.json()["id"]
+    await client.get("/api/v1/meal-calls/active")
+    await client.get(f"/api/v1/meal-calls/{meal_call_id}")
+
+    traced_statements.clear()
+    hits_before = cache_stats()["active_meal_call"]["hits"]
+    active = await client.get("/api/v1/meal-calls/active")
+    detail = await client.get(f"/api/v1/meal-calls/{meal_call_id}")
+    assert traced_statements == []
+    assert cache_stats()["active_meal_call"]["hits"] == hits_before + 1
+    assert active.json() == detail.json()
+
+    # 응답 이벤트로 무효화되어 다음 조회에 반영
+    await client.post(f"/api/v1/meal-calls/{meal_call_id}/respond", json={
+        "response_type": "COMING_NOW",
+    })
+    active = await client.get("/api/v1/meal-calls/active")
+    detail = await client.get(f"/api/v1/meal-calls/{meal_call_id}")
+    assert len(active.json()["responses"]) == 1
+    assert len(detail.json()["responses"]) == 1
+
+
+async def test_active_meal_call_etag(auth_client, traced_statements):
+    client, _ = auth_client
+    mc_res = await client.post("/api/v1/meal-calls", json={})
+    meal_call_id = mc_res.json()["id"]
+
+    first = await client.get("/api/v1/meal-calls/active")
+    etag = first.headers["etag"]
+
+    traced_statements.clear()
+    res = await client.get("/api/v1/meal-calls/active", headers={"If-None-Match": etag})
+    assert res.status_code == 304 and res.content == b""
+    assert res.headers["etag"] == etag
+    assert traced_statements == []
+
+    await client.post(f"/api/v1/meal-calls/{meal_call_id}/respond", json={
+        "response_type": "COMING_NOW",
+    })
+    res = await client.get("/api/v1/meal-calls/active", headers={"If-None-Match": etag})
+    assert res.status_code == 200
+    assert res.headers["etag"] != etag
+    assert len(res.json()["responses"]) == 1
+
+    detail = await client.get(f"/api/v1/meal-calls/{meal_call_id}")
+    res = await client.get(f"/api/v1/meal-calls/{meal_call_id}",
+                           headers={"If-None-Match": detail.headers["etag"]})
+    assert res.status_code == 304
+
+
+async def test_menu_list_etag(auth_client):
+    client, _ = auth_client
+    await client.post("/api/v1/menus", json={"name": "김치찌개"})
+    first = await client.get("/api/v1/menus")
+    etag = first.headers["etag"]
+
+    res = await client.get("/api/v1/menus", headers={"If-None-Match": etag})
+    assert res.status_code == 304
+
+    await client.post("/api/v1/menus", json={"name": "된장찌개"})
+    res = await client.get("/api/v1/menus", headers={"If-None-Match": etag})
+    assert res.status_code == 200 and len(res.json()) == 2
+
+
+async def test_menu_list_is_served_from_memory(auth_client, traced_statements):
+    client, _ = auth_client
+    for name in ("된장찌개", "김치찌개"):
+        await client.post("/api/v1/menus", json={"name": name, "category": "KOREAN"})
+    first = await client.get("/api/v1/menus")
+    assert [m["name"] for m in first.json()] == ["김치찌개", "된장찌개"]
+
+    traced_statements.clear()
+    again = await client.get("/api/v1/menus")
+    assert traced_statements == []
+    assert again.content == first.content
+    assert again.headers["content-type"] == "application/json"
+
+    await client.post("/api/v1/menus", json={"name": "갈비찜"})
+    res = await client.get("/api/v1/menus")
+    assert [m["name"] for m in res.json()] == ["갈비찜", "김치찌개", "된장찌개"]
+    assert res.headers["etag"] != again.headers["etag"]
+
+
+async def test_create_meal_call_looks_up_menus_in_one_query(auth_client, traced_statements):
+    client, _ = auth_client
+    names = ["김치찌개", "된장찌개", "제육볶음", "계란말이", "잡채", "불고기", "미역국", "갈비찜"]
+    menu_ids = [(await client.post("/api/v1/menus", json={"name": n})).json()["id"] for n in names]
+    other = await client.post("/api/v1/families", json={
+        "family_name": "다른 가족", "owner_nickname": "이웃", "owner_pin": "1234",
+    })
+    foreign = await client.post(
+        "/api/v1/menus", json={"name": "남의 메뉴"},
+        headers={"Authorization": f"Bearer {other.json()['access_token']}"},
+    )
+
+    traced_statements.clear()
+    res = await client.post("/api/v1/meal-calls", json={
+        "menu_item_ids": menu_ids + [menu_ids[0], foreign.json()["id"]],
+    })
+    assert res.status_code == 201
+    assert [m["name"] for m in res.json()["menus"]] == names
+    menu_selects = [s for s in traced_statements
+                    if s.lstrip().upper().startswith("SELECT") and "FROM menu_items" in s]
+    assert len(menu_selects) == 1
+
+    # 목록이 캐시된 뒤에는 메뉴 조회 쿼리 없이 고른다
+    await client.get("/api/v1/menus")
+    await client.put(f"/api/v1/meal-calls/{res.json()['id']}/complete")
+    traced_statements.clear()
+    res = await client.post("/api/v1/meal-calls", json={"menu_item_ids": menu_ids[:2]})
+    assert [m["name"] for m in res.json()["menus"]] == names[:2]
+    assert not any(s.lstrip().upper().startswith("SELECT") and "FROM menu_items" in s
+                   for s in traced_statements)
+
+
+async def test_get_meal_call_of_other_family_is_not_found(auth_client):
+    client, _ = auth_client
+    mc_res = await client.post("/api/v1/meal-calls", json={})
+
+    other = await client.post("/api/v1/families", json={
+        "family_name": "다른 가족", "owner_nickname": "이웃", "owner_pin": "1234",
+    })
+    res = await client.get(
+        f"/api/v1/meal-calls/{mc_res.json()['id']}",
+        headers={"Authorization": f"Bearer {other.json()['access_token']}"},
+    )
+    assert res.status_code == 404
+
+
+async def test_long_poll_wakes_on_response(auth_client):
+    import asyncio
+    client, _ = auth_client
+    mc_res = await client.post("/api/v1/meal-calls", json={})
+    meal_call_id = mc_res.json()["id"]
+
+    # since 없음 - 현재 상태와 버전을 바로 받는다
+    first = await client.get("/api/v1/meal-calls/active/wait")
+    assert first.status_code == 200 and first.json()["id"] == meal_call_id
+    version = first.headers["x-meal-call-version"]
+
+    waiting = asyncio.create_task(
+        client.get("/api/v1/meal-calls/active/wait", params={"since": version, "timeout": 10})
+    )
+    await asyncio.sleep(0.05)
+    assert not waiting.done()
+
+    await client.post(f"/api/v1/meal-calls/{meal_call_id}/respond", json={
+        "response_type": "COMING_NOW",
+    })
+    res = await asyncio.wait_for(waiting, 5)
+    assert res.status_code == 200
+    assert len(res.json()["responses"]) == 1
+    assert res.headers["x-meal-call-version"] != version
+
+
+async def test_long_poll_times_out_without_change(auth_client):
+    client, _ = auth_client
+    first = await client.get("/api/v1/meal-calls/active")
+    version = first.headers["x-meal-call-version"]
+
+    res = await client.get("/api/v1/meal-calls/active/wait",
+                           params={"since": version, "timeout": 0.05})
+    assert res.status_code == 204
+    assert res.headers["x-meal-call-version"] == version
+
+
+async def test_create_retries_when_the_winning_call_closes_first(auth_client):
+    from src.meal_call.application.command_handlers import CreateMealCallHandler
+    from src.meal_call.application.commands import CreateMealCallCommand
+    from src.meal_call.infrastructure.family_member_directory import CachedFamilyMemberDirectory
+    from src.meal_call.infrastructure.sqlite_meal_call_repo import (
+        SqliteMealCallRepository, SqliteMenuItemRepository,
+    )
+    client, family_id = auth_client
+    owner = (await client.get(f"/api/v1/families/{family_id}")).json()["members"][0]
+
+    class LosingOnceRepository(SqliteMealCallRepository):
+        """첫 시도는 다른 호출에 지고, 그 호출은 조회 전에 이미 끝났다"""
+        attempts = 0
+
+        async def add_if_no_active(self, mc):
+            self.attempts += 1
+            if self.attempts == 1:
+                return "already-closed"
+            return await super().add_if_no_active(mc)
+
+    from src.meal_call.api.router import active_meal_call_projector
+    repo = LosingOnceRepository(active_meal_call_projector)
+    dto, created = await CreateMealCallHandler(
+        repo, SqliteMenuItemRepository(), CachedFamilyMemberDirectory(),
+    ).handle(CreateMealCallCommand(family_id=family_id, caller_id=owner["id"], caller_nickname="아빠"))
+
+    assert created and repo.attempts == 2
+    assert (await client.get("/api/v1/meal-calls/active")).json()["id"] == dto.id
@@ -0,0 +1,228 @@
+import asyncio
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from src.meal_call.domain.meal_call import MealCall
+from src.meal_call.domain.meal_response import ResponseType
+from src.meal_call.domain.menu_item import MenuItem
+from src.meal_call.domain.repository import ActiveMealCallRenderer
+from src.meal_call.infrastructure.sqlite_meal_call_repo import (
+    SqliteActiveMealCallViewRepository, SqliteMealCallRepository, SqliteMenuItemRepository,
+)
+from src.shared.api.error_handlers import ConcurrencyError
+from src.shared.infrastructure.database import write
+
+
+@pytest.fixture
+async def family():
+    family_id, member_ids = str(uuid.uuid4()), [str(uuid.uuid4()) for _ in range(3)]
+    now = datetime.now(timezone.utc).isoformat()
+
+    async def _insert(db):
+        await db.execute("INSERT INTO families (id, name, created_at) VALUES (?, ?, ?)",
+                         (family_id, "저장 테스트 가족", now))
+        await db.executemany(
+            "INSERT INTO members (id, family_id, nickname, hashed_pin, role, created_at) "
+            "VALUES (?, ?, ?, 'x', 'MEMBER', ?)",
+            [(mid, family_id, f"m{i}", now) for i, mid in enumerate(member_ids)],
+        )
+    await write(_insert)
+
+    menus = [MenuItem.create(family_id, name) for name in ("김치찌개", "된장찌개")]
+    for menu in menus:
+        await SqliteMenuItemRepository().save(menu)
+    return family_id, member_ids, menus
+
+
+def _writes(statements: list[str]) -> list[str]:
+    return [s for s in statements if s.lstrip().split()[0].upper() in ("INSERT", "UPDATE", "DELETE")]
+
+
+async def test_respond_writes_only_the_changed_response(family, traced_statements):
+    family_id, member_ids, menus = family
+    repo = SqliteMealCallRepository()
+    mc = MealCall.create(family_id, member_ids[0], "m0", member_ids, menus=menus)
+    await repo.save(mc)
+
+    loaded = await repo.find_by_id(mc.id)
+    loaded.respond(member_ids[1], ResponseType.COMING_NOW)
+    await repo.save(loaded)
+    traced_statements.clear()
+
+    again = await repo.find_by_id(mc.id)
+    again.respond(member_ids[1], ResponseType.NOT_EATING)
+    again.respond(member_ids[2], ResponseType.COMING_5MIN)
+    await repo.save(again)
+
+    writes = _writes(traced_statements)
+    assert len(writes) == 2 and all("meal_responses" in w for w in writes)
+    reloaded = await repo.find_by_id(mc.id)
+    assert {r.member_id: r.response_type for r in reloaded.responses} == {
+        member_ids[1]: ResponseType.NOT_EATING,
+        member_ids[2]: ResponseType.COMING_5MIN,
+    }
+    assert [m.id for m in reloaded.menus] == sorted(m.id for m in menus)
+
+
+async def test_complete_updates_only_the_meal_call_row(family, traced_statements):
+    family_id, member_ids, menus = family
+    repo = SqliteMealCallRepository()
+    mc = MealCall.create(family_id, member_ids[0], "m0", member_ids, menus=menus)
+    mc.respond(member_ids[0], ResponseType.COMING_NOW)
+    await repo.save(mc)
+    traced_statements.clear()
+
+    loaded = await repo.find_by_id(mc.id)
+    loaded.complete()
+    await repo.save(loaded)
+    await repo.save(loaded)  # 변경 없음 - 아무것도 쓰지 않는다
+
+    writes = _writes(traced_statements)
+    assert len(writes) == 1 and "meal_calls" in writes[0]
+    reloaded = await repo.find_by_id(mc.id)
+    assert not reloaded.is_active()
+    assert len(reloaded.responses) == 1 and len(reloaded.menus) == 2
+
+
+async def test_stale_save_raises_concurrency_error(family):
+    family_id, member_ids, menus = family
+    repo = SqliteMealCallRepository()
+    mc = MealCall.create(family_id, member_ids[0], "m0", member_ids, menus=menus)
+    await repo.save(mc)
+
+    first = await repo.find_by_id(mc.id)
+    stale = await repo.find_by_id(mc.id)
+    first.complete()
+    await repo.save(first)
+    assert first.version == 1
+
+    stale.cancel()
+    with pytest.raises(ConcurrencyError):
+        await repo.save(stale)
+    reloaded = await repo.find_by_id(mc.id)
+    assert reloaded.status == first.status and reloaded.version == 1
+
+
+async def test_recipients_are_fixed_at_creation(family, traced_statements):
+    family_id, member_ids, menus = family
+    repo = SqliteMealCallRepository()
+    mc = MealCall.create(family_id, member_ids[0], "m0", member_ids, menus=menus)
+    await repo.save(mc)
+
+    async def _join_later(db):
+        await db.execute(
+            "INSERT INTO members (id, family_id, nickname, hashed_pin, role, created_at) "
+            "VALUES (?, ?, '늦게 온 사람', 'x', 'MEMBER', ?)",
+            (str(uuid.uuid4()), family_id, datetime.now(timezone.utc).isoformat()),
+        )
+    await write(_join_later)
+    traced_statements.clear()
+
+    loaded = await repo.find_by_id(mc.id)
+    assert sorted(loaded.get_pending_member_ids()) == sorted(member_ids)
+    assert not any("FROM members" in s for s in traced_statements)
+
+
+async def test_view_is_rendered_outside_the_writer_and_written_with_the_call(family):
+    from src.meal_call.domain.meal_response import MealResponse
+    family_id, member_ids, menus = family
+    rendering, release = asyncio.Event(), asyncio.Event()
+
+    class SlowRenderer(ActiveMealCallRenderer):
+        async def render_call(self, meal_call: MealCall) -> bytes:
+            return b'{"responses":[],"pending_member_ids":[]}'
+
+        async def render_response(self, family_id: str, response: MealResponse) -> bytes:
+            rendering.set()
+            await release.wait()
+            return b"{}"
+
+    repo = SqliteMealCallRepository(SlowRenderer())
+    view = SqliteActiveMealCallViewRepository()
+    mc = MealCall.create(family_id, member_ids[0], "m0", member_ids, menus=menus)
+    assert await repo.add_if_no_active(mc) is None
+    assert await view.find_payload(family_id) is not None
+
+    respond = asyncio.create_task(repo.save_response_if_active(
+        family_id, MealResponse.create(mc.id, member_ids[1], ResponseType.COMING_NOW),
+    ))
+    await rendering.wait()
+    # 렌더링 중에도 다른 쓰기는 기다리지 않는다 - 그 사이 호출이 완료되고 읽기 모델도 지워진다
+    loaded = await repo.find_by_id(mc.id)
+    loaded.complete()
+    await asyncio.wait_for(repo.save(loaded), timeout=1)
+    assert await view.find_payload(family_id) is None
+
+    release.set()
+    written, _ = await respond
+    # 완료가 먼저 커밋됐으므로 응답도, 렌더링한 항목도 쓰지 않는다
+    assert not written and await view.find_payload(family_id) is None
+
+
+async def test_find_by_family_hydrates_each_call_with_its_own_rows(family, traced_statements):
+    family_id, member_ids, menus = family
+    extra = MenuItem.create(family_id, "제육볶음")
+    await SqliteMenuItemRepository().save(extra)
+    repo = SqliteMealCallRepository()
+
+    lunch = MealCall.create(family_id, member_ids[0], "m0", member_ids, menus=[menus[0]])
+    lunch.respond(member_ids[1], ResponseType.COMING_NOW)
+    lunch.complete()
+    dinner = MealCall.create(family_id, member_ids[1], "m1", member_ids[:2], menus=[menus[1], extra])
+    dinner.respond(member_ids[0], ResponseType.NOT_EATING)
+    dinner.respond(member_ids[1], ResponseType.CUSTOM, "늦어요")
+    dinner.complete()
+    snack = MealCall.create(family_id, member_ids[2], "m2", member_ids, menus=[menus[0], extra])
+    for mc in (lunch, dinner, snack):
+        await repo.save(mc)
+    traced_statements.clear()
+
+    loaded = {mc.id: mc for mc in await repo.find_by_family(family_id)}
+
+    # 호출 수와 상관없이 호출 / 메뉴 / 대상+응답 쿼리 3번
+    selects = [s for s in traced_statements if s.lstrip().upper().startswith("SELECT")]
+    assert len(selects) == 3
+    assert set(loaded) == {lunch.id, dinner.id, snack.id}
+    for expected in (lunch, dinner, snack):
+        got = loaded[expected.id]
+        assert sorted(m.id for m in got.menus) == sorted(m.id for m in expected.menus)
+        assert sorted(got.all_member_ids) == sorted(expected.all_member_ids)
+        assert {(r.member_id, r.response_type, r.custom_message) for r in got.responses} == {
+            (r.member_id, r.response_type, r.custom_message) for r in expected.responses
+        }
+    assert not loaded[snack.id].responses and loaded[snack.id].is_active()
+
+
+async def test_save_response_if_active_returns_the_response_set(family, traced_statements):
+    from src.meal_call.domain.meal_response import MealResponse
+    family_id, member_ids, menus = family
+    repo = SqliteMealCallRepository()
+    mc = MealCall.create(family_id, member_ids[0], "m0", member_ids, menus=menus)
+    mc.respond(member_ids[1], ResponseType.COMING_NOW)
+    await repo.save(mc)
+    traced_statements.clear()
+
+    written, responses = await repo.save_response_if_active(
+        family_id, MealResponse.create(mc.id, member_ids[2], ResponseType.NOT_EATING),
+    )
+    assert written
+    assert {(r.member_id, r.response_type) for r in responses} == {
+        (member_ids[1], ResponseType.COMING_NOW), (member_ids[2], ResponseType.NOT_EATING),
+    }
+    # 조건부 upsert 한 번 + 응답 목록 조회 한 번 (트랜잭션 제어문 제외)
+    statements = [s for s in traced_statements
+                  if s.lstrip().split()[0].upper() in ("INSERT", "SELECT", "UPDATE", "DELETE")]
+    assert len(statements) == 2
+
+    other = MealResponse.create(mc.id, member_ids[2], ResponseType.COMING_NOW)
+    assert await repo.save_response_if_active("other-family", other) is None
+    assert await repo.save_response_if_active(
+        family_id, MealResponse.create("unknown", member_ids[2], ResponseType.COMING_NOW),
+    ) is None
+
+    mc.complete()
+    await repo.save(mc)
+    written, responses = await repo.save_response_if_active(family_id, other)
+    assert not written and len(responses) == 2
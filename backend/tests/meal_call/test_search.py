@@ -0,0 +1,96 @@
+import pytest
+
+from src.meal_call.domain.menu_item import MenuItem
+from src.meal_call.domain.menu_search import MenuSearchIndex
+
+
+@pytest.fixture
+async def auth_client(client):
+    res = await client.post("/api/v1/families", json={
+        "family_name": "검색 가족", "owner_nickname": "아빠", "owner_pin": "1234",
+    })
+    client.headers.update({"Authorization": f"Bearer {res.json()['access_token']}"})
+    return client
+
+
+def test_menu_search_index_matches_choseong_and_partial_syllables():
+    names = ["갈비찜", "김치볶음밥", "김치찌개", "닭갈비", "된장찌개"]
+    index = MenuSearchIndex(tuple(MenuItem.create("f", n) for n in names))
+
+    def search(q):
+        return [m.name for m in index.search(q)]
+
+    assert search("ㄱㅊ") == ["김치볶음밥", "김치찌개"]
+    assert search("ㅉㄱ") == ["김치찌개", "된장찌개"]      # 중간 일치도 포함
+    assert search("김ㅊ") == ["김치볶음밥", "김치찌개"]     # 입력 중인 글자
+    assert search("달") == ["닭갈비"]                     # 겹받침 입력 중
+    assert search("갈비") == ["갈비찜", "닭갈비"]          # 앞에서 일치하는 메뉴 우선
+    assert search("김치 찌개") == ["김치찌개"]
+    assert search("피자") == []
+
+
+async def test_search_menus_messages_and_responses(auth_client, traced_statements):
+    client = auth_client
+    for name in ("김치찌개", "된장찌개", "제육볶음"):
+        await client.post("/api/v1/menus", json={"name": name})
+    mc = await client.post("/api/v1/meal-calls", json={"message": "오늘은 김치찌개 끓였어"})
+    meal_call_id = mc.json()["id"]
+    await client.post(f"/api/v1/meal-calls/{meal_call_id}/respond", json={
+        "response_type": "CUSTOM", "custom_message": "김치찌개 좋아요",
+    })
+
+    res = await client.get("/api/v1/search", params={"q": "김치찌개"})
+    assert res.status_code == 200
+    assert sorted(h["kind"] for h in res.json()) == ["MEAL_CALL", "MENU", "RESPONSE"]
+    assert all(h["meal_call_id"] == meal_call_id for h in res.json() if h["kind"] != "MENU")
+
+    # 3글자 미만은 부분 일치로
+    res = await client.get("/api/v1/search", params={"q": "찌개"})
+    assert len(res.json()) == 4
+
+    # 응답을 바꾸면 이전 메시지는 더 이상 검색되지 않는다
+    await client.post(f"/api/v1/meal-calls/{meal_call_id}/respond", json={
+        "response_type": "CUSTOM", "custom_message": "배불러요",
+    })
+    res = await client.get("/api/v1/search", params={"q": "좋아요"})
+    assert res.json() == []
+    res = await client.get("/api/v1/search", params={"q": "배불러요"})
+    assert [h["kind"] for h in res.json()] == ["RESPONSE"]
+
+    other = await client.post("/api/v1/families", json={
+        "family_name": "다른 가족", "owner_nickname": "이웃", "owner_pin": "1234",
+    })
+    res = await client.get("/api/v1/search", params={"q": "김치찌개"},
+                           headers={"Authorization": f"Bearer {other.json()['access_token']}"})
+    assert res.json() == []
+
+    # 입력 중 메뉴 검색은 인덱스가 만들어진 뒤 DB를 읽지 않는다
+    await client.get("/api/v1/menus/search", params={"q": "ㅈ"})
+    traced_statements.clear()
+    res = await client.get("/api/v1/menus/search", params={"q": "ㅉㄱ"})
+    assert [m["name"] for m in res.json()] == ["김치찌개", "된장찌개"]
+    assert traced_statements == []
+
+    await client.post("/api/v1/menus", json={"name": "부대찌개"})
+    res = await client.get("/api/v1/menus/search", params={"q": "ㅉㄱ"})
+    assert [m["name"] for m in res.json()] == ["김치찌개", "된장찌개", "부대찌개"]
+
+
+async def test_search_survives_rowid_renumbering(auth_client):
+    from src.shared.infrastructure.database import write
+
+    client = auth_client
+    for name in ("김치찌개", "된장찌개"):
+        await client.post("/api/v1/menus", json={"name": name})
+
+    async def swap_rowids(db) -> None:
+        # VACUUM이 TEXT PK 테이블의 암묵적 rowid를 다시 매기는 상황을 흉내낸다
+        rows = await db.execute_fetchall("SELECT rowid, name FROM menu_items ORDER BY rowid")
+        (a, _), (b, _) = rows
+        await db.execute("UPDATE menu_items SET rowid = -1 WHERE rowid = ?", (a,))
+        await db.execute("UPDATE menu_items SET rowid = ? WHERE rowid = ?", (a, b))
+        await db.execute("UPDATE menu_items SET rowid = ? WHERE rowid = -1", (b,))
+
+    await write(swap_rowids)
+    res = await client.get("/api/v1/search", params={"q": "김치찌개"})
+    assert [h["text"] for h in res.json()] == ["김치찌개"]
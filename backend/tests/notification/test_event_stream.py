@@ -0,0 +1,83 @@
+import asyncio
+
+from httpx import AsyncClient
+
+from src.notification.infrastructure.event_stream import FamilyEventBroker, family_event_broker
+
+
+async def _next(stream) -> bytes:
+    return await asyncio.wait_for(stream.__anext__(), 1)
+
+
+async def test_stream_delivers_events_and_heartbeats():
+    broker = FamilyEventBroker(heartbeat=0.01)
+    stream = broker.stream("family")
+    assert (await _next(stream)).startswith(b"retry:")
+
+    assert await _next(stream) == b": heartbeat\n\n"
+    event = broker.publish("family", "MealCallCreated", '{"a": 1}')
+    broker.publish("other", "MealCallCreated", "{}")
+    assert await _next(stream) == f"id: {event.id}\nevent: MealCallCreated\ndata: {{\"a\": 1}}\n\n".encode()
+    await stream.aclose()
+    assert broker.stats().subscribers == 0
+
+
+async def test_resume_from_last_event_id():
+    broker = FamilyEventBroker(replay_buffer_size=3)
+    seen = broker.publish("family", "A", "{}")
+    broker.publish("family", "B", "{}")
+    broker.publish("other", "X", "{}")
+    broker.publish("family", "C", "{}")
+
+    stream = broker.stream("family", last_event_id=seen.id)
+    await _next(stream)  # retry
+    assert b"event: B" in await _next(stream)
+    assert b"event: C" in await _next(stream)
+    await stream.aclose()
+
+    # 버퍼에서 밀려난 이벤트 이후부터는 이어받을 수 없다 / 이전 프로세스의 id
+    broker.publish("family", "D", "{}")
+    broker.publish("family", "E", "{}")
+    for last_event_id in (seen.id, "oldboot-1"):
+        stream = broker.stream("family", last_event_id=last_event_id)
+        await _next(stream)
+        assert (await _next(stream)).startswith(b"event: reset")
+        await stream.aclose()
+
+
+async def test_slow_consumer_is_dropped():
+    broker = FamilyEventBroker(client_queue_size=2)
+    slow = broker.stream("family")
+    await _next(slow)  # 구독 시작 후 읽지 않음
+
+    for i in range(3):
+        broker.publish("family", "MealResponseReceived", str(i))
+
+    stats = broker.stats()
+    assert stats.dropped == 1 and stats.subscribers == 0
+    # 이미 받은 이벤트 없이 스트림이 끝난다
+    assert [chunk async for chunk in slow] == []
+
+
+async def test_meal_call_events_reach_family_stream(client: AsyncClient):
+    res = await client.post("/api/v1/families", json={
+        "family_name": "실시간 가족", "owner_nickname": "아빠", "owner_pin": "1234",
+    })
+    family_id = res.json()["member"]["family_id"]
+    client.headers.update({"Authorization": f"Bearer {res.json()['access_token']}"})
+
+    stream = family_event_broker.stream(family_id)
+    await _next(stream)
+    mc = await client.post("/api/v1/meal-calls", json={"message": "밥 먹자!"})
+    await client.post(f"/api/v1/meal-calls/{mc.json()['id']}/respond", json={
+        "response_type": "COMING_NOW",
+    })
+    await client.put(f"/api/v1/meal-calls/{mc.json()['id']}/complete")
+
+    names = [(await _next(stream)).split(b"\n")[1] for _ in range(3)]
+    assert names == [b"event: MealCallCreated", b"event: MealResponseReceived",
+                     b"event: MealCallCompleted"]
+    await stream.aclose()
+
+    other = await client.get("/api/v1/families/other-family/events")
+    assert other.status_code == 404
@@ -0,0 +1,65 @@
+import jwt as pyjwt
+
+from src.shared.api import dependencies
+from src.shared.api.dependencies import CurrentUser, VerifiedTokenCache
+from src.shared.infrastructure.cache import cache_stats
+
+
+class FakeClock:
+    def __init__(self, now: float):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_entries_expire_with_the_token():
+    clock = FakeClock(1_000.0)
+    cache = VerifiedTokenCache(max_size=10, max_ttl=600, clock=clock)
+    user = CurrentUser("m", "f", "아빠", "OWNER")
+
+    cache.put("short", user, expires_at=1_030.0)     # 30초 뒤 만료되는 토큰
+    cache.put("long", user, expires_at=100_000.0)    # max_ttl로 제한
+    cache.put("expired", user, expires_at=999.0)     # 이미 만료 - 넣지 않는다
+    assert cache.get("short") is user and cache.get("expired") is None
+
+    clock.now = 1_030.0
+    assert cache.get("short") is None and cache.get("long") is user
+    clock.now = 1_600.0
+    assert cache.get("long") is None
+
+    cache.put("revoked", user, expires_at=1_700.0)
+    cache.invalidate("revoked")
+    assert cache.get("revoked") is None
+
+
+async def test_repeated_requests_skip_signature_verification(client, monkeypatch):
+    res = await client.post("/api/v1/families", json={
+        "family_name": "토큰 캐시 가족", "owner_nickname": "아빠", "owner_pin": "1234",
+    })
+    token = res.json()["access_token"]
+    family_id = res.json()["member"]["family_id"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    decodes = 0
+    decode = pyjwt.decode
+
+    def counting_decode(*args, **kwargs):
+        nonlocal decodes
+        decodes += 1
+        return decode(*args, **kwargs)
+
+    monkeypatch.setattr(dependencies.jwt, "decode", counting_decode)
+    for _ in range(3):
+        assert (await client.get(f"/api/v1/families/{family_id}", headers=headers)).status_code == 200
+    assert decodes == 1
+    assert cache_stats()["verified_token"]["hit_rate"] > 0
+
+    # 폐기 훅 - 다음 요청은 다시 검증한다
+    dependencies.verified_tokens.invalidate(token)
+    assert (await client.get(f"/api/v1/families/{family_id}", headers=headers)).status_code == 200
+    assert decodes == 2
+
+    res = await client.get(f"/api/v1/families/{family_id}",
+                           headers={"Authorization": f"Bearer {token[:-2]}xx"})
+    assert res.status_code == 401
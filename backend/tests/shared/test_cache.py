@@ -0,0 +1,61 @@
+import asyncio
+
+from src.shared.infrastructure.cache import LruTtlCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_evicts_least_recently_used():
+    cache = LruTtlCache("test_lru", max_size=2, ttl=60)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # a를 최근 사용으로
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    stats = cache.stats()
+    assert (stats.size, stats.evictions, stats.hits, stats.misses) == (2, 1, 3, 1)
+
+
+async def test_expires_after_ttl_and_caches_none():
+    clock = FakeClock()
+    cache = LruTtlCache("test_ttl", max_size=10, ttl=5, clock=clock)
+    loads = 0
+
+    async def load():
+        nonlocal loads
+        loads += 1
+        return None
+
+    assert await cache.get_or_load("family", load) is None
+    assert await cache.get_or_load("family", load) is None
+    assert loads == 1
+
+    clock.now = 5
+    assert await cache.get_or_load("family", load) is None
+    assert loads == 2 and cache.stats().expirations == 1
+
+
+async def test_load_racing_with_invalidate_is_not_cached():
+    cache = LruTtlCache("test_race", max_size=10, ttl=60)
+    started, release = asyncio.Event(), asyncio.Event()
+
+    async def slow_load():
+        started.set()
+        await release.wait()
+        return "stale"
+
+    task = asyncio.create_task(cache.get_or_load("k", slow_load))
+    await started.wait()
+    cache.invalidate("k")  # 로딩 도중 이벤트로 무효화
+    release.set()
+
+    assert await task == "stale"
+    assert cache.get("k") is None
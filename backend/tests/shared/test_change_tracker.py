@@ -0,0 +1,31 @@
+import asyncio
+
+from src.shared.infrastructure.change_tracker import ChangeTracker
+
+
+async def test_stale_version_returns_immediately():
+    tracker = ChangeTracker()
+    tracker.bump("family")
+    assert await tracker.wait_for_change("family", 0, timeout=10) == 1
+
+
+async def test_waiters_share_one_signal_and_wake_on_bump():
+    tracker = ChangeTracker()
+    waiters = [asyncio.create_task(tracker.wait_for_change("family", 0, timeout=10))
+               for _ in range(1000)]
+    await asyncio.sleep(0)
+    assert tracker.waiting() == 1000 and len(tracker._signals) == 1
+
+    tracker.bump("other")
+    await asyncio.sleep(0)
+    assert not any(w.done() for w in waiters)
+
+    tracker.bump("family")
+    assert await asyncio.gather(*waiters) == [1] * 1000
+    assert tracker.waiting() == 0 and tracker._signals == {}
+
+
+async def test_timeout_returns_same_version_and_cleans_up():
+    tracker = ChangeTracker()
+    assert await tracker.wait_for_change("family", 0, timeout=0.01) == 0
+    assert tracker._signals == {}
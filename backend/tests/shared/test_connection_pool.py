@@ -0,0 +1,71 @@
+import asyncio
+import pytest
+import aiosqlite
+
+from src.shared.infrastructure.connection_pool import ConnectionPool, PoolTimeoutError
+
+
+@pytest.fixture
+async def pool(tmp_path):
+    db_path = str(tmp_path / "pool.db")
+
+    async def connect():
+        return await aiosqlite.connect(db_path)
+
+    p = ConnectionPool(connect, size=2, acquire_timeout=0.1, health_check_interval=0)
+    await p.open()
+    yield p
+    await p.close()
+
+
+async def test_connections_are_reused(pool: ConnectionPool):
+    for _ in range(10):
+        async with pool.acquire() as db:
+            await db.execute("SELECT 1")
+
+    stats = pool.stats()
+    assert stats.created == 2
+    assert stats.acquired_total == 10
+    assert stats.idle == 2 and stats.in_use == 0
+
+
+async def test_acquire_timeout(pool: ConnectionPool):
+    async with pool.acquire(), pool.acquire():
+        with pytest.raises(PoolTimeoutError):
+            async with pool.acquire():
+                pass
+    assert pool.stats().timeouts == 1
+
+
+async def test_waiter_gets_released_connection(pool: ConnectionPool):
+    async with pool.acquire():
+        async with pool.acquire() as second:
+            waiter = asyncio.create_task(pool._checkout())
+            await asyncio.sleep(0)
+            assert pool.stats().waiting == 1
+        conn = await waiter
+        assert conn is second
+        await pool._checkin(conn)
+
+
+async def test_uncommitted_work_is_rolled_back_on_release(pool: ConnectionPool):
+    async with pool.acquire() as db:
+        await db.execute("CREATE TABLE t (x INTEGER)")
+        await db.commit()
+        await db.execute("INSERT INTO t VALUES (1)")
+        assert db.in_transaction
+
+    async with pool.acquire() as db:
+        rows = await db.execute_fetchall("SELECT COUNT(*) FROM t")
+        assert rows[0][0] == 0
+
+
+async def test_broken_connection_is_replaced(pool: ConnectionPool):
+    async with pool.acquire() as db:
+        broken = db
+    await broken.close()
+
+    async with pool.acquire() as db:
+        assert db is not broken
+        await db.execute("SELECT 1")
+    assert pool.stats().recycled == 1
@@ -0,0 +1,45 @@
+from src.shared.infrastructure import database
+from src.shared.infrastructure.migrations import LATEST_VERSION, migrate
+
+
+async def test_migrate_is_noop_when_schema_is_current():
+    db = await database._connect()
+    try:
+        rows = await db.execute_fetchall("PRAGMA user_version")
+        assert rows[0][0] == LATEST_VERSION
+        statements: list[str] = []
+        await db.set_trace_callback(statements.append)
+        assert await migrate(db) == LATEST_VERSION
+        assert statements == ["PRAGMA user_version"]
+    finally:
+        await db.close()
+
+
+async def test_v3_keeps_only_latest_active_meal_call():
+    db = await database._connect()
+    try:
+        # v2 시점 DB 재현: 부분 유니크 인덱스 없이 ACTIVE 중복
+        await db.execute("DROP INDEX uq_meal_calls_active_family")
+        await db.execute("ALTER TABLE meal_calls DROP COLUMN version")
+        await db.execute("ALTER TABLE families DROP COLUMN version")
+        await db.execute("DROP TABLE meal_call_recipients")
+        await db.execute("INSERT INTO families (id, name, created_at) VALUES ('f', 'f', '2026-01-01')")
+        await db.execute("INSERT INTO members (id, family_id, nickname, hashed_pin, created_at) "
+                         "VALUES ('m', 'f', 'm', 'x', '2026-01-01')")
+        await db.executemany(
+            "INSERT INTO meal_calls (id, family_id, caller_id, status, created_at) "
+            "VALUES (?, 'f', 'm', 'ACTIVE', ?)",
+            [("old", "2026-01-01T12:00:00"), ("new", "2026-01-01T18:00:00")],
+        )
+        await db.execute("PRAGMA user_version = 2")
+        await db.commit()
+
+        assert await migrate(db) == LATEST_VERSION
+
+        rows = await db.execute_fetchall("SELECT id, status FROM meal_calls ORDER BY id")
+        assert [tuple(r) for r in rows] == [("new", "ACTIVE"), ("old", "COMPLETED")]
+        # v6: 기존 호출의 대상 구성원 백필
+        rows = await db.execute_fetchall("SELECT meal_call_id, member_id FROM meal_call_recipients ORDER BY 1")
+        assert [tuple(r) for r in rows] == [("new", "m"), ("old", "m")]
+    finally:
+        await db.close()
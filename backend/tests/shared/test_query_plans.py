@@ -0,0 +1,80 @@
+import re
+from datetime import datetime, timedelta, timezone
+
+from httpx import AsyncClient, ASGITransport
+
+from src.main import app
+from src.shared.infrastructure import database
+from src.meal_call.infrastructure.sqlite_meal_call_repo import SqliteMealCallRepository
+from src.notification.domain.device_registration import DeviceRegistration
+from src.notification.infrastructure.sqlite_device_repo import SqliteDeviceRepository
+
+_SKIP = re.compile(r"^\s*(PRAGMA|BEGIN|COMMIT|ROLLBACK|SAVEPOINT|RELEASE|CREATE|SELECT 1\b)", re.I)
+_FULL_SCAN = re.compile(r"^SCAN (?!CONSTANT ROW)(?!\(subquery)(?!.*VIRTUAL TABLE)")
+
+
+async def _exercise_repositories() -> None:
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        res = await client.post("/api/v1/families", json={
+            "family_name": "플랜 가족", "owner_nickname": "아빠", "owner_pin": "1234",
+        })
+        owner = res.json()
+        family_id = owner["member"]["family_id"]
+        client.headers.update({"Authorization": f"Bearer {owner['access_token']}"})
+
+        expires_at = (datetime.now(timezone.utc) + timedelta(hours=1)).isoformat()
+        res = await client.post(f"/api/v1/families/{family_id}/invite-links",
+                                json={"expires_at": expires_at, "max_uses": 2})
+        invite = res.json()["token"]
+        await client.get(f"/api/v1/invite/{invite}")
+        await client.post(f"/api/v1/invite/{invite}/join", json={"nickname": "엄마", "pin": "5678"})
+        await client.post("/api/v1/auth/login", json={
+            "family_id": family_id, "nickname": "아빠", "pin": "1234",
+        })
+        await client.post("/api/v1/auth/refresh", json={"refresh_token": owner["refresh_token"]})
+        await client.get(f"/api/v1/families/{family_id}")
+
+        res = await client.post("/api/v1/menus", json={"name": "김치찌개"})
+        menu_id = res.json()["id"]
+        await client.get("/api/v1/menus")
+        await client.get("/api/v1/menus/search", params={"q": "ㄱㅊ"})
+        res = await client.post("/api/v1/meal-calls", json={"menu_item_ids": [menu_id]})
+        meal_call_id = res.json()["id"]
+        await client.get("/api/v1/meal-calls/active")
+        await client.get(f"/api/v1/meal-calls/{meal_call_id}")
+        await client.post(f"/api/v1/meal-calls/{meal_call_id}/respond",
+                          json={"response_type": "COMING_NOW"})
+        await client.post(f"/api/v1/meal-calls/{meal_call_id}/remind")
+        await client.put(f"/api/v1/meal-calls/{meal_call_id}/complete")
+        await client.get("/api/v1/search", params={"q": "김치찌개"})
+        await client.get("/api/v1/search", params={"q": "김치"})
+        await client.post("/api/v1/devices", json={"expo_push_token": "ExponentPushToken[x]"})
+        await client.delete("/api/v1/devices")
+
+    # 이벤트 핸들러(lifespan 등록)에서만 쓰이는 조회
+    devices = SqliteDeviceRepository()
+    member_id = owner["member"]["id"]
+    await devices.save(DeviceRegistration.create(member_id, "ExponentPushToken[y]"))
+    await devices.find_by_member(member_id)
+    await devices.find_by_family(family_id)
+    await devices.find_by_member_ids([member_id])
+    # API에서 쓰지 않는 리포지토리 조회
+    await SqliteMealCallRepository().find_by_family(family_id)
+
+
+async def test_repository_queries_use_indexes(traced_statements: list[str]):
+    await _exercise_repositories()
+
+    queries = {s.strip() for s in traced_statements if not _SKIP.match(s)}
+    assert any(q.startswith("SELECT") for q in queries)
+
+    problems = []
+    async with database.read_connection() as db:
+        for sql in sorted(queries):
+            params = (None,) * sql.count("?")
+            plan = await db.execute_fetchall(f"EXPLAIN QUERY PLAN {sql}", params)
+            for row in plan:
+                detail = row["detail"]
+                if _FULL_SCAN.match(detail) or "TEMP B-TREE" in detail:
+                    problems.append(f"{detail}  <-  {' '.join(sql.split())}")
+    assert not problems, "\n".join(problems)
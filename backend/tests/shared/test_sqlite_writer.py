@@ -0,0 +1,96 @@
+import asyncio
+import sqlite3
+import pytest
+
+from src.shared.infrastructure import database
+from src.shared.infrastructure.sqlite_writer import SqliteWriter
+
+
+async def _create_table(db):
+    await db.execute("CREATE TABLE IF NOT EXISTS counter (id INTEGER PRIMARY KEY, n INTEGER)")
+    await db.execute("INSERT OR IGNORE INTO counter (id, n) VALUES (1, 0)")
+
+
+async def _increment(db):
+    rows = await db.execute_fetchall("SELECT n FROM counter WHERE id = 1")
+    await asyncio.sleep(0)  # 다른 작업이 끼어들 기회를 준다
+    await db.execute("UPDATE counter SET n = ? WHERE id = 1", (rows[0][0] + 1,))
+    return rows[0][0] + 1
+
+
+async def test_concurrent_writes_are_serialized():
+    await database.write(_create_table)
+
+    results = await asyncio.gather(*(database.write_returning(_increment) for _ in range(50)))
+
+    assert sorted(results) == list(range(1, 51))
+    async with database.read_connection() as db:
+        rows = await db.execute_fetchall("SELECT n FROM counter WHERE id = 1")
+    assert rows[0][0] == 50
+
+
+async def test_failed_write_is_rolled_back_and_isolated():
+    await database.write(_create_table)
+
+    async def _fail(db):
+        await db.execute("UPDATE counter SET n = 100 WHERE id = 1")
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        database.write_returning(_increment),
+        database.write_returning(_fail),
+        database.write_returning(_increment),
+        return_exceptions=True,
+    )
+
+    assert results[0] == 1 and results[2] == 2
+    assert isinstance(results[1], ValueError)
+    async with database.read_connection() as db:
+        rows = await db.execute_fetchall("SELECT n FROM counter WHERE id = 1")
+    assert rows[0][0] == 2
+    assert database.db_stats()["writer"]["failed"] == 1
+
+
+async def test_read_connections_are_query_only():
+    await database.write(_create_table)
+
+    async with database.read_connection() as db:
+        with pytest.raises(sqlite3.OperationalError):
+            await db.execute("UPDATE counter SET n = 1 WHERE id = 1")
+
+
+@pytest.fixture
+async def group_writer():
+    writer = SqliteWriter(database._connect, group_commit_window=0.01)
+    await writer.open()
+    yield writer
+    await writer.close()
+
+
+async def test_group_commit_merges_burst_into_one_transaction(group_writer: SqliteWriter):
+    await group_writer.write(_create_table)
+    commits_before = group_writer.stats().commits
+
+    results = await asyncio.gather(*(group_writer.write(_increment) for _ in range(20)))
+
+    assert sorted(results) == list(range(1, 21))
+    assert group_writer.stats().commits - commits_before == 1
+
+
+async def test_group_commit_isolates_failed_job(group_writer: SqliteWriter):
+    await group_writer.write(_create_table)
+
+    async def _fail(db):
+        await db.execute("UPDATE counter SET n = 100 WHERE id = 1")
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        group_writer.write(_increment), group_writer.write(_fail), group_writer.write(_increment),
+        return_exceptions=True,
+    )
+
+    assert results[0] == 1 and results[2] == 2
+    assert isinstance(results[1], ValueError)
+    async with database.read_connection() as db:
+        rows = await db.execute_fetchall("SELECT n FROM counter WHERE id = 1")
+    assert rows[0][0] == 2
@@ -0,0 +1,67 @@
+from src.shared.infrastructure.database import read_connection
+from src.shared.infrastructure.token_revocation import BloomFilter, TokenRevocationList, revoked_tokens
+
+
+class FakeClock:
+    def __init__(self, now: float):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    added = [f"jti-{i}" for i in range(1000)]
+    for key in added:
+        bloom.add(key)
+
+    assert all(key in bloom for key in added)
+    false_positives = sum(f"other-{i}" in bloom for i in range(10_000))
+    assert false_positives < 300  # 목표 1% - 여유를 두고 3%
+
+
+async def test_compaction_drops_expired_entries():
+    clock = FakeClock(1_000.0)
+    revocations = TokenRevocationList(initial_capacity=2, clock=clock)
+    await revocations.revoke("short", expires_at=1_100)
+    await revocations.revoke("long", expires_at=9_000)
+    await revocations.revoke("expired", expires_at=900)   # 이미 만료 - 기록하지 않는다
+    await revocations.revoke("extra", expires_at=9_000)   # 용량 초과 - 필터를 다시 만든다
+    assert revocations.is_revoked("short") and not revocations.is_revoked("expired")
+    assert revocations.stats().filter_capacity >= 4
+
+    clock.now = 2_000.0
+    assert await revocations.compact() == 1
+    assert not revocations.is_revoked("short") and revocations.is_revoked("long")
+    async with read_connection() as db:
+        rows = await db.execute_fetchall("SELECT jti FROM revoked_tokens ORDER BY jti")
+    assert [r["jti"] for r in rows] == ["extra", "long"]
+
+
+async def test_logout_revokes_tokens_without_db_reads(client, traced_statements):
+    res = await client.post("/api/v1/families", json={
+        "family_name": "로그아웃 가족", "owner_nickname": "아빠", "owner_pin": "1234",
+    })
+    tokens = res.json()
+    family_id = tokens["member"]["family_id"]
+    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+    assert (await client.get(f"/api/v1/families/{family_id}", headers=headers)).status_code == 200
+
+    res = await client.post("/api/v1/auth/logout", headers=headers,
+                            json={"refresh_token": tokens["refresh_token"]})
+    assert res.status_code == 204
+
+    traced_statements.clear()
+    res = await client.get(f"/api/v1/families/{family_id}", headers=headers)
+    assert res.status_code == 401
+    assert traced_statements == []  # 폐기 확인은 메모리에서 끝난다
+
+    res = await client.post("/api/v1/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert res.status_code == 400 and res.json()["error"] == "TOKEN_REVOKED"
+
+    # 재시작해도 테이블에서 다시 읽는다
+    await revoked_tokens.load()
+    assert revoked_tokens.stats().revoked == 2
+    res = await client.get(f"/api/v1/families/{family_id}", headers=headers)
+    assert res.status_code == 401
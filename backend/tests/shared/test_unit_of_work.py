@@ -0,0 +1,125 @@
+from dataclasses import dataclass
+
+import pytest
+
+from src.shared.domain.aggregate_root import AggregateRoot
+from src.shared.domain.domain_event import DomainEvent
+from src.shared.infrastructure import database
+from src.shared.infrastructure.event_bus import event_bus
+from src.shared.infrastructure.unit_of_work import UnitOfWork, after_commit
+
+
+@dataclass(frozen=True)
+class _Touched(DomainEvent):
+    value: int = 0
+
+
+class _Aggregate(AggregateRoot):
+    def touch(self, value: int) -> None:
+        self._add_event(_Touched(value=value))
+
+
+@pytest.fixture
+async def table():
+    async def _create(db):
+        await db.execute("CREATE TABLE IF NOT EXISTS uow_t (x INTEGER)")
+    await database.write(_create)
+
+
+@pytest.fixture
+def published(monkeypatch):
+    events: list[DomainEvent] = []
+
+    async def _record(event):
+        # 이벤트 발행 시점에 이미 커밋되어 있어야 한다
+        async with database.read_connection() as db:
+            rows = await db.execute_fetchall("SELECT COUNT(*) FROM uow_t")
+        events.append((event, rows[0][0]))
+
+    monkeypatch.setattr(event_bus, "_handlers", {"_Touched": [_record]})
+    return events
+
+
+def _insert(x: int):
+    async def _fn(db):
+        await db.execute("INSERT INTO uow_t (x) VALUES (?)", (x,))
+    return _fn
+
+
+async def test_writes_share_one_commit_and_events_follow_it(table, published):
+    commits_before = database.db_stats()["writer"]["commits"]
+    agg = _Aggregate()
+
+    async with UnitOfWork() as uow:
+        await database.write(_insert(1))
+        await database.write(_insert(2))
+        agg.touch(1)
+        uow.collect(agg)
+        assert published == []
+
+    assert database.db_stats()["writer"]["commits"] - commits_before == 1
+    assert [(e.value, count) for e, count in published] == [(1, 2)]
+
+
+async def test_exception_discards_writes_and_events(table, published):
+    agg = _Aggregate()
+
+    with pytest.raises(ValueError):
+        async with UnitOfWork() as uow:
+            await database.write(_insert(1))
+            agg.touch(1)
+            uow.collect(agg)
+            raise ValueError("boom")
+
+    async with database.read_connection() as db:
+        rows = await db.execute_fetchall("SELECT COUNT(*) FROM uow_t")
+    assert rows[0][0] == 0
+    assert published == []
+
+
+async def test_failed_commit_rolls_back_every_write(table, published):
+    async def _fail(db):
+        raise RuntimeError("disk full")
+
+    with pytest.raises(RuntimeError):
+        async with UnitOfWork() as uow:
+            await database.write(_insert(1))
+            await database.write(_fail)
+            uow.add_events([_Touched(value=1)])
+
+    async with database.read_connection() as db:
+        rows = await db.execute_fetchall("SELECT COUNT(*) FROM uow_t")
+    assert rows[0][0] == 0
+    assert published == []
+
+
+async def test_result_returning_write_is_rejected_inside_a_unit_of_work(table):
+    async def _count(db):
+        rows = await db.execute_fetchall("SELECT COUNT(*) FROM uow_t")
+        return rows[0][0]
+
+    with pytest.raises(RuntimeError):
+        async with UnitOfWork():
+            await database.write(_insert(1))
+            await database.write_returning(_count)
+
+    assert await database.write_returning(_count) == 0
+
+
+async def test_after_commit_runs_only_once_the_commit_succeeds(table):
+    applied: list[str] = []
+
+    async with UnitOfWork():
+        await database.write(_insert(1))
+        after_commit(lambda: applied.append("ok"))
+        assert applied == []
+    assert applied == ["ok"]
+
+    async def _fail(db):
+        raise RuntimeError("disk full")
+
+    with pytest.raises(RuntimeError):
+        async with UnitOfWork():
+            await database.write(_fail)
+            after_commit(lambda: applied.append("failed"))
+    assert applied == ["ok"]
@@ -29,4 +29,8 @@ export const authApi = {
     });
     return data;
   },
+
+  async logout(refreshToken: string | null): Promise<void> {
+    await apiClient.post(endpoints.logout, { refresh_token: refreshToken });
+  },
 };
@@ -27,7 +27,7 @@ const initialState: AuthState = {
   isLoading: true,
 };
 
-export const useAuthStore = create<AuthState & AuthActions>((set) => ({
+export const useAuthStore = create<AuthState & AuthActions>((set, get) => ({
   ...initialState,
 
   login: async (params) => {
@@ -64,6 +64,8 @@ export const useAuthStore = create<AuthState & AuthActions>((set) => ({
   },
 
   logout: async () => {
+    // 서버에서 토큰을 폐기 - 실패해도(오프라인 등) 로컬 로그아웃은 진행
+    await authApi.logout(get().refreshToken).catch(() => undefined);
     await secureStorage.clearAll();
     set({ ...initialState, isLoading: false });
   },
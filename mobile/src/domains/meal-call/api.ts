@@ -1,6 +1,6 @@
 import { apiClient } from '@/lib/api/client';
 import { endpoints } from '@/lib/api/endpoints';
-import type { MealCall, MenuItem, ResponseType } from './types';
+import type { MealCall, MealCallResponses, MenuItem, ResponseType } from './types';
 
 export const mealCallApi = {
   async getActive(): Promise<MealCall | null> {
@@ -18,8 +18,8 @@ export const mealCallApi = {
     return data;
   },
 
-  async respond(id: string, params: { response_type: ResponseType; custom_message?: string }): Promise<MealCall> {
-    const { data } = await apiClient.post<MealCall>(endpoints.respondMealCall(id), params);
+  async respond(id: string, params: { response_type: ResponseType; custom_message?: string }): Promise<MealCallResponses> {
+    const { data } = await apiClient.post<MealCallResponses>(endpoints.respondMealCall(id), params);
     return data;
   },
 
@@ -52,13 +52,22 @@ export const useMealCallStore = create<MealCallState & MealCallActions>((set, ge
   },
 
   respond: async (id, responseType, customMessage) => {
-    const mc = await mealCallApi.respond(id, {
+    const { responses } = await mealCallApi.respond(id, {
       response_type: responseType,
       custom_message: customMessage,
     });
-    // 활성 밥먹자가 같은 id면 상태 업데이트
-    if (get().activeMealCall?.id === id) {
-      set({ activeMealCall: mc });
+    // 활성 밥먹자가 같은 id면 응답 목록만 바꾸고, 대상 구성원은 그대로 두고 미응답자를 다시 계산
+    const active = get().activeMealCall;
+    if (active?.id === id) {
+      const recipients = [...active.responses.map((r) => r.member_id), ...active.pending_member_ids];
+      const responded = new Set(responses.map((r) => r.member_id));
+      set({
+        activeMealCall: {
+          ...active,
+          responses,
+          pending_member_ids: recipients.filter((m) => !responded.has(m)),
+        },
+      });
     }
   },
 
@@ -17,6 +17,11 @@ export interface MealResponse {
   responded_at: string;
 }
 
+export interface MealCallResponses {
+  meal_call_id: string;
+  responses: MealResponse[];
+}
+
 export type MealCallStatus = 'ACTIVE' | 'COMPLETED' | 'CANCELLED';
 
 export interface MealCall {
@@ -11,6 +11,7 @@ export const endpoints = {
   joinFamily: (token: string) => `/api/v1/invite/${token}/join`,
   login: '/api/v1/auth/login',
   refreshToken: '/api/v1/auth/refresh',
+  logout: '/api/v1/auth/logout',
 
   // Meal Call
   menus: '/api/v1/menus',